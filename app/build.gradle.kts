@@ -176,6 +176,11 @@ android {
     }
 }
 
+ksp {
+    // Room のスキーマJSONを app/schemas に出力（tools/prebuilt_db.py が初期DBと照合する）
+    arg("room.schemaLocation", "$projectDir/schemas")
+}
+
 dependencies {
     // Core Android
     implementation("androidx.core:core-ktx:1.12.0")
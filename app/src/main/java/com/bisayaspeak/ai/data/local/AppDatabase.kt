@@ -6,6 +6,7 @@ import androidx.room.Database
 import androidx.room.TypeConverters
 import androidx.room.Room
 import androidx.room.RoomDatabase
+import androidx.room.migration.Migration
 import androidx.sqlite.db.SupportSQLiteDatabase
 import com.bisayaspeak.ai.data.repository.DbSeedStateRepository
 import com.bisayaspeak.ai.data.repository.LevelConfigRepository
@@ -13,7 +14,7 @@ import kotlinx.coroutines.CoroutineScope
 import kotlinx.coroutines.Dispatchers
 import kotlinx.coroutines.launch
 
-@Database(entities = [Question::class, UserProgress::class], version = 31, exportSchema = false)
+@Database(entities = [Question::class, QuestionFts::class, UserProgress::class], version = 33, exportSchema = true)
 @TypeConverters(AppTypeConverters::class)
 abstract class AppDatabase : RoomDatabase() {
     abstract fun questionDao(): QuestionDao
@@ -23,6 +24,43 @@ abstract class AppDatabase : RoomDatabase() {
         @Volatile
         private var INSTANCE: AppDatabase? = null
 
+        // v32: QuestionDao の level 絞り込み用インデックス
+        val MIGRATION_31_32 = object : Migration(31, 32) {
+            override fun migrate(db: SupportSQLiteDatabase) {
+                db.execSQL("CREATE INDEX IF NOT EXISTS `index_questions_level` ON `questions` (`level`)")
+            }
+        }
+
+        // v33: QuestionDao.containsKeyword 用の全文検索テーブル（questions を content とする FTS4）
+        val MIGRATION_32_33 = object : Migration(32, 33) {
+            override fun migrate(db: SupportSQLiteDatabase) {
+                db.execSQL(
+                    "CREATE VIRTUAL TABLE IF NOT EXISTS `questions_fts` USING FTS4(" +
+                        "`sentence` TEXT NOT NULL, `meaningJa` TEXT NOT NULL, `meaningEn` TEXT NOT NULL, content=`questions`)"
+                )
+                db.execSQL(
+                    "CREATE TRIGGER IF NOT EXISTS room_fts_content_sync_questions_fts_BEFORE_UPDATE BEFORE UPDATE ON `questions` " +
+                        "BEGIN DELETE FROM `questions_fts` WHERE `docid`=OLD.`rowid`; END"
+                )
+                db.execSQL(
+                    "CREATE TRIGGER IF NOT EXISTS room_fts_content_sync_questions_fts_BEFORE_DELETE BEFORE DELETE ON `questions` " +
+                        "BEGIN DELETE FROM `questions_fts` WHERE `docid`=OLD.`rowid`; END"
+                )
+                db.execSQL(
+                    "CREATE TRIGGER IF NOT EXISTS room_fts_content_sync_questions_fts_AFTER_UPDATE AFTER UPDATE ON `questions` " +
+                        "BEGIN INSERT INTO `questions_fts`(`docid`, `sentence`, `meaningJa`, `meaningEn`) VALUES (NEW.`rowid`, NEW.`sentence`, NEW.`meaningJa`, NEW.`meaningEn`); END"
+                )
+                db.execSQL(
+                    "CREATE TRIGGER IF NOT EXISTS room_fts_content_sync_questions_fts_AFTER_INSERT AFTER INSERT ON `questions` " +
+                        "BEGIN INSERT INTO `questions_fts`(`docid`, `sentence`, `meaningJa`, `meaningEn`) VALUES (NEW.`rowid`, NEW.`sentence`, NEW.`meaningJa`, NEW.`meaningEn`); END"
+                )
+                // 既存の questions 行を索引に取り込む
+                db.execSQL("INSERT INTO `questions_fts`(`questions_fts`) VALUES('rebuild')")
+            }
+        }
+
+        val MIGRATIONS = arrayOf(MIGRATION_31_32, MIGRATION_32_33)
+
         fun getInstance(context: Context): AppDatabase {
             return INSTANCE ?: synchronized(this) {
                 INSTANCE ?: buildDatabase(context.applicationContext).also { INSTANCE = it }
@@ -36,6 +74,9 @@ abstract class AppDatabase : RoomDatabase() {
                 AppDatabase::class.java,
                 "bisaya_speak_ai.db"
             )
+                // tools/prebuilt_db.py で生成した初期データ入りDB（JSONのパースと挿入を省略）
+                .createFromAsset("database/bisaya_speak_ai.db")
+                .addMigrations(*MIGRATIONS)
                 .fallbackToDestructiveMigration()
                 .addCallback(seedCallback)
                 .build()
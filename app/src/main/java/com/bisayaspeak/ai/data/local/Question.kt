@@ -1,9 +1,10 @@
 package com.bisayaspeak.ai.data.local
 
 import androidx.room.Entity
+import androidx.room.Index
 import androidx.room.PrimaryKey
 
-@Entity(tableName = "questions")
+@Entity(tableName = "questions", indices = [Index(value = ["level"])])
 data class Question(
     @PrimaryKey(autoGenerate = true) val id: Int = 0,
     val sentence: String,
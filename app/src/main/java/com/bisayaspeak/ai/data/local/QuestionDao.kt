@@ -31,6 +31,10 @@ interface QuestionDao {
     @Query("DELETE FROM questions")
     suspend fun clearAll()
 
-    @Query("SELECT EXISTS(SELECT 1 FROM questions WHERE sentence LIKE '%' || :keyword || '%' LIMIT 1)")
+    // questions_fts の sentence 列に対するフレーズ検索（単語単位。部分文字列には一致しない）
+    @Query(
+        "SELECT EXISTS(SELECT 1 FROM questions_fts WHERE sentence MATCH " +
+            "'\"' || replace(:keyword, '\"', ' ') || '\"' LIMIT 1)"
+    )
     suspend fun containsKeyword(keyword: String): Boolean
 }
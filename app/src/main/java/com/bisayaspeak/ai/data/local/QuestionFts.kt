@@ -0,0 +1,14 @@
+package com.bisayaspeak.ai.data.local
+
+import androidx.room.Entity
+import androidx.room.Fts4
+
+// questions の全文検索インデックス（外部コンテンツ。Room のトリガーで questions と同期）
+// FTS5 / trigram は minSdk 24 の端末 SQLite で保証されないため FTS4 を使う
+@Fts4(contentEntity = Question::class)
+@Entity(tableName = "questions_fts")
+data class QuestionFts(
+    val sentence: String,
+    val meaningJa: String,
+    val meaningEn: String
+)
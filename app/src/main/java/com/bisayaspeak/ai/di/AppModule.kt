@@ -31,6 +31,7 @@ object AppModule {
             "bisayaspeak_db"
         )
         // 必要であればマイグレーション設定を追加
+        .addMigrations(*AppDatabase.MIGRATIONS)
         // .fallbackToDestructiveMigration()
         .build()
     }
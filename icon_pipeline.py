@@ -0,0 +1,304 @@
+"""
+Bisaya Speak AI - アイコン生成パイプライン
+
+マスターアイコンを高解像度で一度だけ描画（またはマスター画像を読み込み）し、
+デザインのハッシュでキャッシュします。各密度のリサイズはプロセスプールで並列に実行し、
+同じビットマップは一度だけエンコード、内容が変わらないファイルは書き込みません。
+
+エンコード段階ではパレット化・PNG圧縮設定・ロスレスWebPを試し、
+完全一致（または指定したRMS差分以内）で最小のものを採用します。
+"""
+
+import hashlib
+import inspect
+import io
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from PIL import Image, ImageChops, ImageStat
+
+from icon_design import create_icon
+
+ROOT = Path(__file__).resolve().parent
+CACHE_DIR = ROOT / ".content_build" / "icons"
+STAMP_PATH = CACHE_DIR / "outputs.json"
+OUTPUT_DIR = ROOT / "app" / "src" / "main" / "res"
+PLAYSTORE_ICON = ROOT / "ic_launcher_playstore.png"
+
+# 描画時のマスターサイズ（最大サイズ512pxより大きく描いて縮小する）
+MASTER_SIZE = 1024
+
+SIZES = {
+    'mipmap-mdpi': 48,
+    'mipmap-hdpi': 72,
+    'mipmap-xhdpi': 96,
+    'mipmap-xxhdpi': 144,
+    'mipmap-xxxhdpi': 192
+}
+
+# 同じビットマップを書き出すファイル名
+ICON_NAMES = ("ic_launcher", "ic_launcher_round")
+
+# mipmapで使用できる形式（ロスレスWebPはminSdk 24で利用可能）
+ICON_FORMATS = ("png", "webp")
+
+
+def _sha256(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def design_hash(master_path=None):
+    """
+    マスター画像のキャッシュキーを計算
+
+    Parameters:
+    - master_path: 既存のマスター画像（Noneの場合はcreate_iconのデザインを使用）
+    """
+    if master_path is not None:
+        return _sha256(Path(master_path).read_bytes())
+    design = inspect.getsource(create_icon) + f"\nmaster_size={MASTER_SIZE}"
+    return _sha256(design.encode("utf-8"))
+
+
+def render_master(master_path=None):
+    """
+    マスター画像をキャッシュから取得（なければ描画して保存）し、そのパスを返す
+    """
+    key = design_hash(master_path)
+    cached = CACHE_DIR / f"master_{key[:16]}.png"
+    if cached.exists():
+        print(f"✓ Master icon cache hit: {cached.name}")
+        return cached
+
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    if master_path is not None:
+        master = Image.open(master_path)
+        master.load()
+    else:
+        print(f"Rendering {MASTER_SIZE}x{MASTER_SIZE} master icon...")
+        master = create_icon(MASTER_SIZE)
+    tmp_path = cached.with_suffix(".tmp")
+    master.save(tmp_path, format="PNG")
+    tmp_path.replace(cached)
+    print(f"✓ Cached master icon: {cached.name}")
+    return cached
+
+
+def _write_if_changed(path, data):
+    path = Path(path)
+    if path.exists() and _sha256(path.read_bytes()) == _sha256(data):
+        return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(data)
+    tmp_path.replace(path)
+    return True
+
+
+def encode_png(image):
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def rms_difference(original, candidate):
+    """
+    2つの画像のRMS差分（0〜255、全チャンネル平均）
+    """
+    mode = "RGBA" if "A" in original.getbands() else "RGB"
+    diff = ImageChops.difference(original.convert(mode), candidate.convert(mode))
+    channels = ImageStat.Stat(diff).rms
+    return sum(channels) / len(channels)
+
+
+def _encode(image, fmt, **options):
+    buffer = io.BytesIO()
+    image.save(buffer, format=fmt, **options)
+    return buffer.getvalue()
+
+
+def _decode(data):
+    image = Image.open(io.BytesIO(data))
+    image.load()
+    return image
+
+
+def encode_candidates(image, formats):
+    """
+    エンコード候補を列挙（(拡張子, ラベル, データ, デコード後の画像) のリスト）
+
+    デコード後の画像はエンコードしたバイト列を読み戻したもの（エンコーダの誤差も比較対象になる）
+    """
+    sources = [("rgb", image)]
+    colors = len(image.getcolors(256) or []) or None
+    if image.mode != "P":
+        # パレット化（256色以下なら完全一致、それ以上は閾値で判定）
+        method = Image.Quantize.FASTOCTREE if "A" in image.getbands() else Image.Quantize.MEDIANCUT
+        sources.append(("palette", image.quantize(colors=min(colors or 256, 256), method=method)))
+
+    candidates = []
+    for label, source in sources:
+        if "png" in formats:
+            data = _encode(source, "PNG", optimize=True)
+            candidates.append(("png", f"{label}-optimize", data, _decode(data)))
+            for level in (6, 9):
+                data = _encode(source, "PNG", compress_level=level)
+                candidates.append(("png", f"{label}-level{level}", data, _decode(data)))
+        if "webp" in formats and label == "rgb":
+            data = _encode(source, "WEBP", lossless=True, quality=100, method=6)
+            candidates.append(("webp", "webp-lossless", data, _decode(data)))
+    return candidates
+
+
+def encode_optimized(image, formats, max_rms=0.0):
+    """
+    最小サイズのエンコードを選択
+
+    Parameters:
+    - image: 出力する画像
+    - formats: 許可する形式（"png", "webp"）
+    - max_rms: 許容するRMS差分（0.0なら完全一致のみ）
+
+    Returns:
+    - (拡張子, データ, 既定設定でのPNGサイズ)
+    """
+    baseline = encode_png(image)
+    best = ("png", baseline)
+    for ext, _label, data, decoded in encode_candidates(image, formats):
+        if len(data) >= len(best[1]):
+            continue
+        if rms_difference(image, decoded) > max_rms:
+            continue
+        best = (ext, data)
+    return best[0], best[1], len(baseline)
+
+
+def render_bucket(master_path, size, stems, formats, max_rms=0.0):
+    """
+    1つの密度バケットを生成（プロセスプールのワーカーで実行）
+
+    Parameters:
+    - master_path: キャッシュ済みマスター画像
+    - size: 出力サイズ（px）
+    - stems: 同じビットマップを書き出すパス（拡張子なし）のリスト
+    - formats: 許可する形式
+    - max_rms: 許容するRMS差分
+
+    Returns:
+    - (書き込んだパスのリスト, 拡張子, 出力のハッシュ, 出力サイズ, 既定設定でのPNGサイズ)
+    """
+    with Image.open(master_path) as master:
+        resized = master.resize((size, size), Image.Resampling.LANCZOS)
+    ext, data, baseline = encode_optimized(resized, formats, max_rms)
+    written = []
+    for stem in stems:
+        path = Path(f"{stem}.{ext}")
+        if _write_if_changed(path, data):
+            written.append(str(path))
+        # 同名の別形式が残るとAndroidのリソースが重複するため削除
+        for other in ICON_FORMATS:
+            sibling = Path(f"{stem}.{other}")
+            if other != ext and sibling.exists():
+                sibling.unlink()
+    return written, ext, _sha256(data), len(data), baseline
+
+
+def _load_stamps():
+    if STAMP_PATH.exists():
+        return json.loads(STAMP_PATH.read_text(encoding="utf-8"))
+    return {}
+
+
+def _is_fresh(stamps, job_key, stems):
+    """
+    前回と同じ条件で生成済みで、出力が手で変更されていなければTrue
+    """
+    stamp = stamps.get(job_key)
+    if stamp is None:
+        return False
+    for stem in stems:
+        path = Path(f"{stem}.{stamp['ext']}")
+        if not path.exists() or _sha256(path.read_bytes()) != stamp["sha256"]:
+            return False
+    return True
+
+
+def build_jobs():
+    """
+    (サイズ, 出力パス（拡張子なし）, 許可する形式) の一覧を作成
+    """
+    # Play Consoleは32bit PNGのみ受け付ける
+    jobs = [(512, [PLAYSTORE_ICON.with_suffix("")], ("png",))]
+    for folder, size in SIZES.items():
+        jobs.append((size, [OUTPUT_DIR / folder / name for name in ICON_NAMES], ICON_FORMATS))
+    return jobs
+
+
+def build_icons(master_path=None, workers=None, max_rms=0.0):
+    """
+    全サイズのアイコンを並列に生成
+
+    Parameters:
+    - master_path: 既存のマスター画像（Noneの場合はデザインから描画）
+    - workers: プロセス数（Noneの場合はCPU数）
+    - max_rms: エンコード時に許容するRMS差分（0.0なら完全一致のみ）
+
+    Returns:
+    - 書き込んだパスのリスト（変更のないファイルは含まない）
+    """
+    master = render_master(master_path)
+    stamps = _load_stamps()
+    pending = []
+    for size, stems, formats in build_jobs():
+        job_key = ":".join([
+            master.stem,
+            str(size),
+            ",".join(formats),
+            str(max_rms),
+            ",".join(os.path.relpath(stem, ROOT) for stem in stems),
+        ])
+        if not _is_fresh(stamps, job_key, stems):
+            pending.append((job_key, size, stems, formats))
+    if not pending:
+        return []
+
+    written = []
+    total_bytes = 0
+    total_baseline = 0
+    with ProcessPoolExecutor(max_workers=workers or min(len(pending), os.cpu_count() or 1)) as pool:
+        futures = {
+            job_key: (size, stems, pool.submit(render_bucket, str(master), size, stems, formats, max_rms))
+            for job_key, size, stems, formats in pending
+        }
+        for job_key, (size, stems, future) in futures.items():
+            paths, ext, digest, size_bytes, baseline = future.result()
+            written.extend(paths)
+            stamps[job_key] = {"ext": ext, "sha256": digest}
+            total_bytes += size_bytes * len(stems)
+            total_baseline += baseline * len(stems)
+            print(f"  {size}px: {ext} {size_bytes} bytes (default PNG {baseline} bytes)")
+    print(f"✓ Saved {total_baseline - total_bytes} bytes ({total_baseline} -> {total_bytes})")
+    STAMP_PATH.write_text(json.dumps(stamps, indent=1, sort_keys=True), encoding="utf-8")
+    return written
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Bisaya Speak AI - Icon Pipeline")
+    parser.add_argument("--master", help="既存のマスター画像（例: ic_launcher_512.png）")
+    parser.add_argument("--workers", type=int, help="並列プロセス数")
+    parser.add_argument("--max-rms", type=float, default=0.0,
+                        help="パレット化で許容するRMS差分（既定: 0.0 = 完全一致のみ）")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("Bisaya Speak AI - Icon Pipeline")
+    print("=" * 60)
+    written = build_icons(args.master, args.workers, args.max_rms)
+    for path in written:
+        print(f"✓ Updated: {os.path.relpath(path, ROOT)}")
+    if not written:
+        print("All icons are up to date.")
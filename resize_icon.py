@@ -4,9 +4,10 @@ Bisaya Speak AI - アイコンリサイズスクリプト
 ic_launcher_512.pngから各サイズのアイコンを生成します。
 """
 
-from PIL import Image
 import os
 
+from icon_pipeline import SIZES, build_icons
+
 def resize_and_save_icons():
     """
     ic_launcher_512.pngから各サイズのアイコンを生成
@@ -18,54 +19,20 @@ def resize_and_save_icons():
         print(f"❌ Error: {master_icon_path} not found!")
         return
     
+    # マスターのキャッシュ・並列リサイズ・差分書き込みはicon_pipelineに任せる
     print(f"Loading master icon: {master_icon_path}")
-    master_icon = Image.open(master_icon_path)
-    
-    # 出力ディレクトリ
-    output_dir = "app/src/main/res"
-    
-    # サイズ定義
-    sizes = {
-        'mipmap-mdpi': 48,
-        'mipmap-hdpi': 72,
-        'mipmap-xhdpi': 96,
-        'mipmap-xxhdpi': 144,
-        'mipmap-xxxhdpi': 192
-    }
-    
-    # Play Store用（512x512）
-    print("\nCreating Play Store icon...")
-    master_icon.save("ic_launcher_playstore.png")
-    print("✓ Created: ic_launcher_playstore.png")
-    
-    # 各サイズのアイコンを生成
-    print("\nGenerating Android mipmap icons...")
-    for folder, size in sizes.items():
-        print(f"Creating {size}x{size} icon for {folder}...")
-        
-        # リサイズ（高品質）
-        resized_icon = master_icon.resize((size, size), Image.Resampling.LANCZOS)
-        
-        # ディレクトリを作成
-        folder_path = os.path.join(output_dir, folder)
-        os.makedirs(folder_path, exist_ok=True)
-        
-        # アイコンを保存
-        icon_path = os.path.join(folder_path, "ic_launcher.png")
-        resized_icon.save(icon_path)
-        print(f"✓ Created: {icon_path}")
-        
-        # 丸型アイコンも同じものを保存
-        round_icon_path = os.path.join(folder_path, "ic_launcher_round.png")
-        resized_icon.save(round_icon_path)
-        print(f"✓ Created: {round_icon_path}")
+    written = build_icons(master_path=master_icon_path)
+    for path in written:
+        print(f"✓ Created: {os.path.relpath(path)}")
+    if not written:
+        print("✓ All icons are up to date")
     
     print("\n" + "=" * 60)
     print("Icon generation complete!")
     print("=" * 60)
     print("\nGenerated files:")
     print("- ic_launcher_playstore.png (For Google Play Store)")
-    print(f"- {len(sizes)} sets of mipmap icons (mdpi to xxxhdpi)")
+    print(f"- {len(SIZES)} sets of mipmap icons (mdpi to xxxhdpi)")
     print("\nNext steps:")
     print("1. Upload ic_launcher_playstore.png to Google Play Console")
     print("2. Build and run the app to see the new icon")
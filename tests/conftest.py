@@ -0,0 +1,10 @@
+"""The tools are flat scripts that import their siblings by name; put them on the path.
+
+The icon scripts live at the repository root and import each other the same way.
+"""
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "tools"))
@@ -0,0 +1,93 @@
+import json
+
+import pytest
+
+from binary_assets import FORMAT_VERSION, MAGIC, decode, encode, write_variants
+
+RECORDS = [
+    {
+        "id": 1,
+        "native": "Maayong buntag",
+        "words": ["Maayong", "buntag"],
+        "translations": {"ja": {"meaning": "おはよう"}, "en": {"meaning": "Good morning"}},
+    },
+    {"nested": [[1, [2, [3, {"deep": [{"deeper": []}]}]]], {"a": {"b": {"c": "d"}}}]},
+    {"empty_string": "", "empty_list": [], "empty_dict": {}, "": "empty key"},
+    {"ints": [0, -1, 1, -64, 63, 64, -65, 2**31, -(2**31), 2**63 + 7, -(2**70)]},
+    {"floats": [0.0, -0.0, 1.5, -2.25, 1e300, -1e-300, 3.141592653589793]},
+    {"flags": [True, False, None], "mixed": [True, 1, 1.0, "1", None]},
+    {"text": "Ñino — 日本語 😀 ñ", "keys": {"キー": "値", "émoji😀": "x"}},
+    [],
+    "top-level string",
+    None,
+]
+
+
+@pytest.mark.parametrize("record", RECORDS, ids=range(len(RECORDS)))
+def test_round_trip_single_record(record):
+    decoded = decode(encode([record]))
+    assert decoded == [record]
+    assert json.dumps(decoded) == json.dumps([record])  # types and key order survive too
+
+
+def test_round_trip_all_records_and_empty_file():
+    assert decode(encode(RECORDS)) == RECORDS
+    assert decode(encode([])) == []
+
+
+def test_bool_and_int_stay_distinct():
+    (decoded,) = decode(encode([[True, 1, False, 0]]))
+    assert [type(value) for value in decoded] == [bool, int, bool, int]
+
+
+def test_shared_strings_are_stored_once():
+    packed = encode([{"word": "salamat"}] * 50)
+    assert packed.count("salamat".encode()) == 1
+
+
+def test_bad_magic():
+    with pytest.raises(ValueError, match="Not a packed content asset"):
+        decode(b"JSON" + encode([1])[4:])
+    with pytest.raises(ValueError, match="Not a packed content asset"):
+        decode(MAGIC)
+
+
+def test_bad_version():
+    packed = bytearray(encode([1]))
+    packed[4] = FORMAT_VERSION + 1
+    with pytest.raises(ValueError, match="Unsupported format version"):
+        decode(bytes(packed))
+
+
+def test_every_truncation_is_a_value_error():
+    packed = encode(RECORDS)
+    for length in range(len(packed)):
+        with pytest.raises(ValueError):
+            decode(packed[:length])
+
+
+def test_trailing_bytes():
+    with pytest.raises(ValueError, match="Trailing bytes"):
+        decode(encode(RECORDS) + b"\0")
+
+
+def test_overlong_string_length():
+    # header, one string claiming 10 bytes but carrying 2, no records
+    with pytest.raises(ValueError, match="runs past the end"):
+        decode(MAGIC + bytes([FORMAT_VERSION, 1, 0, 10]) + b"ab")
+
+
+def test_string_index_out_of_range():
+    # header with no strings, one record holding string #3
+    with pytest.raises(ValueError, match="out of range"):
+        decode(MAGIC + bytes([FORMAT_VERSION, 0, 1, 2, 5, 3]))
+
+
+def test_write_variants(tmp_path):
+    asset = tmp_path / "asset.json"
+    asset.write_text(json.dumps(RECORDS, ensure_ascii=False, indent=2), encoding="utf-8")
+    source, minified, packed = write_variants(asset, tmp_path / "out.min.json", tmp_path / "out.bin")
+    assert source > minified
+    assert json.loads((tmp_path / "out.min.json").read_text(encoding="utf-8")) == RECORDS
+    assert decode((tmp_path / "out.bin").read_bytes()) == RECORDS
+    assert packed == (tmp_path / "out.bin").stat().st_size
@@ -0,0 +1,76 @@
+import copy
+import json
+from collections import Counter
+
+import pytest
+
+from content_rewrite import REPO_ROOT, Rule, compile_rules, load_rules, rewrite_file
+
+PATTERNS, RULES = load_rules()
+
+
+def shipped_records(rule: Rule):
+    for pattern in PATTERNS:
+        for path in sorted(REPO_ROOT.glob(pattern)):
+            if rule.applies_to(path.relative_to(REPO_ROOT).as_posix()):
+                yield from json.loads(path.read_text(encoding="utf-8"))
+
+
+def field_parent(record: dict, field: str):
+    *parents, last = field.split(".")
+    for key in parents:
+        record = record.get(key) if isinstance(record, dict) else None
+    return (record, last) if isinstance(record, dict) and last in record else (None, last)
+
+
+@pytest.mark.parametrize("rule", RULES, ids=[rule.name for rule in RULES])
+def test_each_shipped_rule_matches_a_shipped_record(rule):
+    """A rule whose field no configured record has can never fire."""
+    assert rule.token is not None, "shipped rules are token rules; extend this test for regex rules"
+    apply = compile_rules([rule])
+    matched = 0
+    for record in shipped_records(rule):
+        if field_parent(record, rule.field)[0] is None:
+            continue
+        # plant the token in a real record, so the field path and value type are the shipped ones
+        planted = copy.deepcopy(record)
+        parent, key = field_parent(planted, rule.field)
+        value = parent[key]
+        parent[key] = [*value, rule.token] if isinstance(value, list) else f"{value} {rule.token}"
+        hits: Counter = Counter()
+        assert apply(planted, hits)
+        assert hits[rule.name] == 1
+        if rule.action == "remove":
+            assert planted == record
+        matched += 1
+    assert matched, f"{rule.name}: no record in its files has a {rule.field!r} field"
+
+
+def test_token_rules_rewrite_strings_and_lists(tmp_path):
+    rules = [
+        Rule("drop", "native", "remove", token="bisaya", ignore_case=True),
+        Rule("drop-words", "words", "remove", token="bisaya", ignore_case=True),
+        Rule("swap", "translations.en.meaning", "replace", regex=r"\bthx\b", replacement="thanks"),
+    ]
+    path = tmp_path / "content.json"
+    path.write_text(json.dumps([
+        {"id": 1, "native": "Salamat  Bisaya", "words": ["Salamat", "BISAYA"],
+         "translations": {"en": {"meaning": "thx a lot"}}},
+        {"id": 2, "native": "Maayo"},
+    ], ensure_ascii=False), encoding="utf-8")
+    hits: Counter = Counter()
+    assert rewrite_file(path, compile_rules(rules), dry_run=False, hits=hits) == 1
+    assert json.loads(path.read_text(encoding="utf-8")) == [
+        {"id": 1, "native": "Salamat", "words": ["Salamat"], "translations": {"en": {"meaning": "thanks a lot"}}},
+        {"id": 2, "native": "Maayo"},
+    ]
+    assert hits == Counter({"drop": 1, "drop-words": 1, "swap": 1})
+
+
+def test_unchanged_file_is_not_rewritten(tmp_path):
+    path = tmp_path / "content.json"
+    path.write_text('[{"id": 1, "native": "Maayo"}]', encoding="utf-8")
+    before = path.stat().st_mtime_ns
+    assert rewrite_file(path, compile_rules(RULES), dry_run=False, hits=Counter()) == 0
+    assert path.read_text(encoding="utf-8") == '[{"id": 1, "native": "Maayo"}]'
+    assert path.stat().st_mtime_ns == before
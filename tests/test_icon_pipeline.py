@@ -0,0 +1,43 @@
+import io
+
+from PIL import Image
+
+import icon_pipeline
+from icon_design import create_icon
+from icon_pipeline import encode_candidates, encode_optimized, rms_difference
+
+
+def icon(size=96):
+    return create_icon(512).resize((size, size), Image.Resampling.LANCZOS)
+
+
+def test_candidates_carry_their_decoded_bytes():
+    image = icon()
+    for ext, label, data, decoded in encode_candidates(image, ("png", "webp")):
+        assert decoded is not image
+        reread = Image.open(io.BytesIO(data))
+        assert reread.format.lower() == ext
+        assert rms_difference(reread, decoded) == 0.0, label
+
+
+def test_lossless_webp_is_pixel_identical():
+    image = icon()
+    [(_, _, _, decoded)] = [c for c in encode_candidates(image, ("webp",)) if c[0] == "webp"]
+    assert rms_difference(image, decoded) == 0.0
+
+
+def test_lossy_webp_is_rejected_when_exact_output_is_required(monkeypatch):
+    encode = icon_pipeline._encode
+
+    def lossy(image, fmt, **options):
+        if fmt == "WEBP":
+            options = {"quality": 5}
+        return encode(image, fmt, **options)
+
+    monkeypatch.setattr(icon_pipeline, "_encode", lossy)
+    image = icon()
+    webp = [c for c in encode_candidates(image, ("webp",)) if c[0] == "webp"]
+    assert rms_difference(image, webp[0][3]) > 0
+    ext, data, _ = encode_optimized(image, ("webp",), max_rms=0.0)
+    assert ext == "png"
+    assert rms_difference(image, Image.open(io.BytesIO(data))) == 0.0
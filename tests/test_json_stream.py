@@ -0,0 +1,77 @@
+import json
+import random
+
+import pytest
+
+from json_stream import iter_json_array, iter_json_file, write_json_array
+
+CHUNK_SIZES = [1, 2, 3, 5, 7, 16, 1 << 16]
+
+
+def random_value(rng: random.Random, depth: int = 0):
+    kinds = ["int", "float", "string", "bool", "null"] + (["list", "dict"] if depth < 3 else [])
+    kind = rng.choice(kinds)
+    if kind == "int":
+        return rng.choice([0, -1, rng.randint(-10**12, 10**12)])
+    if kind == "float":
+        return rng.choice([65000000000.0, -0.5, 1e-7, 2.5e300, rng.uniform(-1e6, 1e6)])
+    if kind == "string":
+        return "".join(rng.choice('ab ",]\\\néあ[{') for _ in range(rng.randint(0, 8)))
+    if kind == "bool":
+        return rng.random() < 0.5
+    if kind == "null":
+        return None
+    if kind == "list":
+        return [random_value(rng, depth + 1) for _ in range(rng.randint(0, 4))]
+    return {f"k{index}": random_value(rng, depth + 1) for index in range(rng.randint(0, 4))}
+
+
+def write(tmp_path, text: str):
+    path = tmp_path / "data.json"
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_reader_matches_json_loads_for_every_chunk_size(tmp_path, seed):
+    rng = random.Random(seed)
+    records = [random_value(rng) for _ in range(rng.randint(0, 12))]
+    for indent in (None, 2):
+        text = "".join(iter_json_array(records, indent))
+        path = write(tmp_path, text)
+        for chunk_size in CHUNK_SIZES:
+            assert list(iter_json_file(path, chunk_size)) == json.loads(text)
+
+
+@pytest.mark.parametrize("chunk_size", CHUNK_SIZES)
+@pytest.mark.parametrize("text", [
+    "[65000000000.0]",
+    "[1, 65000000000.0, -12.5e-3]",
+    " \n[ 123456789 , 1E+10\t]\n",
+    "\ufeff[true,false,null]",
+])
+def test_numbers_split_across_chunks(tmp_path, text, chunk_size):
+    assert list(iter_json_file(write(tmp_path, text), chunk_size)) == json.loads(text.lstrip("\ufeff"))
+
+
+def test_non_arrays_are_rejected(tmp_path):
+    with pytest.raises(ValueError, match="does not contain a JSON array"):
+        list(iter_json_file(write(tmp_path, '{"id": 1}')))
+
+
+@pytest.mark.parametrize("chunk_size", CHUNK_SIZES)
+@pytest.mark.parametrize("text", ["[1,]", "[1]x", "[1] [2]", "[1 2]", "[1.]", "[1,", "[", "[,1]"])
+def test_malformed_arrays_are_rejected(tmp_path, text, chunk_size):
+    with pytest.raises(ValueError):
+        json.loads(text)
+    with pytest.raises(ValueError):
+        list(iter_json_file(write(tmp_path, text), chunk_size))
+
+
+def test_writer_matches_json_dumps(tmp_path):
+    records = [{"id": 1, "native": "Salamat", "meaning": "ありがとう"}, {"id": 2, "nested": {"a": [1, 2.5]}}]
+    indented, minified = tmp_path / "indented.json", tmp_path / "minified.json"
+    assert write_json_array(records, [indented], indent=2) == 2
+    write_json_array(records, [minified])
+    assert indented.read_text(encoding="utf-8") == json.dumps(records, ensure_ascii=False, indent=2)
+    assert minified.read_text(encoding="utf-8") == json.dumps(records, ensure_ascii=False, separators=(",", ":"))
@@ -0,0 +1,32 @@
+import pytest
+
+from kotlin_literals import KotlinSyntaxError, tokenize
+
+
+def strings(source: str) -> list[str]:
+    return [token.text for token in tokenize(source) if token.kind == "string"]
+
+
+def test_escapes_are_decoded():
+    assert strings(r'f("a\tb\"c\\d\$e\u3042")') == ['a\tb"c\\d$eあ']
+
+
+@pytest.mark.parametrize("source, offset", [
+    ('val s = "abc\\', 8),
+    ('val s = "abc\\\n"', 8),
+])
+def test_backslash_at_end_of_input_or_line_is_unterminated(source, offset):
+    with pytest.raises(KotlinSyntaxError, match=f"Unterminated string at offset {offset}$"):
+        list(tokenize(source))
+
+
+@pytest.mark.parametrize("source", [
+    'val s = "ab\\u12"',
+    'val s = "ab\\u12G4"',
+    'val s = "ab\\u+123"',
+    'val s = "ab\\u1_23"',
+    'val s = "ab\\u12',
+])
+def test_malformed_unicode_escape_reports_its_offset(source):
+    with pytest.raises(KotlinSyntaxError, match=r"Malformed \\u escape at offset 11$"):
+        list(tokenize(source))
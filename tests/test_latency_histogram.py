@@ -0,0 +1,92 @@
+import io
+import math
+import random
+
+import pytest
+
+from latency_histogram import LatencyHistogram
+
+
+def exact_percentile(values: list[int], percentile: float) -> int:
+    ordered = sorted(values)
+    return ordered[max(1, math.ceil(percentile / 100 * len(ordered))) - 1]
+
+
+@pytest.mark.parametrize("significant_digits", [1, 2, 3])
+def test_percentiles_are_within_the_configured_precision(significant_digits):
+    rng = random.Random(significant_digits)
+    # log-uniform from 1 µs to ~17 minutes, so every magnitude is exercised
+    values = [int(math.exp(rng.uniform(0, math.log(10**9)))) for _ in range(5000)]
+    histogram = LatencyHistogram(significant_digits)
+    for value in values:
+        histogram.record(value)
+    for percentile in (0, 1, 10, 50, 90, 95, 99, 99.9, 100):
+        exact = exact_percentile(values, percentile)
+        reported = histogram.percentile(percentile)
+        assert exact <= reported <= exact + exact * 10 ** -significant_digits, percentile
+    assert histogram.percentile(100) == histogram.max == max(values)
+    assert histogram.min == min(values)
+    assert histogram.mean == sum(values) / len(values)
+
+
+@pytest.mark.parametrize("significant_digits", [1, 2, 3])
+def test_buckets_tile_the_value_range(significant_digits):
+    histogram = LatencyHistogram(significant_digits)
+    expected_lowest = 0
+    for index in range(histogram._index(10**12) + 1):
+        lowest, highest = histogram._range(index)
+        assert lowest == expected_lowest, index
+        assert histogram._index(lowest) == histogram._index(highest) == index
+        assert highest - lowest <= max(0, lowest * 10 ** -significant_digits)
+        expected_lowest = highest + 1
+
+
+def test_small_values_are_exact():
+    histogram = LatencyHistogram()
+    for value in range(histogram.sub_bucket_count):
+        assert histogram._range(histogram._index(value)) == (value, value)
+
+
+def test_merge_equals_recording_everything_into_one():
+    rng = random.Random(7)
+    first, second, combined = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+    for target in (first, second):
+        for _ in range(1000):
+            value = rng.randrange(10**7)
+            target.record(value)
+            combined.record(value)
+    first.merge(second)
+    assert first.counts == combined.counts
+    assert (first.total, first.min, first.max, first.sum) == (combined.total, combined.min, combined.max, combined.sum)
+    assert [first.percentile(p) for p in (50, 99)] == [combined.percentile(p) for p in (50, 99)]
+
+
+def test_merge_into_and_from_empty():
+    empty, recorded = LatencyHistogram(), LatencyHistogram()
+    recorded.record(500, count=3)
+    empty.merge(recorded)
+    assert (empty.total, empty.min, empty.max) == (3, 500, 500)
+    empty.merge(LatencyHistogram())
+    assert (empty.total, empty.min, empty.max) == (3, 500, 500)
+
+
+def test_invalid_use_is_rejected():
+    with pytest.raises(ValueError, match="significant_digits"):
+        LatencyHistogram(0)
+    with pytest.raises(ValueError, match="non-negative"):
+        LatencyHistogram().record(-1)
+    with pytest.raises(ValueError, match="different precision"):
+        LatencyHistogram(2).merge(LatencyHistogram(3))
+
+
+def test_percentile_distribution_ends_at_the_maximum():
+    histogram = LatencyHistogram()
+    for value in range(1, 1001):
+        histogram.record(value * 1000)
+    out = io.StringIO()
+    histogram.percentile_distribution(out)
+    rows = [line.split() for line in out.getvalue().splitlines()[2:] if line and not line.startswith("#")]
+    assert float(rows[-1][0]) == 1000.0
+    assert float(rows[-1][1]) == 1.0 and int(rows[-1][2]) == 1000
+    assert [int(row[2]) for row in rows] == sorted(int(row[2]) for row in rows)
+    assert "Total count    =         1000" in out.getvalue()
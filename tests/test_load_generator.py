@@ -0,0 +1,72 @@
+import argparse
+import asyncio
+import random
+
+import pytest
+
+from load_generator import ConnectionPool, LoadRun, Workload, summarize
+from stand_in_backend import BackgroundServer, Faults
+
+
+def run_args(**overrides) -> argparse.Namespace:
+    args = dict(rate=40.0, duration=0.5, think_time=0.0, pronounce_ratio=0.3, upload_seconds=0.2,
+                connections=8, timeout=10.0, seed=3)
+    args.update(overrides)
+    return argparse.Namespace(**args)
+
+
+def load_test(server: BackgroundServer, args: argparse.Namespace) -> tuple[LoadRun, float]:
+    async def main():
+        pool = ConnectionPool(server.base_url, args.connections)
+        run = LoadRun(pool, Workload.load(), args, random.Random(args.seed))
+        try:
+            return run, await run.run()
+        finally:
+            pool.close()
+
+    return asyncio.run(main())
+
+
+def test_open_loop_run_accounts_for_every_request():
+    with BackgroundServer() as server:
+        run, wall = load_test(server, run_args())
+        stats = server.backend.stats
+    sessions = run.sessions
+    assert sessions["started"] > 5
+    assert sessions["completed"] == sessions["started"] and not sessions["aborted"]
+    report = summarize(run.stats, wall)
+    assert report["all"]["requests"] == report["all"]["ok"] == stats["requests"]
+    assert report["roleplay/start"]["ok"] == sessions["started"]
+    # every session has its own conversation, even though they share pooled connections
+    assert len(server.backend.roleplays) == sessions["started"]
+    assert stats["roleplays_evicted"] == 0
+    for endpoint, row in report.items():
+        if endpoint != "all":
+            assert row["outcomes"] == {"200": row["ok"]}
+            assert 0 < row["p50_ms"] <= row["p99_ms"] <= row["max_ms"]
+
+
+def test_injected_errors_are_counted_and_abort_sessions():
+    with BackgroundServer(Faults(error_rate=0.2, seed=1)) as server:
+        run, wall = load_test(server, run_args())
+        stats = server.backend.stats
+    sessions = run.sessions
+    report = summarize(run.stats, wall)
+    failed = {endpoint: row["requests"] - row["ok"] for endpoint, row in report.items() if endpoint != "all"}
+    assert sum(failed.values()) == stats["status_503"] > 0
+    assert report["all"]["requests"] == stats["requests"]
+    for endpoint, row in report.items():
+        if endpoint != "all":
+            assert set(row["outcomes"]) <= {"200", "503"}
+            assert row["outcomes"].get("503", 0) == failed[endpoint]
+            assert row["ok"] == row["outcomes"].get("200", 0)
+    # a failed start or chat ends its session; a failed upload does not
+    aborting = failed.get("roleplay/start", 0) + failed.get("roleplay/chat", 0)
+    assert sessions["aborted"] == aborting > 0
+    assert sessions["completed"] + sessions["aborted"] == sessions["started"]
+
+
+@pytest.mark.parametrize("base_url", ["ftp://localhost", "localhost:8000"])
+def test_pool_rejects_unsupported_urls(base_url):
+    with pytest.raises(ValueError, match="unsupported URL scheme"):
+        ConnectionPool(base_url, 1)
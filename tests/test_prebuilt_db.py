@@ -0,0 +1,63 @@
+import json
+
+import pytest
+
+import prebuilt_db
+from prebuilt_db import ENTITY_SOURCES, check_exported_schema, create_statements, parse_entity
+
+
+@pytest.fixture
+def statements():
+    entities = [parse_entity(source) for source in ENTITY_SOURCES]
+    tables = {entity["class"]: entity["table"] for entity in entities}
+    return {entity["table"]: create_statements(entity, tables) for entity in entities}
+
+
+def export(directory, statements, version=33):
+    """A Room-style exported schema: createSql with ${TABLE_NAME}, indices and FTS triggers split out."""
+    entities = []
+    for table, table_statements in statements.items():
+        create, *rest = table_statements
+        entities.append({
+            "tableName": table,
+            "createSql": create.replace(f"`{table}`", "`${TABLE_NAME}`", 1),
+            "indices": [
+                {"createSql": sql.replace(f"ON `{table}`", "ON `${TABLE_NAME}`")}
+                for sql in rest if sql.startswith("CREATE INDEX")
+            ],
+            "contentSyncTriggers": [sql for sql in rest if sql.startswith("CREATE TRIGGER")],
+        })
+    directory.mkdir(parents=True, exist_ok=True)
+    (directory / f"{version}.json").write_text(
+        json.dumps({"formatVersion": 1, "database": {"version": version, "entities": entities}}), encoding="utf-8"
+    )
+
+
+def flat(statements):
+    return [sql for table_statements in statements.values() for sql in table_statements]
+
+
+def test_matching_export_passes(tmp_path, statements):
+    export(tmp_path, statements)
+    check_exported_schema(33, flat(statements), tmp_path)
+
+
+def test_missing_export_fails_loudly(tmp_path, statements):
+    with pytest.raises(ValueError, match="No exported Room schema 33.json"):
+        check_exported_schema(33, flat(statements), tmp_path)
+
+
+def test_schema_drift_is_reported(tmp_path, statements):
+    export(tmp_path, statements)
+    drifted = [sql for sql in flat(statements) if "index_questions_level" not in sql]
+    with pytest.raises(ValueError, match="does not match Room's exported 33.json"):
+        check_exported_schema(33, drifted, tmp_path)
+
+
+def test_disabled_export_fails(tmp_path, statements, monkeypatch):
+    source = tmp_path / "AppDatabase.kt"
+    source.write_text("@Database(entities = [Question::class], version = 33, exportSchema = false)\n", encoding="utf-8")
+    monkeypatch.setattr(prebuilt_db, "DATABASE_SOURCE", source)
+    export(tmp_path, statements)
+    with pytest.raises(ValueError, match="exportSchema is off"):
+        check_exported_schema(33, flat(statements), tmp_path)
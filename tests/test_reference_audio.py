@@ -0,0 +1,153 @@
+import hashlib
+import http.client
+import json
+
+import pytest
+
+import reference_audio
+from reference_audio import (
+    HttpTts, StubTts, SynthesisError, clip_path, collect_texts, load_index, prune, render, spoken_key,
+)
+from stand_in_backend import BackgroundServer, Faults
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(reference_audio, "RETRY_BACKOFF", 0.0)
+
+
+@pytest.fixture
+def texts(tmp_path):
+    seeds = []
+    for name, records in (
+        ("v1.json", [
+            {"id": 1, "native": "Maayong buntag", "words": ["Maayong", "buntag"]},
+            {"id": 2, "native": "Salamat", "words": ["Salamat"]},
+        ]),
+        ("v2.json", [
+            {"id": 1, "native": "maayong  Buntag", "words": ["maayong", "buntag"]},
+            {"id": 3, "native": "Salamat kaayo", "words": ["salamat", "kaayo"]},
+        ]),
+    ):
+        path = tmp_path / name
+        path.write_text(json.dumps(records), encoding="utf-8")
+        seeds.append(path)
+    return collect_texts(seeds)
+
+
+class FixedTts:
+    """Same bytes for every text, to show identical audio is stored once."""
+
+    name = "fixed"
+    settings = {}
+
+    def synthesize(self, text: str) -> bytes:
+        return StubTts().synthesize("same")
+
+
+class FlakyTts:
+    """Raises something other than SynthesisError for one text."""
+
+    name = "flaky"
+    settings = {}
+
+    def synthesize(self, text: str) -> bytes:
+        if text == "kaayo":
+            raise http.client.IncompleteRead(b"RIFF")
+        return StubTts().synthesize(text)
+
+
+def test_texts_are_deduplicated_by_spoken_key(texts):
+    assert spoken_key("  Maayong\tBUNTAG ") == "maayong buntag"
+    assert texts == {
+        "maayong buntag": "Maayong buntag",
+        "maayong": "Maayong",
+        "buntag": "buntag",
+        "salamat": "Salamat",
+        "salamat kaayo": "Salamat kaayo",
+        "kaayo": "kaayo",
+    }
+
+
+def test_clips_are_content_addressed(tmp_path, texts):
+    out = tmp_path / "audio"
+    result = render(StubTts(), texts, out)
+    assert (result.total, result.rendered, result.failures) == (6, 6, [])
+    index = load_index(out)
+    for key, entry in index["clips"].items():
+        data = clip_path(out, entry["clip"]).read_bytes()
+        assert hashlib.sha256(data).hexdigest() == entry["clip"]
+        assert entry["bytes"] == len(data)
+        assert entry["duration_ms"] > 0
+        assert entry["text"] == texts[key]
+
+
+def test_identical_audio_is_stored_once(tmp_path, texts):
+    out = tmp_path / "audio"
+    result = render(FixedTts(), texts, out)
+    assert result.rendered == 6
+    assert result.clips == 1
+    assert len(list((out / "clips").glob("*/*.wav"))) == 1
+
+
+def test_rerun_renders_nothing(tmp_path, texts):
+    out = tmp_path / "audio"
+    render(StubTts(), texts, out)
+    before = (out / "index.json").read_bytes()
+    result = render(StubTts(), texts, out)
+    assert (result.total, result.rendered) == (6, 0)
+    assert (out / "index.json").read_bytes() == before
+
+
+def test_missing_clip_is_rendered_again(tmp_path, texts):
+    out = tmp_path / "audio"
+    render(StubTts(), texts, out)
+    clip_path(out, load_index(out)["clips"]["kaayo"]["clip"]).unlink()
+    assert render(StubTts(), texts, out).rendered == 1
+
+
+def test_signature_change_renders_everything_and_prune_drops_old_clips(tmp_path, texts):
+    out = tmp_path / "audio"
+    render(StubTts(), texts, out)
+    old = {entry["clip"] for entry in load_index(out)["clips"].values()}
+    result = render(StubTts(seconds_per_char=0.1), texts, out)
+    assert result.rendered == 6
+    assert load_index(out)["signature"]["settings"] == {"seconds_per_char": 0.1}
+    new = {entry["clip"] for entry in load_index(out)["clips"].values()}
+    assert not old & new
+    assert prune(out) == len(old)
+    assert {path.stem for path in (out / "clips").glob("*/*.wav")} == new
+    assert prune(out) == 0
+
+
+def test_unexpected_backend_errors_are_failures_and_the_index_is_kept(tmp_path, texts):
+    out = tmp_path / "audio"
+    result = render(FlakyTts(), texts, out)
+    assert result.rendered == 5
+    assert len(result.failures) == 1 and "IncompleteRead" in result.failures[0]
+    assert set(load_index(out)["clips"]) == set(texts) - {"kaayo"}
+    assert render(FlakyTts(), texts, out).rendered == 0
+
+
+def test_http_backend_against_the_stand_in(tmp_path, texts):
+    out = tmp_path / "audio"
+    with BackgroundServer() as server:
+        result = render(HttpTts(server.base_url), texts, out, concurrency=2)
+        served = server.backend.stats["requests"]
+    assert (result.rendered, result.failures) == (6, [])
+    assert served == 6
+    index = load_index(out)
+    assert index["signature"] == {"backend": "http", "settings": {"server": server.base_url}}
+    assert {entry["duration_ms"] for entry in index["clips"].values()} == {600}
+
+
+def test_http_backend_retries_server_errors():
+    with BackgroundServer(Faults(error_rate=0.5, seed=1)) as server:
+        data = HttpTts(server.base_url, retries=10).synthesize("Salamat kaayo")
+    assert data.startswith(b"RIFF")
+
+
+def test_http_backend_reports_missing_routes():
+    with BackgroundServer() as server:
+        with pytest.raises(SynthesisError, match="HTTP 404"):
+            HttpTts(server.base_url + "/nope").synthesize("salamat")
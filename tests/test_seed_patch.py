@@ -0,0 +1,49 @@
+import copy
+import hashlib
+import json
+
+import pytest
+
+from listening_seed import REPO_ROOT, dumps_seed
+from seed_patch import apply, diff
+
+SEED = REPO_ROOT / "app" / "src" / "main" / "assets" / "content" / "listening_seed_v2.json"
+
+
+def edited(records: list[dict]) -> list[dict]:
+    target = copy.deepcopy(records[1:])
+    target[0]["native"] += " kaayo"
+    del target[1]["level"]
+    target.append({**records[0], "id": max(record["id"] for record in records) + 1})
+    target[2], target[3] = target[3], target[2]
+    return target
+
+
+def test_patch_hashes_match_sha256sum_of_the_files():
+    base_data = SEED.read_bytes()
+    target_data = dumps_seed(edited(json.loads(base_data))).encode("utf-8")
+    patch = diff(base_data, target_data)
+    assert patch["base"]["sha256"] == hashlib.sha256(base_data).hexdigest()
+    assert patch["target"]["sha256"] == hashlib.sha256(target_data).hexdigest()
+    assert apply(base_data, patch) == target_data
+
+
+def test_base_need_not_be_in_dumps_seed_form():
+    records = json.loads(SEED.read_bytes())[:5]
+    base_data = json.dumps(records, ensure_ascii=False).encode("utf-8")
+    target_data = dumps_seed(edited(records)).encode("utf-8")
+    assert apply(base_data, diff(base_data, target_data)) == target_data
+
+
+def test_other_bytes_of_the_same_records_are_not_the_base():
+    records = json.loads(SEED.read_bytes())[:5]
+    base_data = dumps_seed(records).encode("utf-8")
+    patch = diff(base_data, dumps_seed(edited(records)).encode("utf-8"))
+    with pytest.raises(ValueError, match="base hash"):
+        apply(json.dumps(records).encode("utf-8"), patch)
+
+
+def test_target_that_apply_cannot_reproduce_is_rejected():
+    records = json.loads(SEED.read_bytes())[:5]
+    with pytest.raises(ValueError, match="not in dumps_seed form"):
+        diff(dumps_seed(records).encode("utf-8"), json.dumps(edited(records)).encode("utf-8"))
@@ -0,0 +1,40 @@
+import json
+
+import pytest
+
+from listening_seed import REPO_ROOT, iter_records
+from seed_tokenizer import build_word_index, tokenize
+
+ASSETS = ("listening_seed.json", "content/listening_seed_v2.json")
+
+
+@pytest.mark.parametrize("text, tokens", [
+    ("Maayong buntag!", ["Maayong", "buntag"]),
+    ("Kumusta ka, Ma'am?", ["Kumusta", "ka", "Ma'am"]),
+    ("Nakit-an nako. Salamat...", ["Nakit-an", "nako", "Salamat"]),
+    ("  ", []),
+])
+def test_punctuation_splits_and_hyphens_and_apostrophes_stay(text, tokens):
+    assert tokenize(text) == tokens
+
+
+@pytest.mark.parametrize("asset", ASSETS)
+def test_shipped_seed_words_come_from_the_shared_tokenizer(asset):
+    records = json.loads((REPO_ROOT / "app" / "src" / "main" / "assets" / asset).read_text(encoding="utf-8"))
+    assert records
+    assert all(record["words"] == tokenize(record["native"]) for record in records)
+
+
+def test_seed_builder_uses_the_shared_tokenizer():
+    [record] = iter_records([{"id": 1, "level": 1, "native": "Salamat, Ma'am!", "translation": "ありがとう"}],
+                            {"ありがとう": "Thank you"})
+    assert record["words"] == tokenize("Salamat, Ma'am!") == ["Salamat", "Ma'am"]
+
+
+def test_word_index_counts_case_folded_tokens():
+    index = build_word_index([
+        {"id": 1, "native": "Salamat salamat"},
+        {"id": 2, "native": "SALAMAT kaayo", "words": ["SALAMAT", "kaayo"]},
+    ])
+    assert index["salamat"] == {"count": 3, "ids": [1, 2]}
+    assert index["kaayo"] == {"count": 1, "ids": [2]}
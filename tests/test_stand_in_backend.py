@@ -0,0 +1,263 @@
+import http.client
+import io
+import json
+import socket
+import time
+import wave
+from urllib.parse import quote, urlsplit
+
+import pytest
+
+from load_generator import multipart_body
+from stand_in_backend import PARTNER_CLOSING, PARTNER_LINES, BackgroundServer, Faults, reference_clip
+
+
+@pytest.fixture
+def server():
+    with BackgroundServer() as running:
+        yield running
+
+
+def connect(server) -> socket.socket:
+    url = urlsplit(server.base_url)
+    return socket.create_connection((url.hostname, url.port), timeout=5)
+
+
+def read_response(sock: socket.socket) -> tuple[int, dict[str, str], bytes]:
+    data = b""
+    while b"\r\n\r\n" not in data:
+        chunk = sock.recv(4096)
+        if not chunk:
+            raise ConnectionError("closed before a response head")
+        data += chunk
+    head, _, body = data.partition(b"\r\n\r\n")
+    status_line, *lines = head.decode("latin-1").split("\r\n")
+    headers = {name.lower(): value.strip() for name, _, value in (line.partition(":") for line in lines)}
+    while len(body) < int(headers["content-length"]):
+        body += sock.recv(4096)
+    return int(status_line.split()[1]), headers, body
+
+
+def assert_closed(sock: socket.socket) -> None:
+    assert sock.recv(1) == b""
+
+
+def test_keep_alive_serves_several_requests(server):
+    with connect(server) as sock:
+        for _ in range(3):
+            sock.sendall(b"GET / HTTP/1.1\r\nHost: x\r\n\r\n")
+            status, headers, _ = read_response(sock)
+            assert status == 200
+            assert headers["connection"] == "keep-alive"
+
+
+@pytest.mark.parametrize("length", [b"abc", b"-5", b"1e3", b"\xb2"])
+def test_invalid_content_length_answers_400_and_closes(server, length):
+    with connect(server) as sock:
+        sock.sendall(b"POST /api/chat/free HTTP/1.1\r\nHost: x\r\nContent-Length: " + length + b"\r\n\r\n{}")
+        status, headers, body = read_response(sock)
+        assert status == 400
+        assert headers["connection"] == "close"
+        assert b"Content-Length" in body
+        assert_closed(sock)
+
+
+def test_malformed_chunk_size_answers_400_and_closes(server):
+    with connect(server) as sock:
+        sock.sendall(
+            b"POST /api/chat/free HTTP/1.1\r\nHost: x\r\nTransfer-Encoding: chunked\r\n\r\nzz\r\n{}\r\n0\r\n\r\n"
+        )
+        status, headers, body = read_response(sock)
+        assert status == 400
+        assert headers["connection"] == "close"
+        assert b"invalid JSON" not in body
+        assert_closed(sock)
+
+
+def test_malformed_chunk_in_multipart_upload_answers_400(server):
+    with connect(server) as sock:
+        sock.sendall(
+            b"POST /api/pronounce/check HTTP/1.1\r\nHost: x\r\nTransfer-Encoding: chunked\r\n"
+            b"Content-Type: multipart/form-data; boundary=b\r\n\r\n5\r\n--b\r\nXX"
+        )
+        status, headers, _ = read_response(sock)
+        assert status == 400
+        assert headers["connection"] == "close"
+        assert_closed(sock)
+
+
+def test_unread_malformed_chunked_body_closes(server):
+    with connect(server) as sock:
+        sock.sendall(b"GET / HTTP/1.1\r\nHost: x\r\nTransfer-Encoding: chunked\r\n\r\nnope\r\n")
+        status, headers, _ = read_response(sock)
+        assert status == 400
+        assert headers["connection"] == "close"
+        assert_closed(sock)
+
+
+def test_valid_chunked_body_keeps_connection(server):
+    with connect(server) as sock:
+        body = b'{"message": "Kumusta"}'
+        sock.sendall(
+            b"POST /api/chat/free HTTP/1.1\r\nHost: x\r\nTransfer-Encoding: chunked\r\n"
+            b"Content-Type: application/json\r\n\r\n"
+            + f"{len(body):x}\r\n".encode() + body + b"\r\n0\r\n\r\n"
+        )
+        status, headers, _ = read_response(sock)
+        assert status == 200
+        assert headers["connection"] == "keep-alive"
+
+
+def test_close_shuts_open_keep_alive_connections():
+    server = BackgroundServer()
+    sock = connect(server)
+    try:
+        sock.sendall(b"GET / HTTP/1.1\r\nHost: x\r\n\r\n")
+        assert read_response(sock)[0] == 200
+        server.close()
+        assert not server.backend.connections
+        assert_closed(sock)
+    finally:
+        sock.close()
+
+
+def call(server, method, path, payload=None, headers=None, body=None):
+    url = urlsplit(server.base_url)
+    connection = http.client.HTTPConnection(url.hostname, url.port, timeout=5)
+    try:
+        if payload is not None:
+            body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+            headers = {"Content-Type": "application/json", **(headers or {})}
+        connection.request(method, path, body=body, headers=headers or {})
+        response = connection.getresponse()
+        data = response.read()
+        if response.getheader("Content-Type", "").startswith("application/json"):
+            data = json.loads(data)
+        return response.status, data
+    finally:
+        connection.close()
+
+
+def chat(server, scene_id, session=None, text="Maayong adlaw"):
+    payload = {"scene_id": scene_id, "text": text}
+    if session:
+        payload["session_id"] = session
+    status, body = call(server, "POST", "/api/roleplay/chat", payload)
+    assert status == 200
+    return body
+
+
+def test_roleplay_replies_with_partner_lines_until_the_turn_limit(server):
+    status, opening = call(server, "POST", "/api/roleplay/start", {"scene_id": "dojo_1", "level": "advanced"})
+    assert status == 200
+    assert opening["scene_id"] == "dojo_1" and opening["reply"]
+    limit = opening["turn_limit"]
+    replies = [chat(server, "dojo_1", text=f"Pulong {turn}") for turn in range(limit)]
+    assert [reply["turn"] for reply in replies] == list(range(1, limit + 1))
+    assert all((reply["reply"], reply["translation"]) in PARTNER_LINES for reply in replies[:-1])
+    assert (replies[-1]["reply"], replies[-1]["translation"]) == PARTNER_CLOSING
+    assert [reply["finished"] for reply in replies] == [False] * (limit - 1) + [True]
+    # the partner answers; it does not echo what the learner said
+    assert all(not reply["reply"].startswith("Pulong") for reply in replies)
+
+
+def test_roleplay_sessions_do_not_share_turns(server):
+    for session in ("alice", "bob"):
+        call(server, "POST", "/api/roleplay/start", {"scene_id": "dojo_1", "session_id": session})
+    assert chat(server, "dojo_1", "alice")["turn"] == 1
+    assert chat(server, "dojo_1", "alice")["turn"] == 2
+    assert chat(server, "dojo_1", "bob")["turn"] == 1
+    _, restarted = call(
+        server, "POST", "/api/roleplay/start", {"scene_id": "dojo_1"}, headers={"X-Session-Id": "alice"}
+    )
+    assert restarted["session_id"] == "alice"
+    assert chat(server, "dojo_1", "alice")["turn"] == 1
+
+
+def test_roleplay_state_is_capped():
+    with BackgroundServer() as server:
+        server.backend.max_roleplays = 3
+        for session in range(5):
+            chat(server, "dojo_1", f"user-{session}")
+        assert len(server.backend.roleplays) == 3
+        assert ("user-0", "dojo_1") not in server.backend.roleplays
+        assert server.backend.stats["roleplays_evicted"] == 2
+        # an evicted conversation starts over
+        assert chat(server, "dojo_1", "user-0")["turn"] == 1
+
+
+def test_roleplay_requires_scene_and_text(server):
+    assert call(server, "POST", "/api/roleplay/chat", {"scene_id": "dojo_1", "text": " "})[0] == 400
+    assert call(server, "POST", "/api/roleplay/start", {})[0] == 400
+
+
+def test_translate_uses_seed_phrases_and_falls_back_to_tagging(server):
+    phrase = next(iter(server.backend.content.phrases))
+    status, body = call(server, "POST", "/api/translate", {"text": phrase, "source": "ja", "target": "ceb"})
+    assert status == 200
+    assert body["translated"] == body["visayan"] == server.backend.content.phrases[phrase]
+    status, body = call(server, "POST", "/api/translate", {"text": "猫", "source": "ja", "target": "ko"})
+    assert body["translated"] == "[ko] 猫"
+    assert call(server, "POST", "/api/translate", {"text": ""})[0] == 400
+
+
+def test_pronounce_check_scores_the_upload(server):
+    audio = reference_clip("Salamat")
+    body, content_type = multipart_body(
+        {"word": "Salamat", "level": "1"}, {"audio": ("take.wav", "audio/wav", audio)}
+    )
+    status, first = call(server, "POST", "/api/pronounce/check", body=body, headers={"Content-Type": content_type})
+    assert status == 200
+    assert first["status"] == "success"
+    assert first["data"]["audio_bytes"] == len(audio)
+    assert 55 <= first["score"] <= 99 and first["score"] == first["data"]["pronunciation_score"]
+    _, again = call(server, "POST", "/api/pronounce/check", body=body, headers={"Content-Type": content_type})
+    assert again["score"] == first["score"]
+    assert server.backend.stats["upload_bytes"] == 2 * len(audio)
+
+    body, content_type = multipart_body({"word": "Salamat"}, {})
+    assert call(server, "POST", "/api/pronounce/check", body=body, headers={"Content-Type": content_type})[0] == 400
+
+
+def test_reference_audio_is_a_wav_per_word(server):
+    status, data = call(server, "GET", "/api/reference-audio/" + quote("Maayong buntag"))
+    assert status == 200
+    assert data == reference_clip("Maayong buntag")
+    with wave.open(io.BytesIO(data)) as clip:
+        assert clip.getframerate() == 16_000 and clip.getnchannels() == 1
+    assert call(server, "GET", "/api/reference-audio/Salamat")[1] != data
+
+
+def test_unknown_routes_and_methods(server):
+    assert call(server, "GET", "/api/nope")[0] == 404
+    assert call(server, "GET", "/api/translate")[0] == 405
+
+
+def test_error_rate_answers_503_without_touching_roleplay_state():
+    with BackgroundServer(Faults(error_rate=1.0)) as server:
+        payload = {"scene_id": "dojo_1", "text": "Hi", "session_id": "s"}
+        status, body = call(server, "POST", "/api/roleplay/chat", payload)
+        assert (status, body) == (503, {"error": "injected failure"})
+        assert not server.backend.roleplays
+        # health and stats are never faulted
+        assert call(server, "GET", "/")[0] == 200
+        assert call(server, "GET", "/_stats")[1]["status_503"] == 1
+
+
+def test_drop_rate_closes_without_a_response():
+    with BackgroundServer(Faults(drop_rate=1.0)) as server:
+        with pytest.raises((http.client.RemoteDisconnected, ConnectionError)):
+            call(server, "POST", "/api/translate", {"text": "猫"})
+        assert server.backend.stats["dropped"] == 1
+
+
+def test_route_latency_delays_only_that_route():
+    with BackgroundServer(Faults(route_latency_ms={"/api/translate": 200})) as server:
+        started = time.perf_counter()
+        call(server, "POST", "/api/translate", {"text": "猫"})
+        slow = time.perf_counter() - started
+        started = time.perf_counter()
+        call(server, "POST", "/api/chat/free", {"message": "Kumusta"})
+        fast = time.perf_counter() - started
+    assert slow >= 0.2
+    assert fast < slow - 0.1
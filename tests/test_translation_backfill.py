@@ -0,0 +1,151 @@
+import json
+
+import pytest
+
+import translation_backfill
+from translation_backfill import HttpTranslator, PartialBatchError, TranslationError, backfill, start_stub_server
+from translation_memory import TranslationMemory
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(translation_backfill, "RETRY_BACKOFF", 0.0)
+
+
+@pytest.fixture
+def memory(tmp_path):
+    with TranslationMemory(tmp_path / "tm.sqlite") as memory:
+        yield memory
+
+
+@pytest.fixture
+def asset(tmp_path):
+    records = [
+        {"id": index, "translations": {"ja": {"meaning": f"文{index}"}}}
+        for index in range(7)
+    ]
+    records.append({"id": 7, "translations": {"ja": {"meaning": "文0"}}})  # duplicate text
+    records.append({"id": 8, "translations": {"ja": {"meaning": "済み"}, "ko": {"meaning": "done"}}})
+    path = tmp_path / "asset.json"
+    path.write_text(json.dumps(records, ensure_ascii=False), encoding="utf-8")
+    return path
+
+
+def serve(script=(), fail_texts=()):
+    server = start_stub_server(script=script, fail_texts=fail_texts)
+    return server, f"http://127.0.0.1:{server.server_port}"
+
+
+def run(memory, translator, asset, batch_size=3):
+    try:
+        return backfill(memory, translator, "ja", "ko", paths=[asset], batch_size=batch_size, concurrency=2)
+    finally:
+        translator.close()
+
+
+def test_batches_translate_every_unique_missing_text(memory, asset):
+    server, url = serve()
+    try:
+        unique, translated, failures = run(memory, HttpTranslator(url, concurrency=2), asset)
+    finally:
+        server.shutdown()
+    assert (unique, translated, failures) == (7, 7, [])
+    assert server.requests == 7
+    assert memory.lookup("文3", "ja", "ko") == "[ko] 文3"
+
+
+def test_rerun_is_served_from_the_memory(memory, asset):
+    server, url = serve()
+    try:
+        run(memory, HttpTranslator(url), asset)
+        first = server.requests
+        unique, translated, failures = run(memory, HttpTranslator(url), asset)
+    finally:
+        server.shutdown()
+    assert (unique, translated, failures) == (7, 0, [])
+    assert server.requests == first
+
+
+@pytest.mark.parametrize("status", [500, 503, 429])
+def test_retryable_statuses_are_retried(status):
+    server, url = serve([status, status])
+    translator = HttpTranslator(url, retries=2)
+    try:
+        assert translator.translate_batch(["猫"], "ja", "ko") == ["[ko] 猫"]
+    finally:
+        translator.close()
+        server.shutdown()
+    assert server.requests == 3
+
+
+def test_client_errors_are_not_retried():
+    server, url = serve([400])
+    translator = HttpTranslator(url, retries=3)
+    try:
+        with pytest.raises(TranslationError, match="HTTP 400"):
+            translator.translate("猫", "ja", "ko")
+    finally:
+        translator.close()
+        server.shutdown()
+    assert server.requests == 1
+
+
+def test_connection_reset_is_retried():
+    server, url = serve(["drop"])
+    translator = HttpTranslator(url, retries=1)
+    try:
+        assert translator.translate("猫", "ja", "ko") == "[ko] 猫"
+    finally:
+        translator.close()
+        server.shutdown()
+    assert server.requests == 2
+
+
+def test_malformed_payload_fails_without_retry():
+    server, url = serve(["garbage"])
+    translator = HttpTranslator(url, retries=3)
+    try:
+        with pytest.raises(TranslationError, match="Malformed response") as error:
+            translator.translate("猫", "ja", "ko")
+    finally:
+        translator.close()
+        server.shutdown()
+    assert not error.value.retryable
+    assert server.requests == 1
+
+
+def test_failed_texts_are_reported_and_the_rest_of_their_batch_is_kept(memory, asset):
+    # three batches of up to 3; only 文4 (in the second batch) is rejected
+    server, url = serve(fail_texts=["文4"])
+    try:
+        unique, translated, failures = run(memory, HttpTranslator(url, retries=1), asset, batch_size=3)
+    finally:
+        server.shutdown()
+    assert unique == 7
+    assert failures == ["HTTP 400 for '文4'"]
+    assert translated == 6
+    assert memory.lookup("文4", "ja", "ko") is None
+    for index in (0, 1, 2, 3, 5, 6):
+        assert memory.lookup(f"文{index}", "ja", "ko") == f"[ko] 文{index}"
+
+    server, url = serve()
+    try:
+        _, translated, failures = run(memory, HttpTranslator(url), asset)
+    finally:
+        server.shutdown()
+    assert (translated, failures) == (1, [])
+    assert server.requests == 1
+
+
+def test_batch_keeps_successes_when_a_connection_fails():
+    # a reset beyond the retry budget fails one text; the other is still returned
+    server, url = serve(["drop", "drop"])
+    translator = HttpTranslator(url, concurrency=1, retries=1)
+    try:
+        with pytest.raises(PartialBatchError) as error:
+            translator.translate_batch(["猫", "犬"], "ja", "ko")
+    finally:
+        translator.close()
+        server.shutdown()
+    assert error.value.results == [None, "[ko] 犬"]
+    assert [text for text, _ in error.value.errors] == ["猫"]
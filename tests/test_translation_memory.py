@@ -0,0 +1,41 @@
+import pytest
+
+from translation_memory import Entry, TranslationMemory
+
+
+@pytest.fixture
+def memory(tmp_path):
+    with TranslationMemory(tmp_path / "tm.sqlite") as opened:
+        yield opened
+
+
+def write_map(path, *lines):
+    path.write_text("".join(f"{line}\n" for line in lines), encoding="utf-8")
+
+
+def test_import_map_skips_unchanged_file(memory, tmp_path):
+    path = tmp_path / "map.txt"
+    write_map(path, "ありがとう=Thank you")
+    assert memory.import_map(path) == 1
+    assert memory.import_map(path) is None
+
+
+def test_reimport_removes_lines_deleted_from_the_map(memory, tmp_path):
+    path = tmp_path / "map.txt"
+    write_map(path, "ありがとう=Thank you", "おはよう=Good morning")
+    memory.import_map(path)
+    write_map(path, "ありがとう=Thanks")
+    assert memory.import_map(path) == 1
+    assert memory.table() == {"ありがとう": "Thanks"}
+
+
+def test_reimport_keeps_other_origins_and_language_pairs(memory, tmp_path):
+    path = tmp_path / "map.txt"
+    write_map(path, "おはよう=Good morning")
+    memory.import_map(path)
+    memory.import_map(path, target_lang="ko")
+    memory.upsert_many([Entry("ja", "こんばんは", "en", "Good evening", origin="assets.json")])
+    write_map(path, "ありがとう=Thank you")
+    memory.import_map(path)
+    assert memory.table() == {"ありがとう": "Thank you", "こんばんは": "Good evening"}
+    assert memory.lookup("おはよう", target_lang="ko") == "Good morning"
@@ -1,202 +0,0 @@
-import json
-import re
-from pathlib import Path
-
-ROOT = Path(r"d:/Bisaya_Rescue")
-TARGET = ROOT / "app/src/main/assets/listening_seed.json"
-
-
-def tokenize(text: str) -> list[str]:
-    cleaned = re.sub(r"[?!,]", "", text)
-    cleaned = cleaned.replace("-", " ")
-    cleaned = cleaned.replace("'", " ")
-    cleaned = re.sub(r"\s+", " ", cleaned).strip()
-    return [token for token in cleaned.split(" ") if token]
-
-curriculum = {
-    1: [
-        ("Maayong buntag", "おはよう"),
-        ("Maayong hapon", "こんにちは（午後）"),
-        ("Maayong gabii", "こんばんは"),
-        ("Kumusta ka", "元気ですか？"),
-        ("Maayo ra ko", "私は元気です"),
-        ("Salamat", "ありがとう"),
-        ("Walay sapayan", "どういたしまして"),
-        ("Amping ha", "気をつけてね"),
-        ("Ayo ayo", "元気でね"),
-        ("Nalipay ko magkita nimo", "会えて嬉しいです"),
-    ],
-    2: [
-        ("Oo", "はい"),
-        ("Dili", "いいえ"),
-        ("Wala", "ありません"),
-        ("Sige", "了解です"),
-        ("Pwede", "できます"),
-        ("Dili pwede", "できません"),
-        ("Basin siguro", "たぶんそうです"),
-        ("Maayo ra", "大丈夫です"),
-        ("Wala pa", "まだです"),
-        ("Naa pa", "まだあります"),
-    ],
-    3: [
-        ("Ako", "私"),
-        ("Ikaw", "あなた"),
-        ("Siya", "彼／彼女"),
-        ("Kami ra", "私たち（あなた抜き）"),
-        ("Kita tanan", "私たち（あなた含む）"),
-        ("Kamo tanan", "あなたたち"),
-        ("Sila tanan", "彼ら"),
-        ("Akong amigo", "私の友達"),
-        ("Imong pamilya", "あなたの家族"),
-        ("Iyang trabaho", "彼／彼女の仕事"),
-    ],
-    4: [
-        ("Kaon ta karon", "今食べよう"),
-        ("Kaon ko ug pan", "パンを食べます"),
-        ("Inom ko tubig", "水を飲みます"),
-        ("Inom ta kape", "コーヒーを飲もう"),
-        ("Tulog na ko", "もう寝ます"),
-        ("Mata na palihug", "起きてください"),
-        ("Laba ko sa sanina", "服を洗います"),
-        ("Ligo ta sa dagat", "海で泳ごう"),
-        ("Lakaw ta palihug", "歩きましょう"),
-        ("Balik ko unya", "あとで戻ります"),
-    ],
-    5: [
-        ("Init kaayo diri", "ここはとても暑いです"),
-        ("Bugnaw ang tubig", "水が冷たいです"),
-        ("Dako kaayo ang balay", "家が大きいです"),
-        ("Gamay ra ang kwarto", "部屋が小さいです"),
-        ("Taas siya", "彼／彼女は背が高いです"),
-        ("Mubo ko", "私は背が低いです"),
-        ("Humok ang unlan", "枕が柔らかいです"),
-        ("Lig on ang lamesa", "机が丈夫です"),
-        ("Baga kaayo ang libro", "本がとても厚いです"),
-        ("Hayag ang adlaw", "陽射しが明るいです"),
-    ],
-    6: [
-        ("Gigutom ko", "お腹が空きました"),
-        ("Gikapoy ko", "疲れました"),
-        ("Giuhaw ko", "喉が渇きました"),
-        ("Nalipay ko", "嬉しいです"),
-        ("Nagool ko", "心配しています"),
-        ("Nasuko ko", "怒っています"),
-        ("Naglibog ko", "混乱しています"),
-        ("Nahadlok ko", "怖いです"),
-        ("Masakiton ko", "体調が悪いです"),
-        ("Ganahan ko mopahuway", "休みたいです"),
-    ],
-    7: [
-        ("Asa ka", "どこにいるの？"),
-        ("Ania ko sa balay", "家にいます"),
-        ("Ania ko sa opisina", "オフィスにいます"),
-        ("Asa sila karon", "みんな今どこ？"),
-        ("Ania ra siya sa gawas", "彼／彼女は外にいます"),
-        ("Tua ko sa merkado", "市場にいます"),
-        ("Anhi diri palihug", "こちらに来てください"),
-        ("Didto ko ganiha", "さっきそこにいました"),
-        ("Asa dapit ang terminal", "ターミナルはどの辺ですか？"),
-        ("Ania ta sa klase", "今授業にいます"),
-    ],
-    8: [
-        ("Akoa kini", "これは私のものです"),
-        ("Imoha kana", "それはあなたのものです"),
-        ("Iya ni Maria", "これはマリアのものです"),
-        ("Amuha ning balay", "この家は私たちのものです"),
-        ("Inyong libro ni", "これはあなたたちの本です"),
-        ("Ilaha tong sakyanan", "あの車は彼らのものです"),
-        ("Akong pitaka gikan Japan", "私の財布は日本製です"),
-        ("Imong cellphone nindot", "あなたの携帯は素敵ですね"),
-        ("Akoa ang trabaho karon", "今の仕事は私の担当です"),
-        ("Akoa ning plano", "この計画は私のものです"),
-    ],
-    9: [
-        ("Gusto ko mokaon ug sinugba", "焼き魚を食べたいです"),
-        ("Gusto ko moinom ug kape", "コーヒーを飲みたいです"),
-        ("Gusto ko moadto sa dagat", "海に行きたいです"),
-        ("Gusto ko motan aw sine", "映画を観たいです"),
-        ("Gusto ko magpahuway", "休みたいです"),
-        ("Gusto ko magtuon Bisaya", "ビサヤ語を学びたいです"),
-        ("Gusto ko makigstorya nimo", "あなたと話したいです"),
-        ("Ganahan ko mokaon og mangga", "マンゴーを食べたいです"),
-        ("Ganahan ko muadto Japan", "日本に行きたいです"),
-        ("Gusto ko makatulog sayo", "早く寝たいです"),
-    ],
-    10: [
-        ("Uli na ko", "もう帰ります"),
-        ("Lakaw na ta", "行きましょう"),
-        ("Balik ko unya", "あとで戻ります"),
-        ("Moadto ko sa trabaho", "仕事に行きます"),
-        ("Moanha ko didto", "あそこへ行きます"),
-        ("Hulat sa ko diri", "ここで待っています"),
-        ("Sulod na mo", "中に入ってください"),
-        ("Gawas ta gamay", "少し外に出ましょう"),
-        ("Dali na og sakay", "早く乗ってください"),
-        ("Naug ko sa kanto", "角で降ります"),
-    ],
-    11: [
-        ("Unsa kini", "これは何ですか？"),
-        ("Unsa na imong dala", "それは何を持っていますか？"),
-        ("Kinsa ka", "あなたは誰ですか？"),
-        ("Kinsa siya", "彼／彼女は誰ですか？"),
-        ("Unsa imong pangalan", "あなたの名前は？"),
-        ("Unsa iyang trabaho", "彼／彼女の仕事は？"),
-        ("Kinsa inyong maestro", "先生は誰ですか？"),
-        ("Unsa ni nga tunog", "これはどんな音ですか？"),
-        ("Kinsa pa ang mouban", "誰が一緒に行きますか？"),
-        ("Unsa imong plano", "あなたの予定は？"),
-    ],
-    12: [
-        ("Asa dapit", "どの辺ですか？"),
-        ("Asa ka moadto", "どこへ行くのですか？"),
-        ("Asa ang tindahan", "店はどこですか？"),
-        ("Asa dapit ang hospital", "病院はどの辺ですか？"),
-        ("Kanus a ka moabot", "いつ到着しますか？"),
-        ("Kanus a ta magkita", "いつ会いましょうか？"),
-        ("Asa ka karon", "今どこにいますか？"),
-        ("Kanus a ang flight", "フライトはいつですか？"),
-        ("Asa dapit ang park", "公園はどの辺ですか？"),
-        ("Kanus a ko mulakaw", "いつ出発すればいいですか？"),
-    ],
-    13: [
-        ("Tagpila kini", "これはいくらですか？"),
-        ("Tagpila ni tanan", "全部でいくらですか？"),
-        ("Tagpila ang isa", "一ついくらですか？"),
-        ("Tagpila ang kilo", "1キロいくらですか？"),
-        ("Pwede pa mahangyo", "値引きできますか？"),
-        ("Barato ra ni", "これは安いですよ"),
-        ("Mahal kaayo ni", "これは高すぎます"),
-        ("Tagpila ang plete", "運賃はいくらですか？"),
-        ("Tagpila imong gusto", "いくらを希望しますか？"),
-        ("Last price na", "これが最終価格ですか？"),
-    ],
-    14: [
-        ("Bayad palihug", "支払いお願いします"),
-        ("Lugar lang", "ここで止めてください"),
-        ("Naog ko sa kanto", "角で降ります"),
-        ("Saka na ta", "乗りましょう"),
-        ("Hapit na ko musuod", "もうすぐ乗ります"),
-        ("Ayaw kalimot og sukli", "お釣りを忘れないで"),
-        ("Asa ang sakayan", "乗り場はどこですか？"),
-        ("Paabot ug jeep", "ジープを待ってください"),
-        ("Lingkod sa likod", "後ろに座ってください"),
-        ("Dali ra ang biyahe", "すぐ到着します"),
-    ],
-    15: [
-        ("Taga Japan ko", "私は日本から来ました"),
-        ("Ako si Ken", "私はケンです"),
-        ("Puyo ko sa Cebu", "セブに住んでいます"),
-        ("Nagtrabaho ko sa IT", "ITで働いています"),
-        ("Mahilig ko sa kanta", "歌うのが好きです"),
-        ("Ganahan ko mag travel", "旅行が好きです"),
-        ("Nagtuon ko og bisaya", "ビサヤ語を勉強中です"),
-        ("Gusto ko makaila ninyo", "皆さんと知り合いになりたいです"),
-        ("Nalipay ko makigstorya", "お話しできて嬉しいです"),
-        ("Palihug tabangi ko magpraktis", "練習を手伝ってください"),
-    ],
-    16: [
-        ("Lami kaayo", "とても美味しい"),
-        ("Gutom na ko", "お腹がすきました"),
-        ("Kaon ta sa carinderia", "食堂で食べましょう"),
-        ("Palihug og dugang sabaw", "スープを追加してください"),
-        ("Pakiluto pa gamay", 
@@ -1,399 +0,0 @@
-import json
-import re
-from pathlib import Path
-
-ROOT = Path(r"d:/Bisaya_Rescue")
-TARGET = ROOT / "app/src/main/assets/listening_seed.json"
-
-
-def tokenize(text: str) -> list[str]:
-    cleaned = re.sub(r"[?!,]", "", text)
-    cleaned = cleaned.replace("-", " ")
-    cleaned = cleaned.replace("'", " ")
-    cleaned = re.sub(r"\s+", " ", cleaned).strip()
-    return [token for token in cleaned.split(" ") if token]
-
-curriculum = {
-    1: [
-        ("Maayong buntag", "おはよう"),
-        ("Maayong adlaw", "良い一日を"),
-        ("Maayong hapon", "こんにちは"),
-        ("Maayong gabii", "こんばんは"),
-        ("Kumusta ka", "元気ですか？"),
-        ("Maayo ra ko", "私は元気です"),
-        ("Salamat", "ありがとう"),
-        ("Walay sapayan", "どういたしまして"),
-        ("Amping ha", "気をつけてね"),
-        ("Nalipay ko magkita nimo", "会えて嬉しいです"),
-    ],
-    2: [
-        ("Oo", "はい"),
-        ("Dili", "いいえ"),
-        ("Wala", "ありません"),
-        ("Sige", "了解です"),
-        ("Pwede", "できます"),
-        ("Dili pwede", "できません"),
-        ("Basin siguro", "たぶんそうです"),
-        ("Maayo ra", "大丈夫です"),
-        ("Wala pa", "まだです"),
-        ("Naa pa", "まだあります"),
-    ],
-    3: [
-        ("Ako", "私"),
-        ("Ikaw", "あなた"),
-        ("Siya", "彼／彼女"),
-        ("Kami ra", "私たち（あなた抜き）"),
-        ("Kita tanan", "私たち（あなた含む）"),
-        ("Kamo tanan", "あなたたち"),
-        ("Sila tanan", "彼ら"),
-        ("Akong amigo", "私の友達"),
-        ("Imong pamilya", "あなたの家族"),
-        ("Iyang trabaho", "彼／彼女の仕事"),
-    ],
-    4: [
-        ("Kaon ta karon", "今食べよう"),
-        ("Kaon ko ug pan", "パンを食べます"),
-        ("Inom ko tubig", "水を飲みます"),
-        ("Inom ta kape", "コーヒーを飲もう"),
-        ("Tulog na ko", "もう寝ます"),
-        ("Mata na palihug", "起きてください"),
-        ("Laba ko sa sanina", "服を洗います"),
-        ("Ligo ta sa dagat", "海で泳ごう"),
-        ("Lakaw ta palihug", "歩きましょう"),
-        ("Balik ko unya", "あとで戻ります"),
-    ],
-    5: [
-        ("Init kaayo diri", "ここはとても暑いです"),
-        ("Bugnaw ang tubig", "水が冷たいです"),
-        ("Dako kaayo ang balay", "家が大きいです"),
-        ("Gamay ra ang kwarto", "部屋が小さいです"),
-        ("Taas siya", "彼／彼女は背が高いです"),
-        ("Mubo ko", "私は背が低いです"),
-        ("Humok ang unlan", "枕が柔らかいです"),
-        ("Lig on ang lamesa", "机が丈夫です"),
-        ("Baga kaayo ang libro", "本がとても厚いです"),
-        ("Hayag ang adlaw", "陽射しが明るいです"),
-    ],
-    6: [
-        ("Gigutom ko", "お腹が空きました"),
-        ("Gikapoy ko", "疲れました"),
-        ("Giuhaw ko", "喉が渇きました"),
-        ("Nalipay ko", "嬉しいです"),
-        ("Nagool ko", "心配しています"),
-        ("Nasuko ko", "怒っています"),
-        ("Naglibog ko", "混乱しています"),
-        ("Nahadlok ko", "怖いです"),
-        ("Masakiton ko", "体調が悪いです"),
-        ("Ganahan ko mopahuway", "休みたいです"),
-    ],
-    7: [
-        ("Asa ka", "どこにいるの？"),
-        ("Ania ko sa balay", "家にいます"),
-        ("Ania ko sa opisina", "オフィスにいます"),
-        ("Asa sila karon", "みんな今どこ？"),
-        ("Ania ra siya sa gawas", "彼／彼女は外にいます"),
-        ("Tua ko sa merkado", "市場にいます"),
-        ("Anhi diri palihug", "こちらに来てください"),
-        ("Didto ko ganiha", "さっきそこにいました"),
-        ("Asa dapit ang terminal", "ターミナルはどの辺ですか？"),
-        ("Ania ta sa klase", "今授業にいます"),
-    ],
-    8: [
-        ("Akoa kini", "これは私のものです"),
-        ("Imoha kana", "それはあなたのものです"),
-        ("Iya ni Maria", "これはマリアのものです"),
-        ("Amuha ning balay", "この家は私たちのものです"),
-        ("Inyong libro ni", "これはあなたたちの本です"),
-        ("Ilaha tong sakyanan", "あの車は彼らのものです"),
-        ("Akong pitaka gikan Japan", "私の財布は日本製です"),
-        ("Imong cellphone nindot", "あなたの携帯は素敵ですね"),
-        ("Akoa ang trabaho karon", "今の仕事は私の担当です"),
-        ("Akoa ning plano", "この計画は私のものです"),
-    ],
-    9: [
-        ("Gusto ko mokaon ug sinugba", "焼き魚を食べたいです"),
-        ("Gusto ko moinom ug kape", "コーヒーを飲みたいです"),
-        ("Gusto ko moadto sa dagat", "海に行きたいです"),
-        ("Gusto ko motan aw sine", "映画を観たいです"),
-        ("Gusto ko magpahuway", "休みたいです"),
-        ("Gusto ko magtuon Bisaya", "ビサヤ語を学びたいです"),
-        ("Gusto ko makigstorya nimo", "あなたと話したいです"),
-        ("Ganahan ko mokaon og mangga", "マンゴーを食べたいです"),
-        ("Ganahan ko muadto Japan", "日本に行きたいです"),
-        ("Gusto ko makatulog sayo", "早く寝たいです"),
-    ],
-    10: [
-        ("Uli na ko", "もう帰ります"),
-        ("Lakaw na ta", "そろそろ行きましょう"),
-        ("Balik ko unya", "あとで戻ります"),
-        ("Moadto ko sa trabaho", "仕事に行きます"),
-        ("Moanha ko didto", "あそこへ行きます"),
-        ("Hulat sa ko diri", "ここで待っています"),
-        ("Sulod na mo", "中に入ってください"),
-        ("Gawas ta gamay", "少し外に出ましょう"),
-        ("Dali na og sakay", "早く乗ってください"),
-        ("Naug ko sa kanto", "角で降ります"),
-    ],
-    11: [
-        ("Unsa kini", "これは何ですか？"),
-        ("Unsa na imong dala", "それは何を持っていますか？"),
-        ("Kinsa ka", "あなたは誰ですか？"),
-        ("Kinsa siya", "彼／彼女は誰ですか？"),
-        ("Unsa imong pangalan", "あなたの名前は？"),
-        ("Unsa iyang trabaho", "彼／彼女の仕事は？"),
-        ("Kinsa inyong maestro", "先生は誰ですか？"),
-        ("Unsa ni nga tunog", "これはどんな音ですか？"),
-        ("Kinsa pa ang mouban", "誰が一緒に行きますか？"),
-        ("Unsa imong plano", "あなたの予定は？"),
-    ],
-    12: [
-        ("Asa dapit", "どの辺ですか？"),
-        ("Asa ka moadto", "どこへ行くのですか？"),
-        ("Asa ang tindahan", "店はどこですか？"),
-        ("Asa dapit ang hospital", "病院はどの辺ですか？"),
-        ("Kanus a ka moabot", "いつ到着しますか？"),
-        ("Kanus a ta magkita", "いつ会いましょうか？"),
-        ("Asa ka karon", "今どこにいますか？"),
-        ("Kanus a ang flight", "フライトはいつですか？"),
-        ("Asa dapit ang park", "公園はどの辺ですか？"),
-        ("Kanus a ko mulakaw", "いつ出発すればいいですか？"),
-    ],
-    13: [
-        ("Tagpila kini", "これはいくらですか？"),
-        ("Tagpila ni tanan", "全部でいくらですか？"),
-        ("Tagpila ang isa", "一ついくらですか？"),
-        ("Tagpila ang kilo", "1キロいくらですか？"),
-        ("Pwede pa mahangyo", "値引きできますか？"),
-        ("Barato ra ni", "これは安いですよ"),
-        ("Mahal kaayo ni", "これは高すぎます"),
-        ("Tagpila ang plete", "運賃はいくらですか？"),
-        ("Tagpila imong gusto", "いくらを希望しますか？"),
-        ("Last price na", "これが最終価格ですか？"),
-    ],
-    14: [
-        ("Bayad palihug", "支払いお願いします"),
-        ("Lugar lang", "ここで止めてください"),
-        ("Naog ko sa kanto", "角で降ります"),
-        ("Saka na ta", "乗りましょう"),
-        ("Hapit na ko musuod", "もうすぐ乗ります"),
-        ("Ayaw kalimot og sukli", "お釣りを忘れないで"),
-        ("Asa ang sakayan", "乗り場はどこですか？"),
-        ("Paabot ug jeep", "ジープを待ってください"),
-        ("Lingkod sa likod", "後ろに座ってください"),
-        ("Dali ra ang biyahe", "すぐ到着します"),
-    ],
-    15: [
-        ("Taga Japan ko", "私は日本から来ました"),
-        ("Ako si Ken", "私はケンです"),
-        ("Puyo ko sa Cebu", "セブに住んでいます"),
-        ("Nagtrabaho ko sa IT", "ITで働いています"),
-        ("Mahilig ko sa kanta", "歌うのが好きです"),
-        ("Ganahan ko mag travel", "旅行が好きです"),
-        ("Nagtuon ko og Bisaya", "ビサヤ語を勉強中です"),
-        ("Gusto ko makaila ninyo", "皆さんと知り合いになりたいです"),
-        ("Nalipay ko makigstorya", "お話しできて嬉しいです"),
-        ("Palihug tabangi ko magpraktis", "練習を手伝ってください"),
-    ],
-    16: [
-        ("Lami kaayo", "とても美味しいです"),
-        ("Gutom na ko", "お腹がすきました"),
-        ("Kaon ta sa carinderia", "食堂で食べましょう"),
-        ("Palihug og dugang sabaw", "スープを追加してください"),
-        ("Pakiluto pa gamay", "もう少し火を通してください"),
-        ("Busog na ko", "お腹いっぱいです"),
-        ("Tilawi ni", "これを味見してみて"),
-        ("Palihug ihatag ang kutsara", "スプーンを渡してください"),
-        ("Timplahi gamayng asin", "塩を少し加えてください"),
-        ("Paborito nako ang sinugba", "焼き料理が大好きです"),
-    ],
-    17: [
-        ("Nalipay ko", "嬉しいです"),
-        ("Nagool ko", "心配しています"),
-        ("Nasuko siya", "彼は怒っています"),
-        ("Nahadlok ko", "怖いです"),
-        ("Naglibog ko", "混乱しています"),
-        ("Nalingaw ko", "楽しんでいます"),
-        ("Naulaw ko", "恥ずかしいです"),
-        ("Naglagot ko sa trapik", "渋滞にイライラしています"),
-        ("Nalipay ko nga naa ka", "あなたがいて嬉しいです"),
-        ("Nagpahulay ko para dili kapoy", "疲れないように休んでいます"),
-    ],
-    18: [
-        ("Init kaayo karon", "今日はとても暑い"),
-        ("Bugnaw ang hangin", "風が涼しいです"),
-        ("Nag uwan pag ayo", "土砂降りです"),
-        ("Walay adlaw karon", "今日は日が出ていない"),
-        ("Kusog ang hangin", "風が強い"),
-        ("Mahangin sa buntag", "朝は風が強い"),
-        ("Ting init na", "もう夏です"),
-        ("Ting ulan na pud", "また雨季になりました"),
-        ("Lapok ang dalan", "道がぬかるんでいます"),
-        ("Humok ang panganod", "雲が柔らかそうです"),
-    ],
-    19: [
-        ("Naa kay change", "お釣りありますか？"),
-        ("Palihug og sukli", "お釣りをください"),
-        ("Pila tanan", "全部でいくらですか？"),
-        ("Pwede ko mobayad ug GCash", "GCashで払ってもいいですか？"),
-        ("Asa ang cash register", "レジはどこですか？"),
-        ("Palit ko ani duha", "これを二つ買います"),
-        ("Wala moy mas barato", "もっと安いのはありますか？"),
-        ("Testingan nako ni", "これを試してみます"),
-        ("Salamat sa inyong serbisyo", "サービスをありがとう"),
-        ("Balik ko ugma", "また明日来ます"),
-    ],
-    20: [
-        ("Magkita ta unya", "また後で会いましょう"),
-        ("Amping sa biyahe", "道中気をつけて"),
-        ("Huwat ko sa imong chat", "メッセージを待っています"),
-        ("Tawagi ko puhon", "また電話してね"),
-        ("Mag amping kanunay", "いつも気をつけてね"),
-        ("Kita kits", "またね"),
-        ("Dali ra ta magbalik", "すぐ戻ってきます"),
-        ("Daghang salamat ug ayo ayo", "本当にありがとう、元気でね"),
-        ("Ayo ayo sa imong lakaw", "行ってらっしゃい"),
-        ("Tan awa ta sunod semana", "来週また会いましょう"),
-    ],
-    21: [
-        ("Magluto ko ug panihapon", "夕食を作るつもりです"),
-        ("Magtuon ko sa gabii", "夜に勉強します"),
-        ("Magtrabaho ko ug maayo", "しっかり働くつもりです"),
-        ("Maglimpyo ko sa kwarto", "部屋を掃除するつもりです"),
-        ("Magpraktis ko og kanta", "歌の練習をするつもりです"),
-        ("Magbasa ko ug libro", "本を読むつもりです"),
-        ("Magpahuway ko sa Domingo", "日曜日に休むつもりです"),
-        ("Magbisita ko sa akong lola", "祖母を訪ねるつもりです"),
-        ("Magdula ko ug badminton", "バドミントンをするつもりです"),
-        ("Magampo ko kada gabii", "毎晩祈るつもりです"),
-    ],
-    22: [
-        ("Ugma puhon mag jogging ko", "明日はジョギングします"),
-        ("Ugma sa buntag magluto ko", "明日の朝料理します"),
-        ("Ugma sa hapon muadto ko sa mall", "明日の午後モールへ行きます"),
-        ("Sa sunod semana mouli ko", "来週帰ります"),
-        ("Sa sunod adlaw mag haircut ko", "明後日髪を切ります"),
-        ("Sa sunod bulan magsugod ang klase", "来月授業が始まります"),
-        ("Sa sunod tuig mag travel ko", "来年旅行します"),
-        ("Ugma sa udto magkita ta", "明日の昼会いましょう"),
-        ("Sa sunod weekend mag beach mi", "次の週末海に行きます"),
-        ("Ugma sa gabii magtan aw kog sine", "明日の夜映画を観ます"),
-    ],
-    23: [
-        ("Mangaon ta sa karinderya", "食堂で食べよう"),
-        ("Muli na ta", "帰ろう"),
-        ("Manan aw ta og sine", "映画を観に行こう"),
-        ("Maglakaw ta sa baybayon", "海辺を散歩しよう"),
-        ("Magduwa ta og cards", "カードで遊ぼう"),
-        ("Magkape ta ug istorya", "コーヒー飲んで話そう"),
-        ("Mamasyal ta sa park", "公園へ遊びに行こう"),
-        ("Magshopping ta sa downtown", "ダウンタウンで買い物しよう"),
-        ("Magpraktis ta sa kanta", "歌の練習をしよう"),
-        ("Magadto ta sa museyo", "博物館へ行こう"),
-    ],
-    24: [
-        ("Dili ko moadto ugma", "明日は行きません"),
-        ("Dili ko moinom ug kape", "コーヒーを飲みません"),
-        ("Dili ko mokaon ug tam is", "甘いものを食べません"),
-        ("Dili ko magasto daghang kwarta", "お金をたくさん使いません"),
-        ("Dili ko mosayaw sa party", "パーティーで踊りません"),
-        ("Dili ko mo travel karong bulan", "今月は旅行しません"),
-        ("Dili ko magbyahe kung ulan", "雨のときは出かけません"),
-        ("Dili ko magdula karong gabii", "今夜は遊びません"),
-        ("Dili ko mosugot ana", "それには同意しません"),
-        ("Dili ko molingkod kung hugaw", "汚れているときは座りません"),
-    ],
-    25: [
-        ("Kanus a ka moabot", "いつ着きますか？"),
-        ("Kanus a ta magkita", "いつ会いましょうか？"),
-        ("Kanus a ang party magsugod", "パーティーはいつ始まりますか？"),
-        ("Kanus a ka mouli", "いつ帰りますか？"),
-        ("Kanus a mahuman ang pelikula", "映画はいつ終わりますか？"),
-        ("Kanus a ka mosugot", "いつ同意しますか？"),
-        ("Kanus a mo open ang tindahan", "店はいつ開きますか？"),
-        ("Kanus a ka mosulod sa opisina", "いつオフィスに来ますか？"),
-        ("Kanus a moabot ang jeep", "ジープはいつ来ますか？"),
-        ("Kanus a ka moadto sa Cebu", "いつセブへ行きますか？"),
-    ],
-    26: [
-        ("Nikaon na ko", "もう食べました"),
-        ("Niabot na siya", "彼は到着しました"),
-        ("Nipalit ko ug prutas gahapon", "昨日果物を買いました"),
-        ("Nimisita sila sa amo", "彼らは家に来ました"),
-        ("Nisulat ko og sulat", "手紙を書きました"),
-        ("Nibasa siya ug libro", "彼女は本を読みました"),
-        ("Nidula mi og basketball", "バスケをしました"),
-        ("Nipaligo ko sa dagat", "海で泳ぎました"),
-        ("Nitukar siya og gitara", "彼はギターを弾きました"),
-        ("Nihimo ko og kape", "コーヒーを作りました"),
-    ],
-    27: [
-        ("Gahapon sa buntag nag jogging ko", "昨日の朝ジョギングしました"),
-        ("Gahapon sa hapon nag study ko", "昨日の午後勉強しました"),
-        ("Gahapon gabii nag movie ko", "昨夜映画を観ました"),
-        ("Ganina buntag nikaon ko", "さっき朝食を食べました"),
-        ("Ganina lang nahuman ang meeting", "さっき会議が終わりました"),
-        ("Ganina sa udto nag lunch mi", "さっき昼食を取りました"),
-        ("Gahapon ngadto sa park naglakaw ko", "昨日公園を散歩しました"),
-        ("Ganina sa opisina nag trabaho ko", "さっきオフィスで働きました"),
-        ("Gahapon gabii nag guitar siya", "昨夜彼はギターを弾きました"),
-        ("Ganina buntag nagtanom ko", "今朝植木をしました"),
-    ],
-    28: [
-        ("Humana ko sa trabaho", "仕事は終わりました"),
-        ("Humana na ang report", "報告書は終わりました"),
-        ("Humana sila ug luto", "彼らは料理を終えました"),
-        ("Humana ko og laba", "洗濯を終えました"),
-        ("Humana ang meeting", "会議が終わりました"),
-        ("Wala pa ko mahuman og basa", "読み終えていません"),
-        ("Wala pa sila nakaabot", "まだ到着していません"),
-        ("Wala pa mi nakabayad", "まだ支払っていません"),
-        ("Wala pa ko nakaluto", "まだ料理していません"),
-        ("Wala pa mahuman ang proyekto", "プロジェクトはまだ終わっていません"),
-    ],
-    29: [
-        ("Wala ko kabalo", "知りませんでした"),
-        ("Wala ko nipalit", "買いませんでした"),
-        ("Wala ko nakaadto", "行きませんでした"),
-        ("Wala siya miadto sa klase", "彼は授業に行きませんでした"),
-        ("Wala mi nakadawat sa sulat", "手紙を受け取っていません"),
-        ("Wala ko nakahinumdom", "覚えていません"),
-        ("Wala ko nakainom ug tubig", "水を飲んでいません"),
-        ("Wala ko natulog sayo", "早く寝ませんでした"),
-        ("Wala siya nikaon sa panihapon", "彼女は夕食を食べませんでした"),
-        ("Wala mi nakahuman sa dula", "試合を最後までできませんでした"),
-    ],
-    30: [
-        ("Nakaadto na ka sa Cebu", "セブへ行ったことありますか？"),
-        ("Nakaon na ka ug durian", "ドリアンを食べたことありますか？"),
-        ("Nakasulay ka og zipline", "ジップラインに乗ったことありますか？"),
-        ("Nakakita ka sa Chocolate Hills", "チョコレートヒルズを見たことありますか？"),
-        ("Nakasuroy mi sa Bohol", "私たちはボホールへ行ったことがあります"),
-        ("Nakaapil ko sa Sinulog", "シヌログ祭に参加したことがあります"),
-        ("Nakaadto ko sa Camiguin", "カミギンに行ったことがあります"),
-        ("Nakatrabaho siya sa gawas nasud", "彼は海外で働いたことがあります"),
-        ("Nakadula sila og professional basketball", "彼らはプロのバスケをしたことがあります"),
-        ("Nakatilaw ko ug kinilaw", "キニラウを食べたことがあります"),
-    ],
-}
-
-records = []
-serial = 0
-for level in range(1, 31):
-    items = curriculum[level]
-    if len(items) != 10:
-        raise ValueError(f"Level {level} does not have exactly 10 items")
-    for native, translation in items:
-        serial += 1
-        records.append({
-            "id": serial,
-            "level": level,
-            "native": native,
-            "translation": translation,
-            "words": tokenize(native)
-        })
-
-TARGET.parent.mkdir(parents=True, exist_ok=True)
-with TARGET.open("w", encoding="utf-8") as f:
-    json.dump(records, f, ensure_ascii=False, indent=2)
-
-print(f"Wrote {len(records)} entries to {TARGET}")
@@ -0,0 +1,100 @@
+"""Write one serialized asset to several flavor source sets.
+
+The payload is serialized once by the caller. Targets whose content already
+matches are left untouched, so their mtimes stay put and Gradle's incremental
+asset merge does not see a change. The first stale target is written from the
+buffer; the others are then materialized from it by mode:
+
+    clone  copy-on-write reflink where the filesystem supports it (falls back to write); the default
+    write  write the same buffer again
+    link   hard-link to the first target (falls back to clone, then write)
+
+Hard links are opt-in: linked targets share one inode, so an in-place edit
+of one flavor's copy (an editor, a git checkout that rewrites in place)
+silently changes every other flavor too.
+
+Every target is replaced atomically through a temporary file next to it.
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+from typing import Iterable
+
+MODES = ("clone", "write", "link")
+_FICLONE = 0x40049409  # Linux ioctl: share extents with another file
+
+
+def _same_content(path: Path, data: bytes, digest: str) -> bool:
+    try:
+        if path.stat().st_size != len(data):
+            return False
+        return hashlib.sha256(path.read_bytes()).hexdigest() == digest
+    except FileNotFoundError:
+        return False
+
+
+def _tmp_path(path: Path) -> Path:
+    return path.with_name(f".{path.name}.tmp")
+
+
+def _write(path: Path, data: bytes) -> None:
+    tmp_path = _tmp_path(path)
+    with open(tmp_path, "wb") as handle:
+        handle.write(data)
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(tmp_path, path)
+
+
+def _link(source: Path, path: Path) -> None:
+    tmp_path = _tmp_path(path)
+    tmp_path.unlink(missing_ok=True)
+    os.link(source, tmp_path)
+    os.replace(tmp_path, path)
+
+
+def _clone(source: Path, path: Path) -> None:
+    import fcntl
+
+    tmp_path = _tmp_path(path)
+    try:
+        with open(source, "rb") as src, open(tmp_path, "wb") as dst:
+            fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    os.replace(tmp_path, path)
+
+
+def emit(data: bytes, paths: Iterable[Path], mode: str = "clone") -> list[tuple[Path, str]]:
+    """Materialize data at every path; return (path, action) with action in
+    unchanged / written / linked / cloned."""
+    if mode not in MODES:
+        raise ValueError(f"Unknown emit mode {mode!r}; expected one of {', '.join(MODES)}")
+    digest = hashlib.sha256(data).hexdigest()
+    results = []
+    primary: Path | None = None
+    for path in (Path(path) for path in paths):
+        if _same_content(path, data, digest):
+            primary = primary or path
+            results.append((path, "unchanged"))
+            continue
+        path.parent.mkdir(parents=True, exist_ok=True)
+        action = "written"
+        if primary is not None and mode in ("link", "clone"):
+            attempts = [("linked", _link), ("cloned", _clone)] if mode == "link" else [("cloned", _clone)]
+            for name, materialize in attempts:
+                try:
+                    materialize(primary, path)
+                except (OSError, ImportError):
+                    continue
+                action = name
+                break
+        if action == "written":
+            _write(path, data)
+        if primary is None:
+            primary = path
+        results.append((path, action))
+    return results
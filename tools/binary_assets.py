@@ -0,0 +1,210 @@
+"""Compact binary encoding for the JSON content assets, with a reference reader.
+
+Layout (all integers are unsigned LEB128 varints unless noted):
+
+    header   magic b"BSPK", version (u8), string count, record count
+    strings  for each string: byte length, UTF-8 bytes
+    records  for each top-level array element: byte length, value
+
+A value is a one-byte tag followed by its payload:
+
+    0 null   1 false   2 true
+    3 int     zigzag varint
+    4 float   IEEE 754 double, little endian
+    5 string  index into the string table
+    6 array   element count, values
+    7 object  member count, (key string index, value) pairs
+
+Every string, keys included, is stored once in the table; the table is ordered
+by use count so the most common strings get one-byte indices. Records are
+length-prefixed so a reader can skip records without decoding them.
+"""
+from __future__ import annotations
+
+import json
+import struct
+from collections import Counter
+from pathlib import Path
+
+MAGIC = b"BSPK"
+FORMAT_VERSION = 1
+
+NULL, FALSE, TRUE, INT, FLOAT, STRING, ARRAY, OBJECT = range(8)
+_DOUBLE = struct.Struct("<d")
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data: bytes, pos: int) -> tuple[int, int]:
+    result = 0
+    shift = 0
+    while True:
+        if pos >= len(data):
+            raise ValueError(f"Truncated varint at offset {pos}")
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+def _collect_strings(value, counts: Counter) -> None:
+    if isinstance(value, str):
+        counts[value] += 1
+    elif isinstance(value, list):
+        for item in value:
+            _collect_strings(item, counts)
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            counts[key] += 1
+            _collect_strings(item, counts)
+
+
+def _encode_value(out: bytearray, value, index: dict[str, int]) -> None:
+    if value is None:
+        out.append(NULL)
+    elif value is True:
+        out.append(TRUE)
+    elif value is False:
+        out.append(FALSE)
+    elif isinstance(value, int):
+        out.append(INT)
+        _write_varint(out, value << 1 if value >= 0 else ((-value) << 1) - 1)
+    elif isinstance(value, float):
+        out.append(FLOAT)
+        out += _DOUBLE.pack(value)
+    elif isinstance(value, str):
+        out.append(STRING)
+        _write_varint(out, index[value])
+    elif isinstance(value, list):
+        out.append(ARRAY)
+        _write_varint(out, len(value))
+        for item in value:
+            _encode_value(out, item, index)
+    elif isinstance(value, dict):
+        out.append(OBJECT)
+        _write_varint(out, len(value))
+        for key, item in value.items():
+            _write_varint(out, index[key])
+            _encode_value(out, item, index)
+    else:
+        raise TypeError(f"Unsupported value type: {type(value).__name__}")
+
+
+def encode(records: list) -> bytes:
+    counts: Counter = Counter()
+    for record in records:
+        _collect_strings(record, counts)
+    strings = [text for text, _ in sorted(counts.items(), key=lambda item: (-item[1], item[0]))]
+    index = {text: position for position, text in enumerate(strings)}
+
+    out = bytearray(MAGIC)
+    out.append(FORMAT_VERSION)
+    _write_varint(out, len(strings))
+    _write_varint(out, len(records))
+    for text in strings:
+        raw = text.encode("utf-8")
+        _write_varint(out, len(raw))
+        out += raw
+    for record in records:
+        body = bytearray()
+        _encode_value(body, record, index)
+        _write_varint(out, len(body))
+        out += body
+    return bytes(out)
+
+
+def _string(strings: list[str], position: int, pos: int) -> str:
+    if position >= len(strings):
+        raise ValueError(f"String index {position} out of range at offset {pos}")
+    return strings[position]
+
+
+def _decode_value(data: bytes, pos: int, strings: list[str]):
+    if pos >= len(data):
+        raise ValueError(f"Truncated value at offset {pos}")
+    tag = data[pos]
+    pos += 1
+    if tag == NULL:
+        return None, pos
+    if tag == FALSE:
+        return False, pos
+    if tag == TRUE:
+        return True, pos
+    if tag == INT:
+        raw, pos = _read_varint(data, pos)
+        return (raw >> 1) ^ -(raw & 1), pos
+    if tag == FLOAT:
+        if pos + _DOUBLE.size > len(data):
+            raise ValueError(f"Truncated float at offset {pos}")
+        return _DOUBLE.unpack_from(data, pos)[0], pos + _DOUBLE.size
+    if tag == STRING:
+        position, next_pos = _read_varint(data, pos)
+        return _string(strings, position, pos), next_pos
+    if tag == ARRAY:
+        count, pos = _read_varint(data, pos)
+        items = []
+        for _ in range(count):
+            item, pos = _decode_value(data, pos, strings)
+            items.append(item)
+        return items, pos
+    if tag == OBJECT:
+        count, pos = _read_varint(data, pos)
+        members = {}
+        for _ in range(count):
+            position, next_pos = _read_varint(data, pos)
+            key = _string(strings, position, pos)
+            members[key], pos = _decode_value(data, next_pos, strings)
+        return members, pos
+    raise ValueError(f"Unknown tag {tag} at offset {pos - 1}")
+
+
+def decode(data: bytes) -> list:
+    """Reference reader: decode a whole file back into a list of records."""
+    if len(data) < 5 or data[:4] != MAGIC:
+        raise ValueError("Not a packed content asset")
+    if data[4] != FORMAT_VERSION:
+        raise ValueError(f"Unsupported format version {data[4]}")
+    string_count, pos = _read_varint(data, 5)
+    record_count, pos = _read_varint(data, pos)
+    strings = []
+    for _ in range(string_count):
+        length, pos = _read_varint(data, pos)
+        if pos + length > len(data):
+            raise ValueError(f"String {len(strings)} runs past the end of the data")
+        strings.append(data[pos:pos + length].decode("utf-8"))
+        pos += length
+    records = []
+    for _ in range(record_count):
+        length, pos = _read_varint(data, pos)
+        end = pos + length
+        if end > len(data):
+            raise ValueError(f"Record {len(records)} runs past the end of the data")
+        record, next_pos = _decode_value(data, pos, strings)
+        if next_pos != end:
+            raise ValueError(f"Record {len(records)} length mismatch")
+        records.append(record)
+        pos = end
+    if pos != len(data):
+        raise ValueError("Trailing bytes after last record")
+    return records
+
+
+def write_variants(asset_path: Path, minified_path: Path, binary_path: Path) -> tuple[int, int, int]:
+    """Write minified JSON and binary variants; return (source, minified, binary) sizes."""
+    raw = asset_path.read_bytes()
+    records = json.loads(raw)
+    minified = json.dumps(records, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    packed = encode(records)
+    if decode(packed) != records:
+        raise ValueError(f"Binary round trip failed for {asset_path}")
+    for path, data in ((minified_path, minified), (binary_path, packed)):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+    return len(raw), len(minified), len(packed)
@@ -0,0 +1,343 @@
+"""Incremental content build for the generated JSON assets.
+
+Every target declares the files it reads and the files it writes. The SHA-256
+of each file is recorded in a state file after a successful build, and a target
+is rebuilt only when one of its inputs changed or one of its outputs was edited
+or removed. Targets whose inputs are produced by other targets run after them.
+
+Usage:
+    python tools/content_build.py            # rebuild what changed
+    python tools/content_build.py --force    # rebuild everything
+    python tools/content_build.py --dry-run  # list stale targets only
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import time
+from dataclasses import dataclass, field
+from graphlib import TopologicalSorter
+from pathlib import Path
+from typing import Callable
+
+import binary_assets
+import generate_dojo_scenarios
+import listening_seed
+import locale_bundles
+import prebuilt_db
+import scenario_specs
+import seed_distractors
+import seed_shards
+import seed_tokenizer
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+CACHE_DIR = REPO_ROOT / ".content_build"
+STATE_PATH = CACHE_DIR / "state.json"
+STATE_VERSION = 1
+
+ASSETS_DIR = REPO_ROOT / "app" / "src" / "main" / "assets"
+VARIANTS_DIR = CACHE_DIR / "variants"
+PACKED_ASSETS = (
+    "listening_seed.json",
+    "content/listening_seed_v2.json",
+    "content/learning_content_v1.json",
+    "content/practice_items_v1.json",
+    "content/scenarios_v1.json",
+)
+TOOLS_DIR = Path(__file__).resolve().parent
+
+
+@dataclass(frozen=True)
+class Target:
+    name: str
+    inputs: tuple[Path, ...]
+    outputs: tuple[Path, ...]
+    build: Callable[[], None] = field(compare=False)
+
+
+class FileHasher:
+    """SHA-256 per file, reusing the recorded digest while size and mtime match."""
+
+    def __init__(self, stat_cache: dict[str, list]):
+        self.stat_cache = stat_cache
+
+    def digest(self, path: Path) -> str | None:
+        key = _rel(path)
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            self.stat_cache.pop(key, None)
+            return None
+        cached = self.stat_cache.get(key)
+        if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+            return cached[2]
+        digest = hashlib.sha256(path.read_bytes()).hexdigest()
+        self.stat_cache[key] = [stat.st_size, stat.st_mtime_ns, digest]
+        return digest
+
+
+class ContentBuild:
+    def __init__(self, state_path: Path = STATE_PATH):
+        self.state_path = state_path
+        self.targets: dict[str, Target] = {}
+
+    def add(self, target: Target) -> None:
+        if target.name in self.targets:
+            raise ValueError(f"Duplicate target: {target.name}")
+        self.targets[target.name] = target
+
+    def order(self) -> list[str]:
+        producers = {}
+        for target in self.targets.values():
+            for output in target.outputs:
+                if output in producers:
+                    raise ValueError(f"{_rel(output)} is produced by both {producers[output]} and {target.name}")
+                producers[output] = target.name
+        graph = {
+            target.name: {producers[path] for path in target.inputs if path in producers}
+            for target in self.targets.values()
+        }
+        return list(TopologicalSorter(graph).static_order())
+
+    def run(self, force: bool = False, dry_run: bool = False) -> list[str]:
+        state = self._load_state()
+        hasher = FileHasher(state["files"])
+        rebuilt = []
+        for name in self.order():
+            target = self.targets[name]
+            previous = state["targets"].get(name)
+            inputs = self._snapshot(hasher, target.inputs)
+            missing = [path for path, digest in inputs.items() if digest is None]
+            if missing:
+                raise FileNotFoundError(f"{name}: missing inputs {', '.join(missing)}")
+            if not force and previous is not None and previous["inputs"] == inputs \
+                    and previous["outputs"] == self._snapshot(hasher, target.outputs):
+                continue
+            rebuilt.append(name)
+            if dry_run:
+                continue
+            target.build()
+            state["targets"][name] = {
+                "inputs": inputs,
+                "outputs": self._snapshot(hasher, target.outputs),
+            }
+        if not dry_run:
+            self._save_state(state)
+        return rebuilt
+
+    @staticmethod
+    def _snapshot(hasher: FileHasher, paths: tuple[Path, ...]) -> dict[str, str | None]:
+        return {_rel(path): hasher.digest(path) for path in paths}
+
+    def _load_state(self) -> dict:
+        if self.state_path.exists():
+            state = json.loads(self.state_path.read_text(encoding="utf-8"))
+            if state.get("version") == STATE_VERSION:
+                return state
+        return {"version": STATE_VERSION, "files": {}, "targets": {}}
+
+    def _save_state(self, state: dict) -> None:
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.state_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(state, indent=1, sort_keys=True), encoding="utf-8")
+        tmp_path.replace(self.state_path)
+
+
+def _rel(path: Path) -> str:
+    try:
+        return path.resolve().relative_to(REPO_ROOT).as_posix()
+    except ValueError:
+        return path.resolve().as_posix()
+
+
+def listening_seed_target(name: str, source: Path, output: Path) -> Target:
+    def build() -> None:
+        mapping = listening_seed.load_translation_map()
+        records = listening_seed.iter_records(listening_seed.load_curriculum(source), mapping)
+        count = listening_seed.write_seed(output, records)
+        print(f"Wrote {count} entries to {_rel(output)}")
+
+    return Target(
+        name=name,
+        inputs=(
+            source,
+            listening_seed.TRANSLATION_MAP_PATH,
+            TOOLS_DIR / "listening_seed.py",
+            TOOLS_DIR / "seed_tokenizer.py",
+            TOOLS_DIR / "json_stream.py",
+        ),
+        outputs=(output,),
+        build=build,
+    )
+
+
+def scenarios_target() -> Target:
+    return Target(
+        name="scenarios",
+        inputs=(
+            generate_dojo_scenarios.TEMPLATE_PATH,
+            scenario_specs.SPECS_PATH,
+            TOOLS_DIR / "generate_dojo_scenarios.py",
+            TOOLS_DIR / "scenario_specs.py",
+            TOOLS_DIR / "scenario_templates.py",
+            TOOLS_DIR / "asset_emitter.py",
+            TOOLS_DIR / "json_stream.py",
+        ),
+        outputs=tuple(generate_dojo_scenarios.OUTPUT_PATHS),
+        build=lambda: generate_dojo_scenarios.main([]),
+    )
+
+
+def seed_shards_target(name: str, seed: Path) -> Target:
+    pack = seed.with_suffix(".levels.jsonl")
+    manifest = seed.with_suffix(".manifest.json")
+
+    def build() -> None:
+        shards = seed_shards.write_shards(seed, pack, manifest)
+        print(f"Wrote {len(shards)} level shards to {_rel(pack)}")
+
+    return Target(
+        name=name,
+        inputs=(seed, TOOLS_DIR / "seed_shards.py"),
+        outputs=(pack, manifest),
+        build=build,
+    )
+
+
+def word_index_target(name: str, seed: Path) -> Target:
+    index = seed.with_suffix(".words.json")
+
+    def build() -> None:
+        count = seed_tokenizer.write_word_index(seed, index)
+        print(f"Wrote {count} tokens to {_rel(index)}")
+
+    return Target(
+        name=name,
+        inputs=(seed, TOOLS_DIR / "seed_tokenizer.py"),
+        outputs=(index,),
+        build=build,
+    )
+
+
+def distractors_target(name: str, seed: Path) -> Target:
+    table = seed.with_suffix(".distractors.json")
+
+    def build() -> None:
+        count = seed_distractors.write_distractor_table(seed, table)
+        print(f"Wrote distractors for {count} records to {_rel(table)}")
+
+    return Target(
+        name=name,
+        inputs=(seed, TOOLS_DIR / "seed_distractors.py", TOOLS_DIR / "seed_tokenizer.py"),
+        outputs=(table,),
+        build=build,
+    )
+
+
+def asset_variants_target(relative: str) -> Target:
+    asset = ASSETS_DIR / relative
+    minified = (VARIANTS_DIR / relative).with_suffix(".min.json")
+    packed = (VARIANTS_DIR / relative).with_suffix(".bin")
+
+    def build() -> None:
+        source, minified_size, packed_size = binary_assets.write_variants(asset, minified, packed)
+        print(f"Packed {relative}: {source} -> {minified_size} bytes minified, {packed_size} bytes binary")
+
+    return Target(
+        name=f"variants:{relative}",
+        inputs=(asset, TOOLS_DIR / "binary_assets.py"),
+        outputs=(minified, packed),
+        build=build,
+    )
+
+
+def locale_bundle_target(locale: str) -> Target:
+    side_files = () if locale in locale_bundles.INLINE_LOCALES else (locale_bundles.side_file_path(locale),)
+
+    def build() -> None:
+        bundle_bytes, full_bytes = locale_bundles.write_bundle(locale)
+        print(f"Bundled {locale}: {bundle_bytes} bytes (all locales inline: {full_bytes} bytes)")
+
+    return Target(
+        name=f"bundle:{locale}",
+        inputs=(
+            *(ASSETS_DIR / relative for relative in locale_bundles.LOCALIZED_ASSETS),
+            *side_files,
+            TOOLS_DIR / "locale_bundles.py",
+        ),
+        outputs=tuple(locale_bundles.bundle_paths(locale)),
+        build=build,
+    )
+
+
+def prebuilt_db_target() -> Target:
+    def build() -> None:
+        action, manifest = prebuilt_db.write_database()
+        print(f"{action.capitalize()} {_rel(prebuilt_db.OUTPUT_PATH)} ({manifest['questions']} questions)")
+
+    return Target(
+        name="prebuilt_db",
+        inputs=(
+            prebuilt_db.SEED_PATH,
+            *prebuilt_db.ENTITY_SOURCES,
+            prebuilt_db.DATABASE_SOURCE,
+            TOOLS_DIR / "prebuilt_db.py",
+        ),
+        outputs=(prebuilt_db.OUTPUT_PATH,),
+        build=build,
+    )
+
+
+def default_build() -> ContentBuild:
+    build = ContentBuild()
+    build.add(listening_seed_target(
+        "listening_seed",
+        listening_seed.CURRICULUM_DIR / "listening_seed.json",
+        ASSETS_DIR / "listening_seed.json",
+    ))
+    build.add(listening_seed_target(
+        "listening_seed_v2",
+        listening_seed.CURRICULUM_DIR / "listening_seed_v2.json",
+        ASSETS_DIR / "content" / "listening_seed_v2.json",
+    ))
+    build.add(seed_shards_target(
+        "listening_seed_v2_shards",
+        ASSETS_DIR / "content" / "listening_seed_v2.json",
+    ))
+    build.add(word_index_target(
+        "listening_seed_v2_words",
+        ASSETS_DIR / "content" / "listening_seed_v2.json",
+    ))
+    build.add(distractors_target(
+        "listening_seed_v2_distractors",
+        ASSETS_DIR / "content" / "listening_seed_v2.json",
+    ))
+    build.add(scenarios_target())
+    build.add(prebuilt_db_target())
+    for relative in PACKED_ASSETS:
+        build.add(asset_variants_target(relative))
+    for locale in locale_bundles.available_locales():
+        build.add(locale_bundle_target(locale))
+    return build
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--force", action="store_true", help="rebuild every target")
+    parser.add_argument("--dry-run", action="store_true", help="report stale targets without building")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    rebuilt = default_build().run(force=args.force, dry_run=args.dry_run)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    if not rebuilt:
+        print(f"Content up to date ({elapsed_ms:.1f} ms)")
+    elif args.dry_run:
+        print(f"Stale targets: {', '.join(rebuilt)}")
+    else:
+        print(f"Rebuilt {', '.join(rebuilt)} in {elapsed_ms:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
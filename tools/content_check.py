@@ -0,0 +1,206 @@
+"""Cross-check the content assets against each other and the Kotlin fallbacks.
+
+Every item from the learning, practice and listening assets and from the
+hardcoded DojoContent fallback in ScenarioRepository.kt is indexed by id and
+by folded phrase (see translation_match.fold), and the checks join those
+indexes with dictionaries, so each one is linear in the number of items.
+
+Errors:   duplicate ids within an asset; dojo fallbacks whose text drifted from
+          the generated scenarios, or ids present on only one side.
+Warnings: the same phrase under several ids of one asset; a phrase whose
+          meaning differs between assets; ids whose phrase differs between
+          the two listening seeds.
+
+Usage:
+    python tools/content_check.py [--json]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+from collections import defaultdict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Iterable, NamedTuple
+
+from kotlin_literals import DEFAULT_ROOT, extract, kotlin_files
+from translation_match import fold
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+ASSETS_DIR = REPO_ROOT / "app" / "src" / "main" / "assets"
+PHRASE_ASSETS = {
+    "listening_seed": ASSETS_DIR / "listening_seed.json",
+    "listening_seed_v2": ASSETS_DIR / "content" / "listening_seed_v2.json",
+    "learning_content": ASSETS_DIR / "content" / "learning_content_v1.json",
+    "practice_items": ASSETS_DIR / "content" / "practice_items_v1.json",
+}
+SCENARIOS_PATH = ASSETS_DIR / "content" / "scenarios_v1.json"
+# DojoContent constructor parameter -> (scenario field, language)
+DOJO_FIELDS = {
+    "titleJa": ("title", "ja"),
+    "titleEn": ("title", "en"),
+    "situationJa": ("situation", "ja"),
+    "situationEn": ("situation", "en"),
+    "goalJa": ("goal", "ja"),
+    "goalEn": ("goal", "en"),
+}
+
+
+class Item(NamedTuple):
+    source: str
+    id: str
+    phrase: str
+    meanings: dict
+
+
+@dataclass
+class Finding:
+    level: str  # error | warning
+    check: str
+    message: str
+
+
+def load_phrase_items(name: str, path: Path) -> list[Item]:
+    items = []
+    for record in json.loads(path.read_text(encoding="utf-8")):
+        meanings = {
+            lang: value.get("meaning", "")
+            for lang, value in (record.get("translations") or {}).items()
+        }
+        items.append(Item(name, str(record["id"]), record.get("native") or record.get("ceb") or "", meanings))
+    return items
+
+
+def scenario_fields(path: Path = SCENARIOS_PATH) -> dict[str, dict[tuple[str, str], str]]:
+    """dojo id -> {(field, lang): text} for the title/situation/goal of every scenario."""
+    fields = {}
+    for entry in json.loads(path.read_text(encoding="utf-8")):
+        context = entry.get("context", {})
+        values = {}
+        for field, lang in DOJO_FIELDS.values():
+            source = entry.get(field) if field == "title" else context.get(field)
+            values[(field, lang)] = (source or {}).get(lang, "")
+        fields[entry["id"]] = values
+    return fields
+
+
+def kotlin_dojo_fallbacks(root: Path = DEFAULT_ROOT) -> dict[str, tuple[str, dict[str, str]]]:
+    """dojo id -> (file:line, DojoContent arguments); the list position gives the number."""
+    calls = extract(kotlin_files(root), {"DojoContent"})
+    return {
+        f"dojo_{position}": (f"{call.file}:{call.line}", call.args)
+        for position, call in enumerate(calls, start=1)
+    }
+
+
+def _title_body(text: str) -> str:
+    """Scenario titles are rendered as "【道場】12. body"; fallbacks carry only the body."""
+    head, _, body = text.partition(". ")
+    return body if body and head[-1:].isdigit() else text
+
+
+def check_ids(items_by_source: dict[str, list[Item]]) -> Iterable[Finding]:
+    for source, items in items_by_source.items():
+        seen: dict[str, int] = defaultdict(int)
+        for item in items:
+            seen[item.id] += 1
+        for item_id, count in seen.items():
+            if count > 1:
+                yield Finding("error", "duplicate-id", f"{source}: id {item_id} appears {count} times")
+
+
+def check_phrases(items_by_source: dict[str, list[Item]]) -> Iterable[Finding]:
+    by_phrase: dict[str, list[Item]] = defaultdict(list)
+    for items in items_by_source.values():
+        for item in items:
+            key = fold(item.phrase)
+            if key:
+                by_phrase[key].append(item)
+    for group in by_phrase.values():
+        if len(group) < 2:
+            continue
+        per_source: dict[str, list[str]] = defaultdict(list)
+        for item in group:
+            per_source[item.source].append(item.id)
+        for source, ids in per_source.items():
+            if len(ids) > 1:
+                yield Finding(
+                    "warning", "duplicate-phrase",
+                    f"{source}: '{group[0].phrase}' under ids {', '.join(ids)}",
+                )
+        for lang in sorted({lang for item in group for lang in item.meanings}):
+            meanings: dict[str, list[str]] = defaultdict(list)
+            for item in group:
+                meaning = item.meanings.get(lang, "").strip()
+                if meaning:
+                    meanings[fold(meaning)].append(f"{item.source}#{item.id}={meaning}")
+            if len(meanings) > 1:
+                variants = "; ".join(places[0] for places in meanings.values())
+                yield Finding("warning", "meaning-drift", f"'{group[0].phrase}' ({lang}): {variants}")
+
+
+def check_seed_versions(legacy: list[Item], current: list[Item]) -> Iterable[Finding]:
+    current_by_id = {item.id: item for item in current}
+    for item in legacy:
+        other = current_by_id.get(item.id)
+        if other is not None and fold(other.phrase) != fold(item.phrase):
+            yield Finding(
+                "warning", "seed-drift",
+                f"id {item.id}: listening_seed '{item.phrase}' vs listening_seed_v2 '{other.phrase}'",
+            )
+
+
+def check_dojo(
+    fallbacks: dict[str, tuple[str, dict[str, str]]],
+    scenarios: dict[str, dict[tuple[str, str], str]],
+) -> Iterable[Finding]:
+    for dojo_id in sorted(set(fallbacks) - set(scenarios), key=lambda value: int(value.split("_")[1])):
+        yield Finding("error", "dojo-missing", f"{dojo_id} ({fallbacks[dojo_id][0]}) has no scenario in the assets")
+    for dojo_id in sorted(set(scenarios) - set(fallbacks), key=lambda value: int(value.split("_")[1])):
+        yield Finding("error", "dojo-missing", f"{dojo_id} has no DojoContent fallback")
+    for dojo_id, (where, args) in fallbacks.items():
+        expected = scenarios.get(dojo_id)
+        if expected is None:
+            continue
+        for parameter, key in DOJO_FIELDS.items():
+            asset_text = expected[key]
+            if key[0] == "title":
+                asset_text = _title_body(asset_text)
+            fallback_text = args.get(parameter, "")
+            if fold(fallback_text) != fold(asset_text):
+                yield Finding(
+                    "error", "dojo-drift",
+                    f"{dojo_id} {parameter} ({where}): fallback '{fallback_text}' vs asset '{asset_text}'",
+                )
+
+
+def run_checks() -> list[Finding]:
+    items = {name: load_phrase_items(name, path) for name, path in PHRASE_ASSETS.items()}
+    findings = [
+        *check_ids(items),
+        *check_phrases(items),
+        *check_seed_versions(items["listening_seed"], items["listening_seed_v2"]),
+        *check_dojo(kotlin_dojo_fallbacks(), scenario_fields()),
+    ]
+    return findings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Check content assets against each other and Kotlin fallbacks")
+    parser.add_argument("--json", action="store_true", help="print findings as JSON")
+    args = parser.parse_args()
+
+    findings = run_checks()
+    if args.json:
+        print(json.dumps([asdict(finding) for finding in findings], ensure_ascii=False, indent=2))
+    else:
+        for finding in findings:
+            print(f"{finding.level.upper()} [{finding.check}] {finding.message}")
+        errors = sum(finding.level == "error" for finding in findings)
+        print(f"{errors} errors, {len(findings) - errors} warnings")
+    if any(finding.level == "error" for finding in findings):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,257 @@
+"""Rule-based rewrite pass over the JSON content files.
+
+Rules live in content_src/rewrite_rules.json:
+
+    {"version": 1, "files": ["content_src/curriculum/*.json", ...],
+     "rules": [{"name": "...", "field": "native", "token": "bisaya",
+                "ignore_case": true, "action": "remove"}, ...]}
+
+A rule targets one field, given as a dotted path ("native", "words",
+"translations.en.meaning"), and matches either a whitespace-separated token
+("token") or a regular expression ("regex"). The action is "remove" (drop the
+token, list element or match) or "replace" (substitute "with"; regex
+replacements are literal, without backreferences). A rule may narrow the
+files it applies to with its own "files" globs.
+
+All rules for a field are compiled together: token rules into one lookup
+table, regex rules into one alternation, so every record is visited once no
+matter how many rules there are. Files are streamed record by record and are
+only replaced when a record changed; rewritten files use the two-space
+layout of the generated assets.
+
+Usage:
+    python tools/content_rewrite.py [--dry-run] [--rules PATH] [FILE ...]
+"""
+from __future__ import annotations
+
+import argparse
+import difflib
+import json
+import os
+import re
+from collections import Counter
+from dataclasses import dataclass
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Callable, Iterable, Iterator
+
+from json_stream import iter_json_file, write_json_array
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+RULES_PATH = REPO_ROOT / "content_src" / "rewrite_rules.json"
+RULES_VERSION = 1
+ACTIONS = ("remove", "replace")
+
+
+@dataclass(frozen=True)
+class Rule:
+    name: str
+    field: str
+    action: str
+    token: str | None = None
+    regex: str | None = None
+    ignore_case: bool = False
+    replacement: str = ""
+    files: tuple[str, ...] = ()
+
+    def applies_to(self, relative: str) -> bool:
+        return not self.files or any(fnmatch(relative, pattern) for pattern in self.files)
+
+
+def load_rules(path: Path = RULES_PATH) -> tuple[list[str], list[Rule]]:
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    if payload.get("version") != RULES_VERSION:
+        raise ValueError(f"{path.name}: expected version {RULES_VERSION}")
+    rules = []
+    for spec in payload["rules"]:
+        if spec.get("action") not in ACTIONS:
+            raise ValueError(f"{spec.get('name')}: action must be one of {', '.join(ACTIONS)}")
+        if ("token" in spec) == ("regex" in spec):
+            raise ValueError(f"{spec.get('name')}: give exactly one of token or regex")
+        if spec["action"] == "replace" and "with" not in spec:
+            raise ValueError(f"{spec.get('name')}: replace needs a 'with' value")
+        rules.append(Rule(
+            name=spec["name"],
+            field=spec["field"],
+            action=spec["action"],
+            token=spec.get("token"),
+            regex=spec.get("regex"),
+            ignore_case=spec.get("ignore_case", False),
+            replacement=spec.get("with", ""),
+            files=tuple(spec.get("files", ())),
+        ))
+    return payload.get("files", []), rules
+
+
+class FieldRewriter:
+    """Every rule for one field, compiled into a token table and one regex alternation."""
+
+    def __init__(self, rules: list[Rule]):
+        self.exact: dict[str, Rule] = {}
+        self.folded: dict[str, Rule] = {}
+        alternatives = []
+        self.by_group: dict[str, Rule] = {}
+        for position, rule in enumerate(rules):
+            if rule.token is not None:
+                table = self.folded if rule.ignore_case else self.exact
+                table.setdefault(rule.token.casefold() if rule.ignore_case else rule.token, rule)
+            else:
+                group = f"r{position}"
+                pattern = f"(?i:{rule.regex})" if rule.ignore_case else rule.regex
+                alternatives.append(f"(?P<{group}>{pattern})")
+                self.by_group[group] = rule
+        self.pattern = re.compile("|".join(alternatives)) if alternatives else None
+
+    def _token_rule(self, token: str) -> Rule | None:
+        return self.exact.get(token) or (self.folded.get(token.casefold()) if self.folded else None)
+
+    def _rewrite_text(self, text: str, hits: Counter) -> str:
+        if self.exact or self.folded:
+            tokens = []
+            for token in text.split(" "):
+                rule = self._token_rule(token) if token else None
+                if rule is None:
+                    tokens.append(token)
+                    continue
+                hits[rule.name] += 1
+                if rule.action == "replace":
+                    tokens.append(rule.replacement)
+            rewritten = " ".join(tokens)
+            if rewritten != text:
+                text = " ".join(rewritten.split())
+        if self.pattern is not None:
+            def substitute(match: re.Match) -> str:
+                rule = self.by_group[match.lastgroup]
+                hits[rule.name] += 1
+                return rule.replacement if rule.action == "replace" else ""
+
+            rewritten = self.pattern.sub(substitute, text)
+            if rewritten != text:
+                text = " ".join(rewritten.split())
+        return text
+
+    def rewrite(self, value, hits: Counter):
+        if isinstance(value, str):
+            return self._rewrite_text(value, hits)
+        if isinstance(value, list):
+            result = []
+            for item in value:
+                if not isinstance(item, str):
+                    result.append(item)
+                    continue
+                rule = self._token_rule(item)
+                if rule is not None:
+                    hits[rule.name] += 1
+                    if rule.action == "replace":
+                        result.append(rule.replacement)
+                    continue
+                rewritten = self._rewrite_text(item, hits) if self.pattern is not None else item
+                if rewritten:
+                    result.append(rewritten)
+            return result
+        return value
+
+
+def compile_rules(rules: Iterable[Rule]) -> Callable[[dict, Counter], bool]:
+    """One function that applies every rule to a record in place; returns whether it changed."""
+    by_field: dict[str, list[Rule]] = {}
+    for rule in rules:
+        by_field.setdefault(rule.field, []).append(rule)
+    plan = [(field.split("."), FieldRewriter(field_rules)) for field, field_rules in by_field.items()]
+
+    def apply(record: dict, hits: Counter) -> bool:
+        changed = False
+        for path, rewriter in plan:
+            parent = record
+            for key in path[:-1]:
+                parent = parent.get(key) if isinstance(parent, dict) else None
+                if parent is None:
+                    break
+            if not isinstance(parent, dict) or path[-1] not in parent:
+                continue
+            before = parent[path[-1]]
+            after = rewriter.rewrite(before, hits)
+            if after != before:
+                parent[path[-1]] = after
+                changed = True
+        return changed
+
+    return apply
+
+
+def _relative(path: Path) -> str:
+    try:
+        return path.resolve().relative_to(REPO_ROOT).as_posix()
+    except ValueError:
+        return path.as_posix()
+
+
+def rewrite_file(path: Path, apply: Callable[[dict, Counter], bool], dry_run: bool, hits: Counter) -> int:
+    """Stream one file through the rules; return the number of changed records."""
+    changed = 0
+    diffs: list[str] = []
+
+    def records() -> Iterator:
+        nonlocal changed
+        for position, record in enumerate(iter_json_file(path)):
+            before = json.dumps(record, ensure_ascii=False, indent=2) if dry_run else None
+            if isinstance(record, dict) and apply(record, hits):
+                changed += 1
+                if dry_run:
+                    label = f"{_relative(path)}#{record.get('id', position)}"
+                    after = json.dumps(record, ensure_ascii=False, indent=2)
+                    diffs.extend(difflib.unified_diff(
+                        before.splitlines(), after.splitlines(), label, label, lineterm="", n=1,
+                    ))
+            yield record
+
+    if dry_run:
+        for _ in records():
+            pass
+        for line in diffs:
+            print(line)
+        return changed
+
+    with open(path, "rb") as handle:
+        handle.seek(-1, os.SEEK_END)
+        trailing_newline = handle.read(1) == b"\n"
+    staged = path.with_name(f".{path.name}.rewrite")
+    try:
+        write_json_array(records(), [staged], indent=2, trailing_newline=trailing_newline)
+        if changed:
+            os.replace(staged, path)
+    finally:
+        staged.unlink(missing_ok=True)
+    return changed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Apply content rewrite rules in one pass")
+    parser.add_argument("files", nargs="*", type=Path, help="files to rewrite (default: the rules' file list)")
+    parser.add_argument("--rules", type=Path, default=RULES_PATH)
+    parser.add_argument("--dry-run", action="store_true", help="print a diff instead of writing")
+    args = parser.parse_args()
+
+    patterns, rules = load_rules(args.rules)
+    paths = args.files or sorted({path for pattern in patterns for path in REPO_ROOT.glob(pattern)})
+    compiled: dict[tuple[int, ...], Callable[[dict, Counter], bool]] = {}
+    hits: Counter = Counter()
+    total = 0
+    for path in paths:
+        relative = _relative(path)
+        selected = tuple(index for index, rule in enumerate(rules) if rule.applies_to(relative))
+        if not selected:
+            continue
+        if selected not in compiled:
+            compiled[selected] = compile_rules(rules[index] for index in selected)
+        changed = rewrite_file(path, compiled[selected], args.dry_run, hits)
+        total += changed
+        if changed and not args.dry_run:
+            print(f"Rewrote {changed} records in {relative}")
+    for name, count in sorted(hits.items()):
+        print(f"  {name}: {count} hits")
+    print(f"{total} records {'would change' if args.dry_run else 'changed'} in {len(paths)} files")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""Streaming JSON array writer for generated content files.
+
+Records are serialized one at a time and written to every output path in the
+same pass, so memory stays at one record regardless of file size. Each path is
+written to a temporary file next to it and renamed into place only after the
+last record, so a failure part-way through leaves the previous file intact.
+
+Indented output is byte-identical to json.dumps(records, indent=2); minified
+output matches json.dumps(records, separators=(",", ":")).
+
+iter_json_file is the matching reader: it decodes a top-level array one
+element at a time from fixed-size chunks.
+"""
+from __future__ import annotations
+
+import json
+import os
+import re
+from pathlib import Path
+from typing import Iterable, Iterator
+
+READ_CHUNK = 1 << 16
+_NUMBER_START = frozenset("-0123456789")
+_NUMBER_END = re.compile(r"[ \t\r\n,\]]")
+
+
+def iter_json_array(records: Iterable, indent: int | None = None) -> Iterator[str]:
+    if indent is None:
+        opener, separator, closer = "[", ",", "]"
+        dump_kwargs = {"separators": (",", ":")}
+        pad = ""
+    else:
+        pad = " " * indent
+        opener, separator, closer = "[\n" + pad, ",\n" + pad, "\n]"
+        dump_kwargs = {"indent": indent}
+
+    first = True
+    for record in records:
+        text = json.dumps(record, ensure_ascii=False, **dump_kwargs)
+        if pad:
+            text = text.replace("\n", "\n" + pad)
+        yield (opener if first else separator) + text
+        first = False
+    yield "[]" if first else closer
+
+
+def write_json_array(
+    records: Iterable,
+    paths: Iterable[Path],
+    indent: int | None = None,
+    trailing_newline: bool = False,
+) -> int:
+    """Stream records into every path atomically; return the number of records."""
+    targets = [Path(path) for path in paths]
+    handles = []
+    count = 0
+
+    def counted() -> Iterator:
+        nonlocal count
+        for record in records:
+            count += 1
+            yield record
+
+    try:
+        for path in targets:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f".{path.name}.tmp")
+            handles.append((open(tmp_path, "w", encoding="utf-8", newline="\n"), tmp_path, path))
+        for chunk in iter_json_array(counted(), indent):
+            for handle, _, _ in handles:
+                handle.write(chunk)
+        for handle, _, _ in handles:
+            if trailing_newline:
+                handle.write("\n")
+            handle.flush()
+            os.fsync(handle.fileno())
+            handle.close()
+        for _, tmp_path, path in handles:
+            os.replace(tmp_path, path)
+    except BaseException:
+        for handle, tmp_path, _ in handles:
+            handle.close()
+            tmp_path.unlink(missing_ok=True)
+        raise
+    return count
+
+
+def iter_json_file(path: Path, chunk_size: int = READ_CHUNK) -> Iterator:
+    """Yield the elements of the top-level JSON array in path without loading the whole file."""
+    decoder = json.JSONDecoder()
+    with open(path, encoding="utf-8") as handle:
+        buffer = ""
+        while not buffer:
+            chunk = handle.read(chunk_size)
+            buffer = chunk.lstrip("\ufeff \t\r\n")
+            if not chunk:
+                break
+        if not buffer.startswith("["):
+            raise ValueError(f"{path} does not contain a JSON array")
+        pos = 1
+        expect_value = True
+        first = True
+        eof = False
+        while True:
+            while pos < len(buffer) and buffer[pos] in " \t\r\n":
+                pos += 1
+            if pos == len(buffer):
+                if eof:
+                    raise ValueError(f"{path}: unexpected end of file")
+                more = handle.read(chunk_size)
+                eof = not more
+                buffer = buffer[pos:] + more
+                pos = 0
+                continue
+            char = buffer[pos]
+            if char == "]":
+                if expect_value and not first:
+                    raise ValueError(f"{path}: trailing ',' before ']'")
+                rest = buffer[pos + 1:]
+                while True:
+                    if rest.strip(" \t\r\n"):
+                        raise ValueError(f"{path}: unexpected data after the array")
+                    if eof:
+                        return
+                    rest = handle.read(chunk_size)
+                    eof = not rest
+            if not expect_value:
+                if char != ",":
+                    raise ValueError(f"{path}: expected ',' or ']' but found {char!r}")
+                pos += 1
+                expect_value = True
+                continue
+            if char in _NUMBER_START:
+                # a number has no closing quote or bracket: until a delimiter follows it, the
+                # next chunk may still extend it (65000 + 000000.0)
+                while not eof and not _NUMBER_END.search(buffer, pos):
+                    more = handle.read(chunk_size)
+                    eof = not more
+                    buffer = buffer[pos:] + more
+                    pos = 0
+            try:
+                value, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                more = "" if eof else handle.read(chunk_size)
+                if not more:
+                    raise
+                buffer = buffer[pos:] + more
+                pos = 0
+                continue
+            yield value
+            pos = end
+            expect_value = False
+            first = False
@@ -0,0 +1,315 @@
+"""Extract string-literal constructor calls from Kotlin sources.
+
+A small tokenizer walks each file once, skipping comments and reading
+string literals ("...", raw triple-quoted strings, escapes and $templates)
+properly. A call such as
+
+    DojoContent("空港のタクシー", "Airport Taxi", ...)
+
+is reported when every argument is a string literal (optionally named,
+`titleEn = "..."`). Positional arguments are named from the matching
+`class Name(val a: String, ...)` declaration when one is found in the scanned
+files, so reordered named arguments line up with positional ones. Every item
+carries its file, line and column.
+
+Usage:
+    python tools/kotlin_literals.py [--callee DojoContent] [--root app/src/main/java] [--out items.json]
+"""
+from __future__ import annotations
+
+import argparse
+import bisect
+import json
+import re
+import sys
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Iterable, Iterator
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_ROOT = REPO_ROOT / "app" / "src" / "main" / "java"
+
+_SIMPLE = re.compile(
+    r"""
+    (?P<space>\s+)
+    | (?P<line_comment>//[^\n]*)
+    | (?P<block_comment>/\*)
+    | (?P<raw_string>\"\"\")
+    | (?P<string>")
+    | (?P<char>'(?:\\.|[^'\\])*')
+    | (?P<ident>[A-Za-z_][A-Za-z0-9_]*|`[^`]+`)
+    | (?P<number>\d[\d_]*(?:\.\d[\d_]*)?(?:[eE][+-]?\d+)?[fFLuU]*|0[xX][0-9a-fA-F_]+[LuU]*)
+    | (?P<punct>.)
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+_ESCAPES = {"t": "\t", "b": "\b", "n": "\n", "r": "\r", "'": "'", '"': '"', "\\": "\\", "$": "$"}
+_CLASS_PARAMS = re.compile(r"(?:val|var)\s+(\w+)\s*:")
+_UNICODE_ESCAPE = re.compile(r"[0-9a-fA-F]{4}")
+
+
+class KotlinSyntaxError(ValueError):
+    pass
+
+
+@dataclass
+class Token:
+    kind: str  # ident, string, number, char, punct
+    text: str
+    offset: int
+    interpolated: bool = False
+
+
+@dataclass
+class Item:
+    file: str
+    line: int
+    column: int
+    callee: str
+    args: dict[str, str]
+    interpolated: list[str] = field(default_factory=list)
+
+
+def _skip_block_comment(source: str, pos: int) -> int:
+    depth = 1  # Kotlin block comments nest
+    pos += 2
+    while depth:
+        opener = source.find("/*", pos)
+        closer = source.find("*/", pos)
+        if closer == -1:
+            raise KotlinSyntaxError(f"Unterminated block comment at offset {pos}")
+        if opener != -1 and opener < closer:
+            depth += 1
+            pos = opener + 2
+        else:
+            depth -= 1
+            pos = closer + 2
+    return pos
+
+
+def _skip_template_expression(source: str, pos: int) -> int:
+    """pos is just after "${"; return the offset after the matching "}"."""
+    depth = 1
+    while depth:
+        match = _SIMPLE.match(source, pos)
+        if match is None:
+            raise KotlinSyntaxError(f"Unterminated string template at offset {pos}")
+        kind = match.lastgroup
+        if kind == "string":
+            _, _, pos = _read_string(source, match.start())
+            continue
+        if kind == "raw_string":
+            _, _, pos = _read_raw_string(source, match.start())
+            continue
+        if kind == "block_comment":
+            pos = _skip_block_comment(source, match.start())
+            continue
+        text = match.group()
+        depth += text == "{"
+        depth -= text == "}"
+        pos = match.end()
+    return pos
+
+
+def _read_string(source: str, start: int) -> tuple[str, bool, int]:
+    """Decode a "..." literal at start; return (value, has_templates, end offset)."""
+    parts: list[str] = []
+    interpolated = False
+    pos = start + 1
+    while True:
+        if pos >= len(source) or source[pos] == "\n":
+            raise KotlinSyntaxError(f"Unterminated string at offset {start}")
+        char = source[pos]
+        if char == '"':
+            return "".join(parts), interpolated, pos + 1
+        if char == "\\":
+            if pos + 1 >= len(source) or source[pos + 1] == "\n":
+                raise KotlinSyntaxError(f"Unterminated string at offset {start}")
+            escape = source[pos + 1]
+            if escape == "u":
+                if not _UNICODE_ESCAPE.fullmatch(source, pos + 2, pos + 6):
+                    raise KotlinSyntaxError(f"Malformed \\u escape at offset {pos}")
+                parts.append(chr(int(source[pos + 2:pos + 6], 16)))
+                pos += 6
+            else:
+                parts.append(_ESCAPES.get(escape, escape))
+                pos += 2
+            continue
+        if char == "$" and source.startswith("${", pos):
+            end = _skip_template_expression(source, pos + 2)
+            parts.append(source[pos:end])
+            interpolated = True
+            pos = end
+            continue
+        if char == "$" and pos + 1 < len(source) and (source[pos + 1].isalpha() or source[pos + 1] == "_"):
+            interpolated = True
+        parts.append(char)
+        pos += 1
+
+
+def _read_raw_string(source: str, start: int) -> tuple[str, bool, int]:
+    pos = start + 3
+    parts: list[str] = []
+    interpolated = False
+    while True:
+        end = source.find('"""', pos)
+        template = source.find("${", pos)
+        if end == -1:
+            raise KotlinSyntaxError(f"Unterminated raw string at offset {start}")
+        if template != -1 and template < end:
+            close = _skip_template_expression(source, template + 2)
+            parts.append(source[pos:close])
+            interpolated = True
+            pos = close
+            continue
+        # a raw string may end with extra quotes: """a""""
+        while source.startswith('"', end + 3):
+            end += 1
+        text = source[pos:end]
+        parts.append(text)
+        interpolated = interpolated or re.search(r"\$[A-Za-z_]", text) is not None
+        return "".join(parts), interpolated, end + 3
+
+
+def tokenize(source: str) -> Iterator[Token]:
+    pos = 0
+    length = len(source)
+    while pos < length:
+        match = _SIMPLE.match(source, pos)
+        kind = match.lastgroup
+        if kind == "space" or kind == "line_comment":
+            pos = match.end()
+        elif kind == "block_comment":
+            pos = _skip_block_comment(source, pos)
+        elif kind == "string":
+            value, interpolated, end = _read_string(source, pos)
+            yield Token("string", value, pos, interpolated)
+            pos = end
+        elif kind == "raw_string":
+            value, interpolated, end = _read_raw_string(source, pos)
+            yield Token("string", value, pos, interpolated)
+            pos = end
+        else:
+            yield Token(kind, match.group(), pos)
+            pos = match.end()
+
+
+def _string_call(tokens: list[Token], start: int) -> tuple[list[tuple[str | None, Token]], int] | None:
+    """Parse `( arg, ... )` at tokens[start] where every argument is a string literal."""
+    args: list[tuple[str | None, Token]] = []
+    pos = start + 1
+    while True:
+        if pos >= len(tokens):
+            return None
+        token = tokens[pos]
+        if token.text == ")" and token.kind == "punct":
+            return args, pos + 1
+        name = None
+        if token.kind == "ident" and pos + 2 < len(tokens) and tokens[pos + 1].text == "=" \
+                and tokens[pos + 2].kind == "string":
+            name = token.text
+            pos += 2
+            token = tokens[pos]
+        if token.kind != "string":
+            return None
+        args.append((name, token))
+        pos += 1
+        separator = tokens[pos] if pos < len(tokens) else None
+        if separator is None or separator.kind != "punct" or separator.text not in ",)":
+            return None
+        if separator.text == ",":
+            pos += 1
+
+
+def _class_parameters(tokens: list[Token]) -> dict[str, list[str]]:
+    """Primary-constructor parameter names of every `class Name(...)` in a token stream."""
+    classes = {}
+    for index, token in enumerate(tokens[:-2]):
+        if token.text != "class" or tokens[index + 1].kind != "ident" or tokens[index + 2].text != "(":
+            continue
+        depth = 0
+        parameters = []
+        for inner in tokens[index + 2:]:
+            depth += inner.text == "("
+            depth -= inner.text == ")"
+            if depth == 0:
+                break
+            parameters.append(inner.text)
+        classes[tokens[index + 1].text] = _CLASS_PARAMS.findall(" ".join(parameters) + " ")
+    return classes
+
+
+def scan_file(path: Path, callees: set[str] | None = None) -> tuple[list[tuple], dict[str, list[str]]]:
+    """Raw (callee, line, column, args) calls and class parameter lists found in one file."""
+    source = path.read_text(encoding="utf-8")
+    line_starts = [0] + [match.end() for match in re.finditer("\n", source)]
+    tokens = list(tokenize(source))
+    calls = []
+    for index, token in enumerate(tokens[:-1]):
+        if token.kind != "ident" or tokens[index + 1].text != "(":
+            continue
+        if callees is not None and token.text not in callees:
+            continue
+        if callees is None and not token.text[:1].isupper():
+            continue
+        if index and tokens[index - 1].text in ("class", "fun", "."):
+            continue
+        parsed = _string_call(tokens, index + 1)
+        if parsed is None or not parsed[0]:
+            continue
+        line = bisect.bisect_right(line_starts, token.offset)
+        column = token.offset - line_starts[line - 1] + 1
+        calls.append((token.text, line, column, parsed[0]))
+    return calls, _class_parameters(tokens)
+
+
+def extract(paths: Iterable[Path], callees: set[str] | None = None, root: Path = REPO_ROOT) -> list[Item]:
+    raw = []
+    parameters: dict[str, list[str]] = {}
+    for path in paths:
+        calls, classes = scan_file(path, callees)
+        parameters.update(classes)
+        raw.extend((path, call) for call in calls)
+    items = []
+    for path, (callee, line, column, args) in raw:
+        names = parameters.get(callee, [])
+        values = {}
+        interpolated = []
+        for position, (name, token) in enumerate(args):
+            key = name or (names[position] if position < len(names) else str(position))
+            values[key] = token.text
+            if token.interpolated:
+                interpolated.append(key)
+        try:
+            shown = path.resolve().relative_to(root).as_posix()
+        except ValueError:
+            shown = path.as_posix()
+        items.append(Item(shown, line, column, callee, values, interpolated))
+    return items
+
+
+def kotlin_files(root: Path = DEFAULT_ROOT) -> list[Path]:
+    return sorted(root.rglob("*.kt"))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Extract string-literal constructor calls from Kotlin")
+    parser.add_argument("--root", type=Path, default=DEFAULT_ROOT, help="directory scanned for .kt files")
+    parser.add_argument("--callee", action="append", help="only report calls to this name (repeatable)")
+    parser.add_argument("--out", type=Path, help="write items as JSON instead of printing them")
+    args = parser.parse_args()
+
+    items = extract(kotlin_files(args.root), set(args.callee) if args.callee else None)
+    if args.out:
+        payload = [asdict(item) for item in items]
+        args.out.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        print(f"Extracted {len(items)} items -> {args.out}")
+        return
+    for item in items:
+        fields = ", ".join(f"{key}={value!r}" for key, value in item.args.items())
+        print(f"{item.file}:{item.line}:{item.column}: {item.callee}({fields})")
+    print(f"{len(items)} items", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""HDR-style latency histogram.
+
+Values (integers, e.g. microseconds) are counted in log-linear buckets: every
+power-of-two range is split into the same number of linear sub-buckets, so
+any recorded value is reproduced within 10**-significant_digits of itself
+whatever its magnitude, in constant memory per range and O(1) per record.
+This is the bucketing scheme of HdrHistogram; percentiles report the highest
+value equivalent to the bucket, as HdrHistogram does.
+
+percentile_distribution() writes the same text layout as HdrHistogram's
+outputPercentileDistribution, so .hgrm files can be loaded by its plotter.
+"""
+from __future__ import annotations
+
+import math
+from typing import Iterator, TextIO
+
+
+class LatencyHistogram:
+    def __init__(self, significant_digits: int = 2):
+        if not 1 <= significant_digits <= 5:
+            raise ValueError("significant_digits must be between 1 and 5")
+        self.significant_digits = significant_digits
+        self.sub_bucket_bits = math.ceil(math.log2(2 * 10 ** significant_digits))
+        self.sub_bucket_count = 1 << self.sub_bucket_bits
+        self.sub_bucket_half = self.sub_bucket_count >> 1
+        self.counts: dict[int, int] = {}
+        self.total = 0
+        self.min = 0
+        self.max = 0
+        self.sum = 0
+
+    def _index(self, value: int) -> int:
+        if value < self.sub_bucket_count:
+            return value
+        shift = value.bit_length() - self.sub_bucket_bits
+        return self.sub_bucket_count + (shift - 1) * self.sub_bucket_half + (value >> shift) - self.sub_bucket_half
+
+    def _range(self, index: int) -> tuple[int, int]:
+        """Lowest and highest value counted in the bucket at index."""
+        if index < self.sub_bucket_count:
+            return index, index
+        shift, offset = divmod(index - self.sub_bucket_count, self.sub_bucket_half)
+        shift += 1
+        lowest = (offset + self.sub_bucket_half) << shift
+        return lowest, lowest + (1 << shift) - 1
+
+    def record(self, value: int, count: int = 1) -> None:
+        if value < 0:
+            raise ValueError("histogram values must be non-negative")
+        index = self._index(value)
+        self.counts[index] = self.counts.get(index, 0) + count
+        if not self.total or value < self.min:
+            self.min = value
+        self.max = max(self.max, value)
+        self.total += count
+        self.sum += value * count
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        if other.sub_bucket_bits != self.sub_bucket_bits:
+            raise ValueError("cannot merge histograms with different precision")
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        if other.total:
+            self.min = other.min if not self.total else min(self.min, other.min)
+            self.max = max(self.max, other.max)
+        self.total += other.total
+        self.sum += other.sum
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.total if self.total else 0.0
+
+    def percentile(self, percentile: float) -> int:
+        if not self.total:
+            return 0
+        wanted = max(1, math.ceil(percentile / 100 * self.total))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= wanted:
+                return min(self._range(index)[1], self.max)
+        return self.max
+
+    def _iter_percentiles(self, ticks_per_half: int) -> Iterator[tuple[int, float, int]]:
+        """(value, percentile, cumulative count) rows, halving the distance to 100% every step."""
+        buckets = sorted(self.counts)
+        position = 0
+        seen = 0
+        level = 0.0
+        while True:
+            wanted = max(1, math.ceil(level / 100 * self.total))
+            while seen < wanted:
+                seen += self.counts[buckets[position]]
+                position += 1
+            yield min(self._range(buckets[position - 1])[1], self.max), seen / self.total * 100, seen
+            if seen >= self.total:
+                return
+            step = (100 - level) / 2 / ticks_per_half if level < 100 else 0
+            level = level + step if step > 1e-12 else 100.0
+
+    def percentile_distribution(self, out: TextIO, scale: float = 1000.0, ticks_per_half: int = 5) -> None:
+        """Write an HdrHistogram-format .hgrm table; values are divided by scale (µs -> ms by default)."""
+        out.write(f"{'Value':>12} {'Percentile':>14} {'TotalCount':>10} {'1/(1-Percentile)':>14}\n\n")
+        if self.total:
+            for value, percentile, seen in self._iter_percentiles(ticks_per_half):
+                fraction = percentile / 100
+                inverse = f"{1 / (1 - fraction):14.2f}" if fraction < 1 else f"{'inf':>14}"
+                out.write(f"{value / scale:12.3f} {fraction:14.12f} {seen:10d} {inverse}\n")
+        out.write(
+            f"#[Mean    = {self.mean / scale:12.3f}, StdDeviation   = {self._stddev() / scale:12.3f}]\n"
+            f"#[Max     = {self.max / scale:12.3f}, Total count    = {self.total:12d}]\n"
+            f"#[Buckets = {len(self.counts):12d}, SubBuckets     = {self.sub_bucket_count:12d}]\n"
+        )
+
+    def _stddev(self) -> float:
+        if not self.total:
+            return 0.0
+        mean = self.mean
+        variance = 0.0
+        for index, count in self.counts.items():
+            lowest, highest = self._range(index)
+            variance += count * ((lowest + highest) / 2 - mean) ** 2
+        return math.sqrt(variance / self.total)
@@ -0,0 +1,61 @@
+"""Build listening seed records from curriculum sources and the translation map."""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from json_stream import iter_json_array, write_json_array
+from seed_tokenizer import tokenize
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+CURRICULUM_DIR = REPO_ROOT / "content_src" / "curriculum"
+TRANSLATION_MAP_PATH = REPO_ROOT / "seed_translation_map.txt"
+
+
+def load_translation_map(path: Path = TRANSLATION_MAP_PATH) -> dict[str, str]:
+    mapping = {}
+    for line in path.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if "=" not in line:
+            raise ValueError(f"Invalid mapping line: {line}")
+        ja, en = line.split("=", 1)
+        mapping[ja.strip()] = en.strip()
+    return mapping
+
+
+def load_curriculum(path: Path) -> list[dict]:
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def iter_records(curriculum: Iterable[dict], mapping: dict[str, str]) -> Iterator[dict]:
+    """Yield seed records; raises after the last record if any translation is missing."""
+    missing = []
+    for item in curriculum:
+        ja = item.get("translation", "").strip()
+        en = mapping.get(ja)
+        if not en:
+            missing.append(f"ID {item.get('id')}: '{ja}' not found in mapping")
+            continue
+        yield {
+            "id": item["id"],
+            "level": item["level"],
+            "native": item["native"],
+            "words": tokenize(item["native"]),
+            "translations": {
+                "ja": {"meaning": ja},
+                "en": {"meaning": en}
+            }
+        }
+    if missing:
+        raise ValueError("Missing translations:\n" + "\n".join(missing))
+
+
+def dumps_seed(records: Iterable[dict]) -> str:
+    return "".join(iter_json_array(records, indent=2)) + "\n"
+
+
+def write_seed(path: Path, records: Iterable[dict]) -> int:
+    return write_json_array(records, [path], indent=2, trailing_newline=True)
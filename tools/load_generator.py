@@ -0,0 +1,407 @@
+"""Open-loop load generator for the conversation and pronunciation endpoints.
+
+Learner sessions arrive as a Poisson process at --rate sessions per second,
+independent of how fast earlier sessions finish (open loop), so a slow server
+builds up a queue instead of silently lowering the offered load. Each session
+replays what ConversationRepository and PronunciationRepository send:
+
+    POST /api/roleplay/start     a scenario from scenarios_v1.json
+    POST /api/roleplay/chat      one per turn, up to the scenario's turnLimit
+    POST /api/pronounce/check    before a turn with probability --pronounce-ratio,
+                                 a multipart WAV upload for a seed phrase
+
+with exponential think time between turns. Latency is recorded per endpoint
+into HDR-style histograms (see latency_histogram). A session's first request
+is timed from its scheduled arrival, not from when it was actually sent, so
+a stalled generator or connection pool shows up as latency rather than being
+hidden (coordinated omission).
+
+Requests go through a keep-alive connection pool of --connections sockets.
+Like OkHttp's retryOnConnectionFailure, a request that fails on a reused
+connection before any response byte arrives is retried once on a new one.
+
+Usage:
+    python tools/load_generator.py --base-url http://localhost:8000 [--rate 5] [--duration 60]
+    python tools/load_generator.py --stand-in [--stand-in-latency 200] [--hgrm .content_build/load]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import ssl
+import time
+import uuid
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from latency_histogram import LatencyHistogram
+from stand_in_backend import BackgroundServer, Faults, reference_clip
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+ASSETS_DIR = REPO_ROOT / "app" / "src" / "main" / "assets"
+SCENARIOS_PATH = ASSETS_DIR / "content" / "scenarios_v1.json"
+SEED_PATH = ASSETS_DIR / "content" / "listening_seed_v2.json"
+
+DEFAULT_TURN_LIMIT = 8  # generate_dojo_scenarios' entry template
+TIMEOUT_SECONDS = 60.0  # the repositories' OkHttp timeouts
+UPLOAD_CHUNK = 16 * 1024
+PERCENTILES = (50, 95, 99)
+
+
+class RequestFailed(Exception):
+    def __init__(self, kind: str, message: str = ""):
+        super().__init__(message or kind)
+        self.kind = kind
+
+
+# ---------------------------------------------------------------------------
+# HTTP client
+
+
+@dataclass
+class Connection:
+    reader: asyncio.StreamReader
+    writer: asyncio.StreamWriter
+    reused: bool = False
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+class ConnectionPool:
+    """Keep-alive HTTP/1.1 connections to one origin, at most `size` open at a time."""
+
+    def __init__(self, base_url: str, size: int):
+        parts = urlsplit(base_url)
+        if parts.scheme not in ("http", "https"):
+            raise ValueError(f"unsupported URL scheme: {base_url}")
+        self.host = parts.hostname or "localhost"
+        self.port = parts.port or (443 if parts.scheme == "https" else 80)
+        self.ssl = ssl.create_default_context() if parts.scheme == "https" else None
+        self.prefix = parts.path.rstrip("/")
+        self.host_header = parts.netloc
+        self.slots = asyncio.Semaphore(size)
+        self.idle: list[Connection] = []
+        self.opened = 0
+
+    async def _connect(self) -> Connection:
+        reader, writer = await asyncio.open_connection(self.host, self.port, ssl=self.ssl)
+        self.opened += 1
+        return Connection(reader, writer)
+
+    async def request(
+        self, method: str, path: str, body: bytes = b"", content_type: str | None = None,
+    ) -> tuple[int, bytes, bool]:
+        """Send one request; return (status, body, retried)."""
+        async with self.slots:
+            connection = self.idle.pop() if self.idle else await self._connect()
+            retried = False
+            while True:
+                try:
+                    status, payload, keep_alive = await self._exchange(connection, method, path, body, content_type)
+                except RequestFailed as exc:
+                    connection.close()
+                    if exc.kind == "reset-before-response" and connection.reused and not retried:
+                        retried = True
+                        connection = await self._connect()
+                        continue
+                    raise
+                except BaseException:
+                    connection.close()
+                    raise
+                break
+            if keep_alive:
+                connection.reused = True
+                self.idle.append(connection)
+            else:
+                connection.close()
+            return status, payload, retried
+
+    async def _exchange(
+        self, connection: Connection, method: str, path: str, body: bytes, content_type: str | None,
+    ) -> tuple[int, bytes, bool]:
+        head = [
+            f"{method} {self.prefix}{path} HTTP/1.1",
+            f"Host: {self.host_header}",
+            "User-Agent: bisaya-load-generator",
+            "Accept-Encoding: identity",
+            f"Content-Length: {len(body)}",
+        ]
+        if content_type:
+            head.append(f"Content-Type: {content_type}")
+        writer, reader = connection.writer, connection.reader
+        try:
+            writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1"))
+            for offset in range(0, len(body), UPLOAD_CHUNK):
+                writer.write(body[offset:offset + UPLOAD_CHUNK])
+                await writer.drain()
+            await writer.drain()
+            status_line = await reader.readuntil(b"\r\n")
+        except (ConnectionError, asyncio.IncompleteReadError) as exc:
+            raise RequestFailed("reset-before-response", str(exc) or type(exc).__name__) from None
+        try:
+            status = int(status_line.split(b" ", 2)[1])
+            headers = {}
+            while (line := await reader.readuntil(b"\r\n")) != b"\r\n":
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+            if "chunked" in headers.get("transfer-encoding", "").lower():
+                parts = []
+                while size := int((await reader.readuntil(b"\r\n")).split(b";", 1)[0], 16):
+                    parts.append(await reader.readexactly(size))
+                    await reader.readexactly(2)
+                while await reader.readuntil(b"\r\n") != b"\r\n":
+                    pass
+                payload = b"".join(parts)
+            elif "content-length" in headers:
+                payload = await reader.readexactly(int(headers["content-length"]))
+            else:
+                payload = await reader.read()
+                headers["connection"] = "close"
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError, IndexError) as exc:
+            raise RequestFailed("reset-mid-response", str(exc) or type(exc).__name__) from None
+        return status, payload, headers.get("connection", "").lower() != "close"
+
+    def close(self) -> None:
+        while self.idle:
+            self.idle.pop().close()
+
+
+def multipart_body(fields: dict[str, str], files: dict[str, tuple[str, str, bytes]]) -> tuple[bytes, str]:
+    """Encode a multipart/form-data body the way OkHttp's MultipartBody.Builder does."""
+    boundary = uuid.uuid4().hex
+    parts = []
+    for name, (filename, content_type, data) in files.items():
+        parts.append(
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"; filename="{filename}"\r\n'
+            f"Content-Type: {content_type}\r\n\r\n".encode("utf-8") + data + b"\r\n"
+        )
+    for name, value in fields.items():
+        parts.append(f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n'.encode("utf-8"))
+    parts.append(f"--{boundary}--\r\n".encode("latin-1"))
+    return b"".join(parts), f"multipart/form-data; boundary={boundary}"
+
+
+# ---------------------------------------------------------------------------
+# Sessions
+
+
+@dataclass
+class Workload:
+    scenarios: list[dict]
+    phrases: list[str]
+
+    @classmethod
+    def load(cls, scenarios_path: Path = SCENARIOS_PATH, seed_path: Path = SEED_PATH) -> "Workload":
+        scenarios = json.loads(scenarios_path.read_text(encoding="utf-8"))
+        phrases = [record["native"] for record in json.loads(seed_path.read_text(encoding="utf-8"))]
+        return cls(scenarios, phrases)
+
+
+@dataclass
+class EndpointStats:
+    histogram: LatencyHistogram = field(default_factory=LatencyHistogram)
+    outcomes: Counter = field(default_factory=Counter)
+    retried: int = 0
+
+
+class LoadRun:
+    def __init__(self, pool: ConnectionPool, workload: Workload, args: argparse.Namespace, rng: random.Random):
+        self.pool = pool
+        self.workload = workload
+        self.args = args
+        self.rng = rng
+        self.stats: dict[str, EndpointStats] = {}
+        self.sessions = Counter()
+        # one recording for every upload: synthesizing per request would load the generator, not the server
+        self.audio = reference_clip("recording", args.upload_seconds)
+
+    async def call(
+        self, endpoint: str, method: str, path: str, body: bytes, content_type: str, started: float | None = None,
+    ) -> bool:
+        """Send one request and record it under endpoint; started overrides the latency start (intended time)."""
+        stats = self.stats.setdefault(endpoint, EndpointStats())
+        started = time.perf_counter() if started is None else started
+        try:
+            status, _, retried = await asyncio.wait_for(
+                self.pool.request(method, path, body, content_type), self.args.timeout,
+            )
+        except asyncio.TimeoutError:
+            stats.outcomes["timeout"] += 1
+            return False
+        except RequestFailed as exc:
+            stats.outcomes[exc.kind] += 1
+            return False
+        except OSError as exc:
+            stats.outcomes[f"connect-error:{type(exc).__name__}"] += 1
+            return False
+        stats.retried += retried
+        stats.outcomes[str(status)] += 1
+        if 200 <= status < 300:
+            stats.histogram.record(int((time.perf_counter() - started) * 1_000_000))
+            return True
+        return False
+
+    async def session(self, scheduled: float) -> None:
+        rng = self.rng
+        scenario = rng.choice(self.workload.scenarios)
+        context = scenario.get("context", {})
+        turns = context.get("turnLimit") or DEFAULT_TURN_LIMIT
+        texts = [option["text"] for option in scenario.get("starterOptions", [])] or context.get("hints") or ["Salamat"]
+        level = context.get("level", "beginner")
+        json_type = "application/json; charset=utf-8"
+        # pooled connections carry many sessions, so name ours rather than let the server key on the socket
+        session_id = uuid.uuid4().hex
+
+        start = json.dumps({"session_id": session_id, "scene_id": scenario["id"], "level": level}).encode("utf-8")
+        if not await self.call("roleplay/start", "POST", "/api/roleplay/start", start, json_type, started=scheduled):
+            self.sessions["aborted"] += 1
+            return
+        for turn in range(turns):
+            await asyncio.sleep(rng.expovariate(1 / self.args.think_time) if self.args.think_time > 0 else 0)
+            if rng.random() < self.args.pronounce_ratio:
+                body, content_type = multipart_body(
+                    {"word": rng.choice(self.workload.phrases), "level": level},
+                    {"audio": (f"recording_{turn}.wav", "audio/wav", self.audio)},
+                )
+                await self.call("pronounce/check", "POST", "/api/pronounce/check", body, content_type)
+            message = json.dumps(
+                {"session_id": session_id, "scene_id": scenario["id"], "text": texts[turn % len(texts)]},
+                ensure_ascii=False,
+            )
+            if not await self.call("roleplay/chat", "POST", "/api/roleplay/chat", message.encode("utf-8"), json_type):
+                self.sessions["aborted"] += 1
+                return
+        self.sessions["completed"] += 1
+
+    async def run(self) -> float:
+        """Offer sessions for the configured duration, then wait for the stragglers; return the wall time."""
+        tasks = set()
+        began = time.perf_counter()
+        deadline = began + self.args.duration
+        next_arrival = began
+        while True:
+            next_arrival += self.rng.expovariate(self.args.rate)
+            if next_arrival >= deadline:
+                break
+            delay = next_arrival - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self.sessions["started"] += 1
+            task = asyncio.create_task(self.session(next_arrival))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+        if tasks:
+            await asyncio.wait(tasks)
+        return time.perf_counter() - began
+
+
+# ---------------------------------------------------------------------------
+# Reporting
+
+
+def summarize(stats: dict[str, EndpointStats], wall: float) -> dict:
+    report = {}
+    total = LatencyHistogram()
+    requests = 0
+    for endpoint, endpoint_stats in sorted(stats.items()):
+        histogram = endpoint_stats.histogram
+        total.merge(histogram)
+        requests += sum(endpoint_stats.outcomes.values())
+        report[endpoint] = {
+            "requests": sum(endpoint_stats.outcomes.values()),
+            "ok": histogram.total,
+            "outcomes": dict(endpoint_stats.outcomes),
+            "retried": endpoint_stats.retried,
+            "throughput_rps": round(histogram.total / wall, 2) if wall else 0.0,
+            **{f"p{p}_ms": histogram.percentile(p) / 1000 for p in PERCENTILES},
+            "max_ms": histogram.max / 1000,
+            "mean_ms": round(histogram.mean / 1000, 3),
+        }
+    report["all"] = {
+        "requests": requests,
+        "ok": total.total,
+        "throughput_rps": round(total.total / wall, 2) if wall else 0.0,
+        **{f"p{p}_ms": total.percentile(p) / 1000 for p in PERCENTILES},
+        "max_ms": total.max / 1000,
+    }
+    return report
+
+
+def print_report(report: dict, sessions: Counter, wall: float, connections: int) -> None:
+    print(
+        f"{sessions['started']} sessions in {wall:.1f}s ({sessions['completed']} completed, "
+        f"{sessions['aborted']} aborted), {connections} connections opened"
+    )
+    header = f"{'endpoint':<18}{'ok':>7}{'failed':>8}{'rps':>9}" + "".join(f"{f'p{p} ms':>10}" for p in PERCENTILES) + f"{'max ms':>10}"
+    print(header)
+    for endpoint, row in report.items():
+        failed = row["requests"] - row["ok"]
+        print(
+            f"{endpoint:<18}{row['ok']:>7}{failed:>8}{row['throughput_rps']:>9.2f}"
+            + "".join(f"{row[f'p{p}_ms']:>10.1f}" for p in PERCENTILES)
+            + f"{row['max_ms']:>10.1f}"
+        )
+    for endpoint, row in report.items():
+        errors = {kind: count for kind, count in row.get("outcomes", {}).items() if not kind.startswith("2")}
+        if errors or row.get("retried"):
+            details = ", ".join(f"{kind}: {count}" for kind, count in sorted(errors.items()))
+            print(f"  {endpoint}: {details}{'; ' if details else ''}{row.get('retried', 0)} retried on a fresh connection")
+
+
+async def _main(args: argparse.Namespace, base_url: str) -> None:
+    pool = ConnectionPool(base_url, args.connections)
+    run = LoadRun(pool, Workload.load(), args, random.Random(args.seed))
+    try:
+        wall = await run.run()
+    finally:
+        pool.close()
+    report = summarize(run.stats, wall)
+    print_report(report, run.sessions, wall, pool.opened)
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"base_url": base_url, "wall_s": round(wall, 3), "sessions": dict(run.sessions), "endpoints": report}
+        args.json.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    if args.hgrm:
+        args.hgrm.mkdir(parents=True, exist_ok=True)
+        for endpoint, stats in run.stats.items():
+            path = args.hgrm / f"{endpoint.replace('/', '_')}.hgrm"
+            with path.open("w", encoding="utf-8") as out:
+                stats.histogram.percentile_distribution(out)
+        print(f"Wrote {len(run.stats)} histograms to {args.hgrm}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Open-loop load test of the conversation and pronunciation APIs")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--base-url", help="server to test, e.g. http://localhost:8000")
+    target.add_argument("--stand-in", action="store_true", help="start tools/stand_in_backend.py in-process")
+    parser.add_argument("--stand-in-latency", type=float, default=0.0, help="stand-in base latency in ms")
+    parser.add_argument("--stand-in-error-rate", type=float, default=0.0, help="stand-in injected 503 fraction")
+    parser.add_argument("--rate", type=float, default=2.0, help="session arrivals per second")
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds during which sessions arrive")
+    parser.add_argument("--think-time", type=float, default=1.0, help="mean seconds between turns")
+    parser.add_argument("--pronounce-ratio", type=float, default=0.3, help="chance of an upload before each turn")
+    parser.add_argument("--upload-seconds", type=float, default=2.0, help="length of the uploaded WAV")
+    parser.add_argument("--connections", type=int, default=64, help="connection pool size")
+    parser.add_argument("--timeout", type=float, default=TIMEOUT_SECONDS, help="per-request timeout in seconds")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", type=Path, help="write the report as JSON")
+    parser.add_argument("--hgrm", type=Path, help="directory for per-endpoint .hgrm percentile distributions")
+    args = parser.parse_args()
+
+    if args.stand_in:
+        # the stand-in shares this process, so keep the offered load modest when reading its numbers
+        faults = Faults(latency_ms=args.stand_in_latency, error_rate=args.stand_in_error_rate, seed=args.seed)
+        with BackgroundServer(faults) as server:
+            asyncio.run(_main(args, server.base_url))
+    else:
+        asyncio.run(_main(args, args.base_url))
+
+
+if __name__ == "__main__":
+    main()
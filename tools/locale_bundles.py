@@ -0,0 +1,142 @@
+"""Per-locale translation side files and locale-specific asset bundles.
+
+The shipped assets carry the ja and en meanings inline. Every further locale
+lives in content_src/translations/<locale>.json, keyed by asset path and then
+record id:
+
+    {"content/learning_content_v1.json": {"b1": "...", ...}, ...}
+
+A bundle for one locale is assembled on demand: each record keeps only the
+bundle locale plus the en fallback the app reads when a meaning is missing,
+so a build for one language does not carry the strings of the others.
+
+Usage:
+    python tools/locale_bundles.py export ko      # side file from the translation memory
+    python tools/locale_bundles.py bundle ko [ja ...]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+from typing import Iterable
+
+from translation_memory import TranslationMemory
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+ASSETS_DIR = REPO_ROOT / "app" / "src" / "main" / "assets"
+SIDE_FILES_DIR = REPO_ROOT / "content_src" / "translations"
+BUNDLES_DIR = REPO_ROOT / ".content_build" / "bundles"
+LOCALIZED_ASSETS = (
+    "listening_seed.json",
+    "content/listening_seed_v2.json",
+    "content/learning_content_v1.json",
+    "content/practice_items_v1.json",
+)
+INLINE_LOCALES = ("ja", "en")
+FALLBACK_LOCALE = "en"
+SOURCE_LOCALE = "ja"
+
+
+def side_file_path(locale: str) -> Path:
+    return SIDE_FILES_DIR / f"{locale}.json"
+
+
+def available_locales() -> list[str]:
+    extra = sorted(path.stem for path in SIDE_FILES_DIR.glob("*.json")) if SIDE_FILES_DIR.exists() else []
+    return [*INLINE_LOCALES, *(locale for locale in extra if locale not in INLINE_LOCALES)]
+
+
+def load_side_file(locale: str) -> dict[str, dict[str, str]]:
+    path = side_file_path(locale)
+    if locale in INLINE_LOCALES or not path.exists():
+        return {}
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def _load_asset(relative: str) -> list[dict]:
+    return json.loads((ASSETS_DIR / relative).read_text(encoding="utf-8"))
+
+
+def assemble(relative: str, locales: Iterable[str]) -> list[dict]:
+    """Records of one asset with translations limited to the given locales (plus the fallback)."""
+    keep = [*dict.fromkeys([*locales, FALLBACK_LOCALE])]
+    side = {locale: load_side_file(locale).get(relative, {}) for locale in keep}
+    records = _load_asset(relative)
+    for record in records:
+        inline = record.get("translations") or {}
+        translations = {}
+        for locale in keep:
+            if locale in inline:
+                translations[locale] = inline[locale]
+            elif str(record.get("id")) in side[locale]:
+                translations[locale] = {"meaning": side[locale][str(record["id"])]}
+        record["translations"] = translations
+    return records
+
+
+def bundle_paths(locale: str) -> list[Path]:
+    return [BUNDLES_DIR / locale / relative for relative in LOCALIZED_ASSETS]
+
+
+def write_bundle(locale: str) -> tuple[int, int]:
+    """Write the assets for one locale; return (bundle bytes, full inline-asset bytes)."""
+    bundle_bytes = 0
+    full_bytes = 0
+    for relative, path in zip(LOCALIZED_ASSETS, bundle_paths(locale)):
+        data = json.dumps(assemble(relative, [locale]), ensure_ascii=False, separators=(",", ":"))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(data, encoding="utf-8")
+        bundle_bytes += len(data.encode("utf-8"))
+        full = assemble(relative, available_locales())
+        full_bytes += len(json.dumps(full, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+    return bundle_bytes, full_bytes
+
+
+def export_side_file(locale: str, memory: TranslationMemory) -> tuple[int, int]:
+    """Fill the side file for a locale from ja -> locale entries in the translation memory.
+
+    Existing side-file entries are kept. Returns (records translated, records missing).
+    """
+    if locale in INLINE_LOCALES:
+        raise ValueError(f"{locale} is stored inline in the assets")
+    side = load_side_file(locale)
+    translated = missing = 0
+    for relative in LOCALIZED_ASSETS:
+        table = side.setdefault(relative, {})
+        for record in _load_asset(relative):
+            key = str(record["id"])
+            source = ((record.get("translations") or {}).get(SOURCE_LOCALE) or {}).get("meaning")
+            meaning = table.get(key) or (source and memory.lookup(source, SOURCE_LOCALE, locale))
+            if meaning:
+                table[key] = meaning
+                translated += 1
+            else:
+                missing += 1
+    path = side_file_path(locale)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(side, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    return translated, missing
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Locale side files and asset bundles")
+    commands = parser.add_subparsers(dest="command", required=True)
+    export_parser = commands.add_parser("export", help="write a locale side file from the translation memory")
+    export_parser.add_argument("locale")
+    bundle_parser = commands.add_parser("bundle", help="assemble asset bundles for locales")
+    bundle_parser.add_argument("locales", nargs="*", help="default: every available locale")
+    args = parser.parse_args()
+
+    if args.command == "export":
+        with TranslationMemory() as memory:
+            translated, missing = export_side_file(args.locale, memory)
+        print(f"Wrote {side_file_path(args.locale).name}: {translated} records, {missing} missing")
+        return
+    for locale in args.locales or available_locales():
+        bundle_bytes, full_bytes = write_bundle(locale)
+        print(f"{locale}: {bundle_bytes} bytes (all locales inline: {full_bytes} bytes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,450 @@
+"""Build the prepackaged Room database shipped in the app assets.
+
+The questions, questions_fts and user_progress tables are created from the
+Room entities in app/src/main/java/.../data/local (Question.kt, QuestionFts.kt,
+UserProgress.kt): columns, types, nullability, primary keys, @Entity indices
+and @Fts4 content entities are read from the Kotlin source and turned into the
+same CREATE statements (and FTS content-sync triggers) Room generates, so
+Room's schema validation accepts the file. Rows mirror what DatabaseInitializer
+inserts at first launch: QuestionSeedParser's mapping of listening_seed_v2.json
+plus one user_progress row per required level.
+
+The database is written with PRAGMA user_version set to the @Database version,
+an explicit page size, and VACUUMed. It is only copied into the assets when its
+bytes change. The entity-derived statements are also checked against the
+schema JSON Room exports for that version (app/schemas/..., written by the
+Gradle build since AppDatabase sets exportSchema = true); the build fails if
+export is off or the JSON for the current version has not been exported yet.
+
+questions_fts is an FTS4 index over the sentence and meanings (FTS5 and the
+trigram tokenizer are not available on every minSdk 24 device). Every build
+verifies it against the LIKE scan QuestionDao used before: for each token of
+the vocabulary word index, the FTS phrase query must return exactly the rows
+whose sentence contains the token as a whole word. LIKE also matches inside
+longer words ("ko" in "kolor"); those extra rows are reported, not failed.
+
+Usage:
+    python tools/prebuilt_db.py [--check] [--verify-fts]
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import re
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+
+from asset_emitter import emit
+from kotlin_literals import tokenize
+from seed_tokenizer import build_word_index
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+LOCAL_DIR = REPO_ROOT / "app" / "src" / "main" / "java" / "com" / "bisayaspeak" / "ai" / "data" / "local"
+ENTITY_SOURCES = (LOCAL_DIR / "Question.kt", LOCAL_DIR / "QuestionFts.kt", LOCAL_DIR / "UserProgress.kt")
+DATABASE_SOURCE = LOCAL_DIR / "AppDatabase.kt"
+SCHEMA_EXPORT_DIR = REPO_ROOT / "app" / "schemas" / "com.bisayaspeak.ai.data.local.AppDatabase"
+SEED_PATH = REPO_ROOT / "app" / "src" / "main" / "assets" / "content" / "listening_seed_v2.json"
+OUTPUT_PATH = REPO_ROOT / "app" / "src" / "main" / "assets" / "database" / "bisaya_speak_ai.db"
+MANIFEST_PATH = REPO_ROOT / ".content_build" / "database.json"
+
+DEFAULT_MAX_LEVEL = 35  # DatabaseInitializer.DEFAULT_MAX_LEVEL
+PAGE_SIZE = 4096  # Android's filesystem block and SQLite default page size
+AFFINITY = {
+    "Int": "INTEGER", "Long": "INTEGER", "Short": "INTEGER", "Byte": "INTEGER", "Boolean": "INTEGER",
+    "Float": "REAL", "Double": "REAL", "String": "TEXT", "ByteArray": "BLOB",
+}
+CONVERTED_AFFINITY = "TEXT"  # AppTypeConverters store maps as JSON strings
+FTS_TRIGGERS = (("BEFORE", "UPDATE"), ("BEFORE", "DELETE"), ("AFTER", "UPDATE"), ("AFTER", "INSERT"))
+# FTS4's default "simple" tokenizer: runs of ASCII letters and digits, and any non-ASCII character
+_FTS_TOKEN = re.compile(r"[A-Za-z0-9\u0080-\U0010FFFF]+")
+
+
+def _annotation_args(tokens: list, start: int) -> tuple[dict[str, str | list[str]], int]:
+    """Parse `(name = value, ...)` after an annotation; values are literals or [..] lists of literals."""
+    args: dict[str, str | list[str]] = {}
+    if start >= len(tokens) or tokens[start].text != "(":
+        return args, start
+    pos = start + 1
+    depth = 1
+    name = None
+    while depth:
+        token = tokens[pos]
+        if token.text in "([":
+            depth += 1
+        elif token.text in ")]":
+            depth -= 1
+        elif token.kind == "ident" and tokens[pos + 1].text == "=" and depth == 1:
+            name = token.text
+            pos += 1
+        elif token.kind in ("string", "ident", "number") and name is not None:
+            value = token.text
+            if depth == 1:
+                args.setdefault(name, value)  # `Question::class` keeps "Question"
+            else:
+                args.setdefault(name, [])
+                if isinstance(args[name], list) and token.kind == "string":
+                    args[name].append(value)
+        pos += 1
+    return args, pos
+
+
+def parse_entity(path: Path) -> dict:
+    """Table name, ordered columns and indices of one @Entity data class."""
+    tokens = list(tokenize(path.read_text(encoding="utf-8")))
+    entity = {"table": None, "columns": [], "primary_key": [], "autoincrement": False, "indices": [], "fts": None}
+    pos = 0
+    pending_primary: dict | None = None
+    in_constructor = False
+    depth = 0
+    while pos < len(tokens):
+        token = tokens[pos]
+        if token.text == "@" and tokens[pos + 1].text == "Entity":
+            args, pos = _annotation_args(tokens, pos + 2)
+            entity["table"] = args.get("tableName")
+            for column in args.get("indices", []) if isinstance(args.get("indices"), list) else []:
+                entity["indices"].append([column])
+            continue
+        if token.text == "@" and tokens[pos + 1].text == "Fts4":
+            args, pos = _annotation_args(tokens, pos + 2)
+            entity["fts"] = {"content": args.get("contentEntity")}
+            continue
+        if token.text == "@" and tokens[pos + 1].text == "PrimaryKey":
+            pending_primary, pos = _annotation_args(tokens, pos + 2)
+            continue
+        if token.text == "class" and entity["table"] and not in_constructor:
+            entity["class"] = tokens[pos + 1].text
+            in_constructor = True
+            pos += 3  # class Name (
+            depth = 1
+            continue
+        if in_constructor:
+            if token.text == "(":
+                depth += 1
+            elif token.text == ")":
+                depth -= 1
+                if depth == 0:
+                    break
+            elif token.text in ("val", "var") and depth == 1:
+                name = tokens[pos + 1].text
+                type_name = tokens[pos + 3].text
+                pos += 4
+                nullable = False
+                generic = 0
+                while pos < len(tokens):
+                    text = tokens[pos].text
+                    generic += text == "<"
+                    generic -= text == ">"
+                    if generic == 0 and text == "?":
+                        nullable = True
+                    if generic == 0 and text in (",", "=", ")"):
+                        break
+                    pos += 1
+                entity["columns"].append({
+                    "name": name,
+                    "affinity": AFFINITY.get(type_name, CONVERTED_AFFINITY),
+                    "not_null": not nullable,
+                })
+                if pending_primary is not None:
+                    entity["primary_key"].append(name)
+                    entity["autoincrement"] = pending_primary.get("autoGenerate") == "true"
+                    pending_primary = None
+                continue
+        pos += 1
+    if not entity["table"] or not entity["columns"]:
+        raise ValueError(f"{path.name}: no @Entity data class found")
+    return entity
+
+
+def fts_statements(entity: dict, content_table: str | None) -> list[str]:
+    """CREATE VIRTUAL TABLE plus the content-sync triggers Room generates for an @Fts4 entity."""
+    table = entity["table"]
+    columns = [column for column in entity["columns"] if column["name"] != "rowid"]
+    definitions = [
+        f"`{column['name']}` {column['affinity']}" + (" NOT NULL" if column["not_null"] else "")
+        for column in columns
+    ]
+    if content_table:
+        definitions.append(f"content=`{content_table}`")
+    statements = [f"CREATE VIRTUAL TABLE IF NOT EXISTS `{table}` USING FTS4({', '.join(definitions)})"]
+    if not content_table:
+        return statements
+    names = ", ".join(f"`{column['name']}`" for column in columns)
+    values = ", ".join(f"NEW.`{column['name']}`" for column in columns)
+    for timing, event in FTS_TRIGGERS:
+        if timing == "BEFORE":
+            body = f"DELETE FROM `{table}` WHERE `docid`=OLD.`rowid`;"
+        else:
+            body = f"INSERT INTO `{table}`(`docid`, {names}) VALUES (NEW.`rowid`, {values});"
+        statements.append(
+            f"CREATE TRIGGER IF NOT EXISTS room_fts_content_sync_{table}_{timing}_{event} "
+            f"{timing} {event} ON `{content_table}` BEGIN {body} END"
+        )
+    return statements
+
+
+def create_statements(entity: dict, tables: dict[str, str] | None = None) -> list[str]:
+    """The CREATE statements Room generates for an entity; tables maps entity classes to table names."""
+    table = entity["table"]
+    if entity["fts"] is not None:
+        content = entity["fts"]["content"]
+        return fts_statements(entity, (tables or {}).get(content, content) if content else None)
+    definitions = []
+    inline_key = entity["autoincrement"] and len(entity["primary_key"]) == 1
+    for column in entity["columns"]:
+        definition = f"`{column['name']}` {column['affinity']}"
+        if inline_key and column["name"] == entity["primary_key"][0]:
+            definition += " PRIMARY KEY AUTOINCREMENT"
+        if column["not_null"]:
+            definition += " NOT NULL"
+        definitions.append(definition)
+    if not inline_key:
+        definitions.append("PRIMARY KEY(" + ", ".join(f"`{name}`" for name in entity["primary_key"]) + ")")
+    statements = [f"CREATE TABLE IF NOT EXISTS `{table}` ({', '.join(definitions)})"]
+    for columns in entity["indices"]:
+        name = f"index_{table}_{'_'.join(columns)}"
+        statements.append(
+            f"CREATE INDEX IF NOT EXISTS `{name}` ON `{table}` ({', '.join(f'`{column}`' for column in columns)})"
+        )
+    return statements
+
+
+def database_version(path: Path = DATABASE_SOURCE) -> int:
+    match = re.search(r"@Database\([^)]*\bversion\s*=\s*(\d+)", path.read_text(encoding="utf-8"), re.S)
+    if match is None:
+        raise ValueError(f"{path.name}: no @Database version")
+    return int(match.group(1))
+
+
+def schema_hash(statements: list[str]) -> str:
+    # sqlite_master keeps statements without their IF NOT EXISTS clause
+    normalized = sorted(statement.replace(" IF NOT EXISTS", "") for statement in statements)
+    return hashlib.sha256("\n".join(normalized).encode("utf-8")).hexdigest()
+
+
+def exports_schema(path: Path = DATABASE_SOURCE) -> bool:
+    match = re.search(r"@Database\([^)]*\bexportSchema\s*=\s*(true|false)", path.read_text(encoding="utf-8"), re.S)
+    return match is None or match.group(1) == "true"  # Room's default is true
+
+
+def check_exported_schema(version: int, statements: list[str], export_dir: Path = SCHEMA_EXPORT_DIR) -> None:
+    """Compare with Room's exported schema JSON for this version; a missing export is an error."""
+    if not exports_schema(DATABASE_SOURCE):
+        raise ValueError(f"{DATABASE_SOURCE.name}: exportSchema is off, so the schema cannot be checked against Room")
+    exported = export_dir / f"{version}.json"
+    if not exported.exists():
+        raise ValueError(
+            f"No exported Room schema {exported.name} in {export_dir}; "
+            "build the app once (./gradlew :app:kspDebugKotlin) so Room writes it, then commit it"
+        )
+    bundle = json.loads(exported.read_text(encoding="utf-8"))["database"]
+    expected = []
+    for entity in bundle["entities"]:
+        table = entity["tableName"]
+        expected.append(entity["createSql"].replace("${TABLE_NAME}", table))
+        for index in entity.get("indices", []):
+            expected.append(index["createSql"].replace("${TABLE_NAME}", table))
+        expected.extend(entity.get("contentSyncTriggers", []))
+    if schema_hash(expected) != schema_hash(statements):
+        raise ValueError(f"Entity schema does not match Room's exported {exported.name}")
+
+
+def question_rows(seed_path: Path = SEED_PATH) -> list[tuple]:
+    """QuestionSeedParser's mapping: meanings fall back ja -> en -> native and vice versa."""
+    rows = []
+    for record in json.loads(seed_path.read_text(encoding="utf-8")):
+        meanings = {
+            lang: value.get("meaning") or ""
+            for lang, value in (record.get("translations") or {}).items()
+        }
+        meanings = {lang: meaning for lang, meaning in meanings.items() if meaning.strip()}
+        native = record["native"]
+        meaning_ja = meanings.get("ja") or meanings.get("en") or native
+        meaning_en = meanings.get("en") or meanings.get("ja") or native
+        translations = {}
+        if meaning_ja.strip():
+            translations["ja"] = meaning_ja
+        if meaning_en.strip():
+            translations["en"] = meaning_en
+        rows.append((
+            native,
+            meaning_ja,
+            meaning_en,
+            record["level"],
+            "LISTENING",
+            json.dumps(translations, ensure_ascii=False, separators=(",", ":")),
+        ))
+    return rows
+
+
+def fts_tokens(text: str) -> list[str]:
+    return [token.lower() for token in _FTS_TOKEN.findall(text)]
+
+
+def verify_fts(connection: sqlite3.Connection, words: list[str]) -> dict:
+    """Compare the FTS phrase query with the old LIKE scan for every vocabulary word."""
+    sentences = dict(connection.execute("SELECT id, sentence FROM questions"))
+    token_sets = {row_id: fts_tokens(sentence) for row_id, sentence in sentences.items()}
+    mismatches = []
+    substring_only = {}
+    fts_seconds = like_seconds = 0.0
+    for word in words:
+        started = time.perf_counter()
+        fts_rows = {
+            row_id for (row_id,) in connection.execute(
+                "SELECT docid FROM questions_fts WHERE sentence MATCH ?", ('"' + word.replace('"', " ") + '"',)
+            )
+        }
+        fts_seconds += time.perf_counter() - started
+        started = time.perf_counter()
+        like_rows = {
+            row_id for (row_id,) in connection.execute(
+                "SELECT id FROM questions WHERE sentence LIKE '%' || ? || '%'", (word,)
+            )
+        }
+        like_seconds += time.perf_counter() - started
+        phrase = fts_tokens(word)
+        whole_word = {
+            row_id for row_id in like_rows
+            if phrase and any(
+                token_sets[row_id][start:start + len(phrase)] == phrase
+                for start in range(len(token_sets[row_id]) - len(phrase) + 1)
+            )
+        }
+        if fts_rows != whole_word:
+            mismatches.append({
+                "word": word,
+                "fts_only": sorted(fts_rows - whole_word),
+                "missing": sorted(whole_word - fts_rows),
+            })
+        if like_rows - whole_word:
+            substring_only[word] = sorted(like_rows - whole_word)
+    return {
+        "words": len(words),
+        "mismatches": mismatches,
+        "substring_only": substring_only,
+        "fts_ms": round(fts_seconds * 1000, 1),
+        "like_ms": round(like_seconds * 1000, 1),
+    }
+
+
+def vocabulary(seed_path: Path = SEED_PATH) -> list[str]:
+    return sorted(build_word_index(json.loads(seed_path.read_text(encoding="utf-8"))))
+
+
+def build_database(path: Path, report: dict | None = None) -> dict:
+    """Create the database at path and verify its FTS index; return its manifest."""
+    entities = [parse_entity(source) for source in ENTITY_SOURCES]
+    tables = {entity["class"]: entity["table"] for entity in entities}
+    statements = [statement for entity in entities for statement in create_statements(entity, tables)]
+    version = database_version()
+    check_exported_schema(version, statements)
+    rows = question_rows()
+    max_level = max(DEFAULT_MAX_LEVEL, max(row[3] for row in rows))
+
+    path.unlink(missing_ok=True)
+    connection = sqlite3.connect(path)
+    try:
+        connection.execute(f"PRAGMA page_size = {PAGE_SIZE}")
+        connection.execute("PRAGMA journal_mode = DELETE")
+        with connection:
+            for statement in statements:
+                connection.execute(statement)
+            connection.executemany(
+                "INSERT INTO questions (sentence, meaningJa, meaningEn, level, type, translations)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            connection.executemany(
+                "INSERT INTO user_progress (level, stars, isUnlocked) VALUES (?, 0, ?)",
+                [(level, int(level == 1)) for level in range(1, max_level + 1)],
+            )
+            for entity in entities:
+                if entity["fts"] is not None:
+                    # the triggers filled the index row by row; merge it into one segment
+                    connection.execute(f"INSERT INTO `{entity['table']}`(`{entity['table']}`) VALUES ('optimize')")
+        connection.execute(f"PRAGMA user_version = {version}")
+        connection.execute("VACUUM")
+        # FTS4 keeps its own shadow tables (questions_fts_segments, ...) beside the declared objects
+        declared = {re.search(r"(?:TABLE|INDEX|TRIGGER) IF NOT EXISTS `?(\w+)", sql).group(1) for sql in statements}
+        actual = [
+            sql for name, sql in connection.execute("SELECT name, sql FROM sqlite_master WHERE sql IS NOT NULL")
+            if name in declared
+        ]
+        levels = connection.execute("SELECT COUNT(DISTINCT level) FROM questions").fetchone()[0]
+        verification = verify_fts(connection, vocabulary())
+    finally:
+        connection.close()
+    if schema_hash(actual) != schema_hash(statements):
+        raise ValueError("Built database schema differs from the entity schema")
+    if verification["mismatches"]:
+        words = ", ".join(item["word"] for item in verification["mismatches"][:10])
+        raise ValueError(f"questions_fts disagrees with the LIKE scan for {len(verification['mismatches'])} words: {words}")
+    if report is not None:
+        report.update(verification)
+    return {
+        "version": version,
+        "schema_hash": schema_hash(statements),
+        "questions": len(rows),
+        "question_levels": levels,
+        "user_progress_levels": max_level,
+        "page_size": PAGE_SIZE,
+        "fts_verified_words": verification["words"],
+    }
+
+
+def render_database(report: dict | None = None) -> tuple[bytes, dict]:
+    with tempfile.TemporaryDirectory() as tmp:
+        built = Path(tmp) / OUTPUT_PATH.name
+        manifest = build_database(built, report)
+        data = built.read_bytes()
+    manifest["sha256"] = hashlib.sha256(data).hexdigest()
+    manifest["bytes"] = len(data)
+    return data, manifest
+
+
+def write_database() -> tuple[str, dict]:
+    """Build and install the database if its bytes changed; return (action, manifest)."""
+    data, manifest = render_database()
+    [(_, action)] = emit(data, [OUTPUT_PATH], mode="write")
+    MANIFEST_PATH.parent.mkdir(parents=True, exist_ok=True)
+    MANIFEST_PATH.write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
+    return action, manifest
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Build the prepackaged Room database")
+    parser.add_argument("--check", action="store_true", help="fail if the shipped database is out of date")
+    parser.add_argument("--verify-fts", action="store_true", help="print the FTS vs LIKE comparison")
+    args = parser.parse_args()
+
+    if args.verify_fts:
+        report: dict = {}
+        render_database(report)
+        for word, rows in sorted(report["substring_only"].items()):
+            print(f"  {word}: LIKE also matches {len(rows)} rows inside longer words")
+        print(
+            f"questions_fts agrees with LIKE on whole words for all {report['words']} vocabulary words "
+            f"({len(report['substring_only'])} words with substring-only LIKE hits); "
+            f"FTS {report['fts_ms']} ms vs LIKE {report['like_ms']} ms"
+        )
+        return
+
+    if args.check:
+        data, _ = render_database()
+        current = OUTPUT_PATH.read_bytes() if OUTPUT_PATH.exists() else b""
+        if current != data:
+            raise SystemExit(f"{OUTPUT_PATH.name} is out of date; run tools/prebuilt_db.py")
+        print(f"{OUTPUT_PATH.name} is up to date")
+        return
+    action, manifest = write_database()
+    print(
+        f"{action.capitalize()}: {OUTPUT_PATH.relative_to(REPO_ROOT).as_posix()} "
+        f"({manifest['questions']} questions, {manifest['bytes']} bytes, schema {manifest['schema_hash'][:12]})"
+    )
+
+
+if __name__ == "__main__":
+    main()
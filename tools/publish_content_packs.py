@@ -0,0 +1,146 @@
+"""Publish listening seed records as cloud content packs.
+
+CloudQuestionDownloader fetches content_updates/levels_{start}_{end}.json in
+5-level ranges. This tool partitions a seed into those ranges, writes each pack
+minified alongside gzip (and, when the brotli module is installed, brotli)
+variants, and keeps a manifest of per-pack hashes and sizes in the bucket
+directory. Packs whose hash matches the existing manifest are left untouched, so
+only the files listed as changed need to be uploaded.
+
+Usage:
+    python tools/publish_content_packs.py [--seed PATH] [--bucket DIR] [--dry-run]
+"""
+from __future__ import annotations
+
+import argparse
+import gzip
+import hashlib
+import json
+from itertools import groupby
+from pathlib import Path
+
+try:
+    import brotli
+except ImportError:  # optional: only the gzip variant is produced without it
+    brotli = None
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_SEED = REPO_ROOT / "app" / "src" / "main" / "assets" / "content" / "listening_seed_v2.json"
+DEFAULT_BUCKET = REPO_ROOT / ".content_build" / "bucket"
+CONTENT_FOLDER = "content_updates"
+MANIFEST_NAME = "manifest.json"
+RANGE_SIZE = 5  # CloudQuestionDownloader.RANGE_SIZE
+MAX_DOWNLOAD_BYTES = 5 * 1024 * 1024  # CloudQuestionDownloader.MAX_DOWNLOAD_BYTES
+MANIFEST_VERSION = 1
+
+
+def range_start(level: int) -> int:
+    return ((level - 1) // RANGE_SIZE) * RANGE_SIZE + 1
+
+
+def pack_name(start: int) -> str:
+    return f"levels_{start}_{start + RANGE_SIZE - 1}.json"
+
+
+def _digest(data: bytes) -> dict:
+    return {"bytes": len(data), "sha256": hashlib.sha256(data).hexdigest()}
+
+
+def build_packs(records: list[dict]) -> dict[str, dict[str, bytes]]:
+    """Return {pack file name: {suffix: payload}} for every populated range."""
+    ordered = sorted(records, key=lambda record: (record["level"], record["id"]))
+    packs = {}
+    for start, group in groupby(ordered, key=lambda record: range_start(record["level"])):
+        payload = json.dumps(list(group), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        if len(payload) > MAX_DOWNLOAD_BYTES:
+            raise ValueError(f"{pack_name(start)} is {len(payload)} bytes, over the client download cap")
+        variants = {"": payload, ".gz": gzip.compress(payload, compresslevel=9, mtime=0)}
+        if brotli is not None:
+            variants[".br"] = brotli.compress(payload, quality=11)
+        packs[pack_name(start)] = variants
+    return packs
+
+
+def build_manifest(packs: dict[str, dict[str, bytes]]) -> dict:
+    entries = []
+    for name, variants in packs.items():
+        start, end = (int(part) for part in name[len("levels_"):-len(".json")].split("_"))
+        payload = variants[""]
+        entries.append({
+            "file": name,
+            "levels": [start, end],
+            "count": len(json.loads(payload)),
+            **_digest(payload),
+            "variants": {suffix: _digest(data) for suffix, data in variants.items() if suffix},
+        })
+    return {"version": MANIFEST_VERSION, "rangeSize": RANGE_SIZE, "packs": entries}
+
+
+def publish(records: list[dict], bucket: Path, dry_run: bool = False) -> tuple[list[str], list[str]]:
+    """Sync packs into bucket/content_updates; return (changed files, removed files)."""
+    folder = bucket / CONTENT_FOLDER
+    manifest_path = folder / MANIFEST_NAME
+    previous = {}
+    if manifest_path.exists():
+        previous = {
+            entry["file"]: entry
+            for entry in json.loads(manifest_path.read_text(encoding="utf-8"))["packs"]
+        }
+
+    packs = build_packs(records)
+    manifest = build_manifest(packs)
+    changed = []
+    for entry in manifest["packs"]:
+        name = entry["file"]
+        old = previous.get(name)
+        for suffix, data in packs[name].items():
+            path = folder / (name + suffix)
+            expected = entry["sha256"] if not suffix else entry["variants"][suffix]["sha256"]
+            recorded = None
+            if old is not None:
+                recorded = old["sha256"] if not suffix else old.get("variants", {}).get(suffix, {}).get("sha256")
+            if recorded == expected and path.exists():
+                continue
+            changed.append(path.name)
+            if not dry_run:
+                folder.mkdir(parents=True, exist_ok=True)
+                path.write_bytes(data)
+
+    removed = []
+    for name in previous.keys() - packs.keys():
+        for suffix in ("", ".gz", ".br"):
+            path = folder / (name + suffix)
+            if path.exists():
+                removed.append(path.name)
+                if not dry_run:
+                    path.unlink()
+
+    if (changed or removed) and not dry_run:
+        folder.mkdir(parents=True, exist_ok=True)
+        manifest_path.write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
+        changed.append(MANIFEST_NAME)
+    return changed, removed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Publish 5-level cloud content packs")
+    parser.add_argument("--seed", type=Path, default=DEFAULT_SEED, help="seed JSON to partition")
+    parser.add_argument("--bucket", type=Path, default=DEFAULT_BUCKET, help="local mirror of the storage bucket")
+    parser.add_argument("--dry-run", action="store_true", help="report changes without writing")
+    args = parser.parse_args()
+
+    records = json.loads(args.seed.read_text(encoding="utf-8"))
+    changed, removed = publish(records, args.bucket, dry_run=args.dry_run)
+    if brotli is None:
+        print("brotli module not installed; skipped .br variants")
+    if not changed and not removed:
+        print("All content packs up to date")
+        return
+    for name in changed:
+        print(f"Changed: {CONTENT_FOLDER}/{name}")
+    for name in removed:
+        print(f"Removed: {CONTENT_FOLDER}/{name}")
+
+
+if __name__ == "__main__":
+    main()
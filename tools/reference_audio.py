@@ -0,0 +1,270 @@
+"""Pre-render reference audio for every phrase and word in the listening seeds.
+
+Every `native` phrase and every `words` token of the seed assets is collected
+and de-duplicated by its spoken form (whitespace-collapsed, case-folded), so
+"Salamat" in fifty records is rendered once. Each unique text is synthesized
+through a TTS backend and stored content-addressed:
+
+    .content_build/reference_audio/clips/ab/abcdef....wav   (SHA-256 of the bytes)
+    .content_build/reference_audio/index.json
+
+The index maps each key to its text, clip hash, byte size and duration. It
+also records the backend and its settings, so a rerun only synthesizes texts
+that are new or whose clip is missing, and switching backends re-renders
+everything. Identical audio for different texts is stored once.
+
+Backends: "stub" renders a deterministic offline tone (stand_in_backend's
+reference clip, lengthened with the text) for tests and dry runs; "http"
+fetches GET /api/reference-audio/{text} from a backend, the same contract
+PronunciationRepository uses.
+
+Usage:
+    python tools/reference_audio.py [--backend stub] [--prune]
+    python tools/reference_audio.py --backend http --server http://localhost:8000 [--concurrency 8]
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import http.client
+import io
+import json
+import os
+import time
+import urllib.error
+import urllib.request
+import wave
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Protocol
+from urllib.parse import quote
+
+from stand_in_backend import reference_clip
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+ASSETS_DIR = REPO_ROOT / "app" / "src" / "main" / "assets"
+SEED_PATHS = (ASSETS_DIR / "listening_seed.json", ASSETS_DIR / "content" / "listening_seed_v2.json")
+OUTPUT_DIR = REPO_ROOT / ".content_build" / "reference_audio"
+INDEX_VERSION = 1
+CONCURRENCY = 4
+RETRIES = 3
+RETRY_BACKOFF = 0.5  # seconds, doubled after every failed attempt
+
+
+class TtsBackend(Protocol):
+    name: str
+
+    @property
+    def settings(self) -> dict: ...
+
+    def synthesize(self, text: str) -> bytes: ...
+
+
+class SynthesisError(Exception):
+    pass
+
+
+class StubTts:
+    """Deterministic offline backend: a tone per text, about as long as the text would take to say."""
+
+    name = "stub"
+
+    def __init__(self, seconds_per_char: float = 0.06):
+        self.seconds_per_char = seconds_per_char
+
+    @property
+    def settings(self) -> dict:
+        return {"seconds_per_char": self.seconds_per_char}
+
+    def synthesize(self, text: str) -> bytes:
+        return reference_clip(text, round(min(6.0, 0.3 + self.seconds_per_char * len(text)), 3))
+
+
+class HttpTts:
+    """Fetches clips from a backend's GET /api/reference-audio/{text}."""
+
+    name = "http"
+
+    def __init__(self, base_url: str, timeout: float = 60.0, retries: int = RETRIES):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.retries = retries
+
+    @property
+    def settings(self) -> dict:
+        return {"server": self.base_url}
+
+    def synthesize(self, text: str) -> bytes:
+        url = f"{self.base_url}/api/reference-audio/{quote(text, safe='')}"
+        delay = RETRY_BACKOFF
+        for attempt in range(self.retries + 1):
+            try:
+                with urllib.request.urlopen(url, timeout=self.timeout) as response:
+                    data = response.read()
+                if not data:
+                    raise SynthesisError(f"empty clip for {text!r}")
+                return data
+            except urllib.error.HTTPError as exc:
+                if exc.code < 500 or attempt == self.retries:
+                    raise SynthesisError(f"{text!r}: HTTP {exc.code}") from None
+            except (OSError, http.client.HTTPException) as exc:
+                # URLError, timeouts, resets, and IncompleteRead from read()
+                if attempt == self.retries:
+                    raise SynthesisError(f"{text!r}: {exc}") from None
+            time.sleep(delay)
+            delay *= 2
+        raise AssertionError("unreachable")
+
+
+def spoken_key(text: str) -> str:
+    return " ".join(text.split()).casefold()
+
+
+def collect_texts(paths: Iterable[Path] = SEED_PATHS) -> dict[str, str]:
+    """Spoken key -> first text seen, over every native phrase and words token."""
+    texts: dict[str, str] = {}
+    for path in paths:
+        for record in json.loads(path.read_text(encoding="utf-8")):
+            for text in (record.get("native") or "", *(record.get("words") or ())):
+                key = spoken_key(text)
+                if key:
+                    texts.setdefault(key, " ".join(text.split()))
+    return texts
+
+
+def clip_path(output_dir: Path, digest: str) -> Path:
+    return output_dir / "clips" / digest[:2] / f"{digest}.wav"
+
+
+def wav_duration_ms(data: bytes) -> int | None:
+    try:
+        with wave.open(io.BytesIO(data)) as clip:
+            return round(clip.getnframes() * 1000 / clip.getframerate())
+    except (wave.Error, EOFError):
+        return None
+
+
+def store_clip(output_dir: Path, data: bytes) -> str:
+    digest = hashlib.sha256(data).hexdigest()
+    path = clip_path(output_dir, digest)
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_bytes(data)
+        tmp_path.replace(path)
+    return digest
+
+
+@dataclass
+class RenderResult:
+    total: int
+    rendered: int
+    failures: list[str]
+    stored_bytes: int
+    clips: int
+
+
+def load_index(output_dir: Path) -> dict:
+    path = output_dir / "index.json"
+    if not path.exists():
+        return {}
+    index = json.loads(path.read_text(encoding="utf-8"))
+    return index if index.get("version") == INDEX_VERSION else {}
+
+
+def render(
+    backend: TtsBackend,
+    texts: dict[str, str],
+    output_dir: Path = OUTPUT_DIR,
+    concurrency: int = CONCURRENCY,
+) -> RenderResult:
+    """Synthesize every text missing from the index (or whose clip is gone) and rewrite the index."""
+    previous = load_index(output_dir)
+    signature = {"backend": backend.name, "settings": backend.settings}
+    reusable = previous.get("clips", {}) if previous.get("signature") == signature else {}
+    clips: dict[str, dict] = {}
+    pending = []
+    for key, text in texts.items():
+        entry = reusable.get(key)
+        if entry and entry["text"] == text and clip_path(output_dir, entry["clip"]).exists():
+            clips[key] = entry
+        else:
+            pending.append((key, text))
+
+    failures = []
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+        futures = {pool.submit(backend.synthesize, text): (key, text) for key, text in pending}
+        for future in as_completed(futures):
+            key, text = futures[future]
+            try:
+                data = future.result()
+            except Exception as exc:
+                # one bad clip must not lose the index for everything rendered so far
+                failures.append(str(exc) if isinstance(exc, SynthesisError) else f"{text!r}: {exc!r}")
+                continue
+            clips[key] = {
+                "text": text,
+                "clip": store_clip(output_dir, data),
+                "bytes": len(data),
+                "duration_ms": wav_duration_ms(data),
+            }
+
+    index = {
+        "version": INDEX_VERSION,
+        "signature": signature,
+        "clips": {key: clips[key] for key in sorted(clips)},
+    }
+    output_dir.mkdir(parents=True, exist_ok=True)
+    tmp_path = output_dir / "index.json.tmp"
+    tmp_path.write_text(json.dumps(index, ensure_ascii=False, indent=1) + "\n", encoding="utf-8")
+    tmp_path.replace(output_dir / "index.json")
+    unique = {entry["clip"]: entry["bytes"] for entry in clips.values()}
+    return RenderResult(len(texts), len(pending) - len(failures), failures, sum(unique.values()), len(unique))
+
+
+def prune(output_dir: Path = OUTPUT_DIR) -> int:
+    """Delete clips the index no longer references; return how many were removed."""
+    referenced = {entry["clip"] for entry in load_index(output_dir).get("clips", {}).values()}
+    removed = 0
+    for path in (output_dir / "clips").glob("*/*.wav"):
+        if path.stem not in referenced:
+            path.unlink()
+            removed += 1
+    return removed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Pre-render reference audio for the seed phrases and words")
+    parser.add_argument("--backend", choices=("stub", "http"), default="stub")
+    parser.add_argument("--server", help="backend base URL for --backend http")
+    parser.add_argument("--concurrency", type=int, default=CONCURRENCY)
+    parser.add_argument("--out", type=Path, default=OUTPUT_DIR, help="clip store and index directory")
+    parser.add_argument("--prune", action="store_true", help="delete clips the index no longer references")
+    args = parser.parse_args()
+
+    if args.backend == "http":
+        if not args.server:
+            parser.error("--backend http needs --server")
+        backend: TtsBackend = HttpTts(args.server)
+    else:
+        backend = StubTts()
+
+    texts = collect_texts()
+    started = time.perf_counter()
+    result = render(backend, texts, args.out, args.concurrency)
+    elapsed = time.perf_counter() - started
+    print(
+        f"{result.total} unique texts; {result.rendered} rendered via {backend.name} in {elapsed:.2f}s; "
+        f"{result.clips} clips, {result.stored_bytes} bytes in {args.out}"
+    )
+    for failure in result.failures:
+        print(f"  failed: {failure}")
+    if args.prune:
+        print(f"Pruned {prune(args.out)} unreferenced clips")
+    if result.failures:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
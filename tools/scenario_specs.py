@@ -0,0 +1,106 @@
+"""Load and validate the dojo scenario specs data file.
+
+content_src/scenarios/dojo_specs.json holds {"version": 1, "specs": [...]}.
+Every spec must carry exactly the SPEC_FIELDS as non-empty strings, and ids
+must be unique and of the form dojo_<number>. The loader returns a SpecIndex
+that looks specs up by id, by role and by arc.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+from collections import defaultdict
+from pathlib import Path
+from typing import Callable
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SPECS_PATH = REPO_ROOT / "content_src" / "scenarios" / "dojo_specs.json"
+SPECS_VERSION = 1
+SPEC_FIELDS = (
+    "id",
+    "title_ja",
+    "title_en",
+    "situation_ja",
+    "situation_en",
+    "goal_ja",
+    "goal_en",
+    "role_ja",
+    "role_en",
+)
+ID_PATTERN = re.compile(r"dojo_(\d+)")
+
+
+class SpecError(ValueError):
+    pass
+
+
+def spec_number(spec: dict) -> int:
+    return int(ID_PATTERN.fullmatch(spec["id"]).group(1))
+
+
+def spec_digest(spec: dict) -> str:
+    return hashlib.sha256(json.dumps(spec, sort_keys=True, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+def validate(payload: dict) -> list[str]:
+    """Every schema problem in a parsed data file; empty when it is valid."""
+    if not isinstance(payload, dict) or payload.get("version") != SPECS_VERSION:
+        return [f"expected an object with version {SPECS_VERSION}"]
+    specs = payload.get("specs")
+    if not isinstance(specs, list):
+        return ["specs must be a list"]
+    errors = []
+    seen: set[str] = set()
+    for position, spec in enumerate(specs):
+        where = f"specs[{position}]"
+        if not isinstance(spec, dict):
+            errors.append(f"{where}: expected an object")
+            continue
+        where = f"{where} ({spec.get('id', '?')})"
+        for name in SPEC_FIELDS:
+            value = spec.get(name)
+            if not isinstance(value, str) or not value.strip():
+                errors.append(f"{where}: {name} must be a non-empty string")
+        unknown = sorted(set(spec) - set(SPEC_FIELDS))
+        if unknown:
+            errors.append(f"{where}: unknown fields {', '.join(unknown)}")
+        spec_id = spec.get("id")
+        if isinstance(spec_id, str):
+            if not ID_PATTERN.fullmatch(spec_id):
+                errors.append(f"{where}: id must look like dojo_<number>")
+            if spec_id in seen:
+                errors.append(f"{where}: duplicate id")
+            seen.add(spec_id)
+    return errors
+
+
+class SpecIndex:
+    """Specs in file order, indexed by id, by casefolded role (ja or en) and by arc."""
+
+    def __init__(self, specs: list[dict], arc_of: Callable[[dict], str]):
+        self.specs = specs
+        self.by_id = {spec["id"]: spec for spec in specs}
+        self.by_role: dict[str, list[dict]] = defaultdict(list)
+        self.by_arc: dict[str, list[dict]] = defaultdict(list)
+        for spec in specs:
+            for role in {spec["role_ja"].strip().casefold(), spec["role_en"].strip().casefold()}:
+                self.by_role[role].append(spec)
+            self.by_arc[arc_of(spec)].append(spec)
+
+    def __len__(self) -> int:
+        return len(self.specs)
+
+    def __iter__(self):
+        return iter(self.specs)
+
+    def role(self, name: str) -> list[dict]:
+        return self.by_role.get(name.strip().casefold(), [])
+
+
+def load_specs(arc_of: Callable[[dict], str], path: Path = SPECS_PATH) -> SpecIndex:
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    errors = validate(payload)
+    if errors:
+        raise SpecError(f"{path.name}:\n" + "\n".join(errors))
+    return SpecIndex(payload["specs"], arc_of)
@@ -0,0 +1,134 @@
+"""Declarative JSON templates for generated scenario assets.
+
+A template is a JSON value compiled once into a render function. While
+rendering against a context dict:
+
+* strings are format strings: "{name}" inserts context[name]; filters are
+  chained with "|", e.g. "{situation_en|first_sentence}";
+* {"$": "name"} inserts context[name] as-is (lists, numbers, nested objects);
+* {"$text": "...", "filters": [...]} applies filters to the whole rendered string;
+* {"$unique": [...], "limit": n} renders the items, drops those with an empty
+  string field, removes duplicates by content hash and keeps the first n;
+* objects and lists render member by member, and anything else is a literal.
+
+Literal "{" and "}" are written "{{" and "}}" as in str.format.
+"""
+from __future__ import annotations
+
+import json
+import re
+from functools import lru_cache
+from pathlib import Path
+from string import Formatter
+from typing import Any, Callable
+
+Render = Callable[[dict], Any]
+
+_SENTENCE_END = re.compile(r"[.!?。！？]")
+
+
+@lru_cache(maxsize=None)
+def first_sentence(text: str) -> str:
+    trimmed = text.strip()
+    match = _SENTENCE_END.search(trimmed)
+    return trimmed[:match.start()].strip() if match else trimmed
+
+
+def squash(text: str) -> str:
+    return " ".join(text.split())
+
+
+FILTERS: dict[str, Callable[[str], str]] = {
+    "first_sentence": first_sentence,
+    "strip": str.strip,
+    "squash": squash,
+}
+
+
+def _filter_chain(names: list[str]) -> Callable[[str], str]:
+    try:
+        chain = [FILTERS[name] for name in names]
+    except KeyError as exc:
+        raise ValueError(f"Unknown template filter: {exc.args[0]}") from None
+
+    def apply(value: str) -> str:
+        for function in chain:
+            value = function(value)
+        return value
+
+    return apply
+
+
+def _compile_string(template: str) -> Render:
+    pieces: list[str | tuple[str, Callable[[str], str]]] = []
+    for literal, field, spec, conversion in Formatter().parse(template):
+        if literal:
+            pieces.append(literal)
+        if field is None:
+            continue
+        if spec or conversion:
+            raise ValueError(f"Format specs are not supported: {template!r}")
+        name, *filters = field.split("|")
+        pieces.append((name, _filter_chain(filters)))
+    if all(isinstance(piece, str) for piece in pieces):
+        constant = "".join(pieces)
+        return lambda context: constant
+
+    def render(context: dict) -> str:
+        return "".join(
+            piece if isinstance(piece, str) else piece[1](str(context[piece[0]]))
+            for piece in pieces
+        )
+
+    return render
+
+
+def _unique(items: list[Render], limit: int | None) -> Render:
+    def render(context: dict) -> list:
+        seen: set[str] = set()
+        result = []
+        for item in items:
+            value = item(context)
+            if isinstance(value, dict) and any(member == "" for member in value.values()):
+                continue
+            key = json.dumps(value, sort_keys=True, ensure_ascii=False)
+            if key in seen:
+                continue
+            seen.add(key)
+            result.append(value)
+            if limit is not None and len(result) == limit:
+                break
+        return result
+
+    return render
+
+
+def compile_template(template: Any) -> Render:
+    if isinstance(template, str):
+        return _compile_string(template)
+    if isinstance(template, list):
+        items = [compile_template(item) for item in template]
+        return lambda context: [item(context) for item in items]
+    if isinstance(template, dict):
+        if "$" in template:
+            name = template["$"]
+            return lambda context: context[name]
+        if "$text" in template:
+            text = _compile_string(template["$text"])
+            apply = _filter_chain(template.get("filters", []))
+            return lambda context: apply(text(context))
+        if "$unique" in template:
+            return _unique([compile_template(item) for item in template["$unique"]], template.get("limit"))
+        members = [(key, compile_template(value)) for key, value in template.items()]
+        return lambda context: {key: member(context) for key, member in members}
+    return lambda context: template
+
+
+@lru_cache(maxsize=None)
+def _load(path: Path, mtime_ns: int) -> dict:
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def load_template_file(path: Path) -> dict:
+    """Parse a template data file once per modification."""
+    return _load(path, path.stat().st_mtime_ns)
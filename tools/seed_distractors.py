@@ -0,0 +1,83 @@
+"""Precompute ranked distractor word chips for every listening seed record.
+
+Candidates come from the word index of the same level, widening one level at a
+time when a level has too few tokens. Tokens used in the answer are excluded;
+the rest are ranked by spelling similarity to the answer tokens, then by
+frequency. Output is a side table keyed by record id, lowercase to match the
+normalized chips built in ListeningViewModel.
+"""
+from __future__ import annotations
+
+import json
+from collections import defaultdict
+from difflib import SequenceMatcher
+from pathlib import Path
+
+from seed_tokenizer import build_word_index, index_key, tokenize
+
+MAX_CHIPS = 8  # ListeningViewModel shows at most eight chips per question
+TABLE_VERSION = 1
+
+
+def _level_vocabulary(records: list[dict]) -> dict[int, list[str]]:
+    index = build_word_index(records)
+    level_of = {record["id"]: record["level"] for record in records}
+    by_level: dict[int, set[str]] = defaultdict(set)
+    for token, entry in index.items():
+        for record_id in entry["ids"]:
+            by_level[level_of[record_id]].add(token)
+    frequency = {token: entry["count"] for token, entry in index.items()}
+    return {
+        level: sorted(tokens, key=lambda token: (-frequency[token], token))
+        for level, tokens in by_level.items()
+    }
+
+
+def _similarity(candidate: str, answer: list[str]) -> float:
+    matcher = SequenceMatcher(None, "", candidate)
+    best = 0.0
+    for token in answer:
+        matcher.set_seq1(token)
+        best = max(best, matcher.ratio())
+    return best
+
+
+def rank_distractors(record: dict, vocabulary: dict[int, list[str]], limit: int = MAX_CHIPS) -> list[str]:
+    answer = [index_key(token) for token in record.get("words") or tokenize(record["native"])]
+    excluded = set(answer)
+    levels = sorted(vocabulary)
+    ranked: list[str] = []
+    distance = 0
+    while len(ranked) < limit and distance <= (levels[-1] - levels[0] if levels else 0):
+        nearby = {record["level"] - distance, record["level"] + distance}
+        pool = [
+            token
+            for level in sorted(nearby)
+            for token in vocabulary.get(level, ())
+            if token not in excluded
+        ]
+        # the pool is frequency-ordered, so a stable sort keeps frequency as the tie-break
+        pool.sort(key=lambda token: -_similarity(token, answer))
+        for token in pool:
+            if len(ranked) == limit:
+                break
+            ranked.append(token)
+            excluded.add(token)
+        distance += 1
+    return ranked
+
+
+def build_distractor_table(records: list[dict], limit: int = MAX_CHIPS) -> dict[str, list[str]]:
+    vocabulary = _level_vocabulary(records)
+    return {str(record["id"]): rank_distractors(record, vocabulary, limit) for record in records}
+
+
+def write_distractor_table(seed_path: Path, table_path: Path) -> int:
+    records = json.loads(seed_path.read_text(encoding="utf-8"))
+    payload = {"version": TABLE_VERSION, "distractors": build_distractor_table(records)}
+    table_path.parent.mkdir(parents=True, exist_ok=True)
+    table_path.write_text(
+        json.dumps(payload, ensure_ascii=False, separators=(",", ":")) + "\n",
+        encoding="utf-8",
+    )
+    return len(payload["distractors"])
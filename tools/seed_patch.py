@@ -0,0 +1,149 @@
+"""Diff and patch listening seeds by record id.
+
+A patch lists added records, per-field changes to existing records and removed
+ids, plus the SHA-256 of the base and target seed files' bytes, as sha256sum
+prints them. Applying a patch checks the base hash first and the hash of the
+written target last, so a patch can only turn the exact base file into the
+exact target file. apply writes the target with dumps_seed, so diff refuses a
+target file that is not already in that form.
+
+Usage:
+    python tools/seed_patch.py diff OLD.json NEW.json PATCH.json
+    python tools/seed_patch.py apply BASE.json PATCH.json OUT.json
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+from pathlib import Path
+
+from listening_seed import dumps_seed
+
+PATCH_VERSION = 1
+
+
+def seed_digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _encode(records: list[dict]) -> bytes:
+    return dumps_seed(records).encode("utf-8")
+
+
+def _index(records: list[dict]) -> dict:
+    index = {}
+    for record in records:
+        if record["id"] in index:
+            raise ValueError(f"Duplicate record id {record['id']!r}")
+        index[record["id"]] = record
+    return index
+
+
+def _merge(base: list[dict], added: list[dict], changes: dict, removed: set) -> list[dict]:
+    merged = []
+    for record in base:
+        if record["id"] in removed:
+            continue
+        change = changes.get(record["id"])
+        if change is not None:
+            fields = {key: value for key, value in record.items() if key not in change.get("unset", ())}
+            for key, value in change.get("set", {}).items():
+                fields[key] = value
+            if "fields" in change:
+                fields = {key: fields[key] for key in change["fields"]}
+            record = fields
+        merged.append(record)
+    merged.extend(added)
+    return merged
+
+
+def diff(base_data: bytes, target_data: bytes) -> dict:
+    base = json.loads(base_data)
+    target = json.loads(target_data)
+    if _encode(target) != target_data:
+        raise ValueError("Target seed is not in dumps_seed form; rewrite it with listening_seed before diffing")
+    base_index = _index(base)
+    target_index = _index(target)
+
+    added = [record for record in target if record["id"] not in base_index]
+    removed = [record["id"] for record in base if record["id"] not in target_index]
+    changed = []
+    for record in target:
+        old = base_index.get(record["id"])
+        if old is None or old == record:
+            continue
+        change = {"id": record["id"]}
+        updates = {key: value for key, value in record.items() if old.get(key, object()) != value}
+        if updates:
+            change["set"] = updates
+        dropped = [key for key in old if key not in record]
+        if dropped:
+            change["unset"] = dropped
+        if list(record) != [key for key in old if key in record] + [key for key in record if key not in old]:
+            change["fields"] = list(record)
+        changed.append(change)
+
+    patch = {
+        "version": PATCH_VERSION,
+        "base": {"count": len(base), "sha256": seed_digest(base_data)},
+        "target": {"count": len(target), "sha256": seed_digest(target_data)},
+        "added": added,
+        "changed": changed,
+        "removed": removed,
+    }
+    merged = _merge(base, added, {change["id"]: change for change in changed}, set(removed))
+    if [record["id"] for record in merged] != [record["id"] for record in target]:
+        patch["order"] = [record["id"] for record in target]
+    return patch
+
+
+def apply(base_data: bytes, patch: dict) -> bytes:
+    """Return the bytes of the target seed file."""
+    if patch.get("version") != PATCH_VERSION:
+        raise ValueError(f"Unsupported patch version: {patch.get('version')}")
+    if seed_digest(base_data) != patch["base"]["sha256"]:
+        raise ValueError("Base seed does not match the patch's base hash")
+    base = json.loads(base_data)
+
+    changes = {change["id"]: change for change in patch["changed"]}
+    merged = _merge(base, patch["added"], changes, set(patch["removed"]))
+    if "order" in patch:
+        index = _index(merged)
+        merged = [index[record_id] for record_id in patch["order"]]
+
+    data = _encode(merged)
+    if seed_digest(data) != patch["target"]["sha256"]:
+        raise ValueError("Patched seed does not match the patch's target hash")
+    return data
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Diff and patch listening seeds by record id")
+    commands = parser.add_subparsers(dest="command", required=True)
+    diff_parser = commands.add_parser("diff", help="write a patch from OLD to NEW")
+    diff_parser.add_argument("old", type=Path)
+    diff_parser.add_argument("new", type=Path)
+    diff_parser.add_argument("patch", type=Path)
+    apply_parser = commands.add_parser("apply", help="apply PATCH to BASE and write OUT")
+    apply_parser.add_argument("base", type=Path)
+    apply_parser.add_argument("patch", type=Path)
+    apply_parser.add_argument("out", type=Path)
+    args = parser.parse_args()
+
+    if args.command == "diff":
+        patch = diff(args.old.read_bytes(), args.new.read_bytes())
+        payload = json.dumps(patch, ensure_ascii=False, separators=(",", ":"))
+        args.patch.write_text(payload, encoding="utf-8")
+        print(
+            f"Wrote {args.patch} ({len(payload.encode('utf-8'))} bytes): "
+            f"{len(patch['added'])} added, {len(patch['changed'])} changed, {len(patch['removed'])} removed"
+        )
+    else:
+        patch = json.loads(args.patch.read_text(encoding="utf-8"))
+        args.out.write_bytes(apply(args.base.read_bytes(), patch))
+        print(f"Wrote {patch['target']['count']} records to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Split a listening seed into per-level shards with a byte-offset manifest.
+
+The shards are written back to back into one JSON Lines pack (one compact JSON
+array per level). The manifest records each shard's byte offset, length, record
+count and SHA-256 so a reader can seek to just the levels it is missing.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+from itertools import groupby
+from pathlib import Path
+
+MANIFEST_VERSION = 1
+
+
+def build_shards(records: list[dict]) -> tuple[bytes, list[dict]]:
+    ordered = sorted(records, key=lambda record: (record["level"], record["id"]))
+    pack = bytearray()
+    shards = []
+    for level, group in groupby(ordered, key=lambda record: record["level"]):
+        items = list(group)
+        payload = json.dumps(items, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        shards.append({
+            "level": level,
+            "offset": len(pack),
+            "length": len(payload),
+            "count": len(items),
+            "sha256": hashlib.sha256(payload).hexdigest(),
+        })
+        pack += payload + b"\n"
+    return bytes(pack), shards
+
+
+def write_shards(seed_path: Path, pack_path: Path, manifest_path: Path) -> list[dict]:
+    records = json.loads(seed_path.read_text(encoding="utf-8"))
+    pack, shards = build_shards(records)
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "pack": pack_path.name,
+        "sha256": hashlib.sha256(pack).hexdigest(),
+        "shards": shards,
+    }
+    pack_path.parent.mkdir(parents=True, exist_ok=True)
+    pack_path.write_bytes(pack)
+    manifest_path.write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
+    return shards
+
+
+def read_levels(pack_path: Path, manifest_path: Path, levels: set[int]) -> list[dict]:
+    """Read only the requested levels from the pack, verifying each shard hash."""
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    records = []
+    with pack_path.open("rb") as pack:
+        for shard in manifest["shards"]:
+            if shard["level"] not in levels:
+                continue
+            pack.seek(shard["offset"])
+            payload = pack.read(shard["length"])
+            if hashlib.sha256(payload).hexdigest() != shard["sha256"]:
+                raise ValueError(f"Shard for level {shard['level']} does not match manifest hash")
+            records.extend(json.loads(payload))
+    return records
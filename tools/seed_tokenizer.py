@@ -0,0 +1,51 @@
+"""Canonical Cebuano tokenizer and word index for the seed builders.
+
+Rules: sentence punctuation (? ! , .) separates tokens and is dropped; hyphens
+and apostrophes stay inside a token ("makit-an", "Ma'am"), matching the words
+shipped in the listening seeds.
+"""
+from __future__ import annotations
+
+import json
+import re
+from pathlib import Path
+
+_TOKEN = re.compile(r"[^\s?!,.]+")
+
+INDEX_VERSION = 1
+
+
+def tokenize(text: str) -> list[str]:
+    return _TOKEN.findall(text)
+
+
+def index_key(token: str) -> str:
+    return token.casefold()
+
+
+def build_word_index(records: list[dict]) -> dict[str, dict]:
+    """Map each case-folded token to its frequency and the ids of records using it."""
+    index: dict[str, dict] = {}
+    for record in records:
+        for token in record.get("words") or tokenize(record["native"]):
+            entry = index.setdefault(index_key(token), {"count": 0, "ids": []})
+            entry["count"] += 1
+            if not entry["ids"] or entry["ids"][-1] != record["id"]:
+                entry["ids"].append(record["id"])
+    return index
+
+
+def write_word_index(seed_path: Path, index_path: Path) -> int:
+    records = json.loads(seed_path.read_text(encoding="utf-8"))
+    index = build_word_index(records)
+    tokens = [
+        {"token": token, "count": entry["count"], "ids": entry["ids"]}
+        for token, entry in sorted(index.items(), key=lambda item: (-item[1]["count"], item[0]))
+    ]
+    payload = {"version": INDEX_VERSION, "tokens": tokens}
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    index_path.write_text(
+        json.dumps(payload, ensure_ascii=False, separators=(",", ":")) + "\n",
+        encoding="utf-8",
+    )
+    return len(tokens)
@@ -0,0 +1,687 @@
+"""Local asyncio stand-in for the Bisaya Speak AI backend.
+
+Implements the HTTP contracts ConversationRepository and PronunciationRepository
+call, with deterministic responses built from the content assets:
+
+    GET  /                            health check
+    POST /api/chat/free               {"level", "message"} -> {"reply", "translation"}
+    POST /api/roleplay/start          {"scene_id", "level"} -> opening message of the scenario
+    POST /api/roleplay/chat           {"scene_id", "text"}  -> the conversation partner's next line
+    POST /api/translate               {"text", "source", "target"} -> {"translated", ...}
+    POST /api/pronounce/check         multipart audio/word/level -> score and feedback
+    GET  /api/reference-audio/{word}  a short WAV tone derived from the word
+    GET  /_stats                      request, error and upload counters
+
+Roleplay scenes come from scenarios_v1.json (unknown scene ids map onto one of
+them by hash), and translations from the listening seed's ja -> native pairs,
+falling back to the "[ceb] text" tagging of translation_backfill's stub. The
+body depends only on the request (and, for roleplay chat, on how many turns
+the conversation has had), so client timeouts, retries and connection pooling
+can be benchmarked without a live service.
+
+Roleplay conversations are kept per session and scene. The session is the
+"session_id" body field or X-Session-Id header when given, else the client's
+address (the app sends neither: one learner per device). At most
+MAX_ROLEPLAYS conversations are kept; the least recently used is evicted.
+
+Latency is a fixed base plus exponential jitter, settable per route. Error
+injection answers a fraction of requests with 503 and drops the connection
+without a response for another fraction. Request bodies are read as they
+arrive (Content-Length or chunked), and multipart uploads are parsed in
+a streaming pass that hashes file parts without buffering them.
+
+Usage:
+    python tools/stand_in_backend.py [--port 8000] [--latency 150] [--jitter 50]
+        [--route-latency /api/pronounce/check=900] [--error-rate 0.02] [--drop-rate 0.01] [--seed 1]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import hashlib
+import io
+import json
+import math
+import random
+import struct
+import threading
+import time
+import wave
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import AsyncIterator, Awaitable, Callable
+from urllib.parse import unquote, urlsplit
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+ASSETS_DIR = REPO_ROOT / "app" / "src" / "main" / "assets"
+SCENARIOS_PATH = ASSETS_DIR / "content" / "scenarios_v1.json"
+SEED_PATH = ASSETS_DIR / "content" / "listening_seed_v2.json"
+VERSION = "1.0.0"
+
+MAX_HEADER_BYTES = 64 * 1024
+MAX_JSON_BYTES = 1024 * 1024
+READ_CHUNK = 64 * 1024
+MAX_ROLEPLAYS = 4096
+# the partner's side of a roleplay: (Cebuano, Japanese), one per turn, then a closing line at the turn limit
+PARTNER_LINES = (
+    ("Sige, unsa may imong gusto?", "わかりました、何をご希望ですか？"),
+    ("Husto ka. Padayon ta.", "その通りです。続けましょう。"),
+    ("Hinay-hinay lang, wala ko kasabot.", "ゆっくりお願いします、よく分かりません。"),
+    ("Maayo kaayo! Unsa pa man?", "とても良いです！ほかには？"),
+    ("Sige, mouyon ko ana.", "はい、それで同意します。"),
+    ("Palihug, isulti pag-usab.", "もう一度言ってください。"),
+)
+PARTNER_CLOSING = ("Salamat kaayo! Amping.", "ありがとうございました！気をつけて。")
+SAMPLE_RATE = 16_000
+REASONS = {
+    100: "Continue", 200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+    411: "Length Required", 413: "Payload Too Large", 500: "Internal Server Error", 503: "Service Unavailable",
+}
+
+
+class HttpError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class FramingError(HttpError):
+    """The request body's framing is broken, so the connection cannot carry another request."""
+
+    def __init__(self, message: str):
+        super().__init__(400, message)
+
+
+@dataclass
+class Faults:
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    route_latency_ms: dict[str, float] = field(default_factory=dict)
+    error_rate: float = 0.0
+    drop_rate: float = 0.0
+    seed: int = 0
+
+
+@dataclass
+class Request:
+    method: str
+    path: str
+    headers: dict[str, str]
+    body: AsyncIterator[bytes]
+    close: bool = False
+    client: str = ""  # peer address
+
+    async def read(self, limit: int = MAX_JSON_BYTES) -> bytes:
+        parts = []
+        size = 0
+        async for chunk in self.body:
+            size += len(chunk)
+            if size > limit:
+                raise HttpError(413, f"body larger than {limit} bytes")
+            parts.append(chunk)
+        return b"".join(parts)
+
+    async def json(self) -> dict:
+        try:
+            payload = json.loads(await self.read() or b"{}")
+        except ValueError as exc:
+            raise HttpError(400, f"invalid JSON: {exc}") from None
+        if not isinstance(payload, dict):
+            raise HttpError(400, "expected a JSON object")
+        return payload
+
+
+@dataclass
+class Response:
+    status: int = 200
+    body: bytes = b""
+    content_type: str = "application/json; charset=utf-8"
+
+    @classmethod
+    def json(cls, payload: dict, status: int = 200) -> "Response":
+        return cls(status, json.dumps(payload, ensure_ascii=False).encode("utf-8"))
+
+
+def _digest(*parts: str | bytes) -> int:
+    sha = hashlib.sha256()
+    for part in parts:
+        sha.update(part.encode("utf-8") if isinstance(part, str) else part)
+        sha.update(b"\0")
+    return int.from_bytes(sha.digest()[:8], "big")
+
+
+# ---------------------------------------------------------------------------
+# Request bodies
+
+
+async def _content_length_body(reader: asyncio.StreamReader, length: int) -> AsyncIterator[bytes]:
+    remaining = length
+    while remaining:
+        chunk = await reader.read(min(READ_CHUNK, remaining))
+        if not chunk:
+            raise ConnectionResetError("client closed the connection mid-body")
+        remaining -= len(chunk)
+        yield chunk
+
+
+async def _chunked_body(reader: asyncio.StreamReader) -> AsyncIterator[bytes]:
+    while True:
+        try:
+            size_line = await reader.readuntil(b"\r\n")
+            size = int(size_line.split(b";", 1)[0], 16)
+            if size < 0:
+                raise ValueError(size)
+            if size == 0:
+                while await reader.readuntil(b"\r\n") != b"\r\n":  # trailers
+                    pass
+                return
+        except (ValueError, asyncio.LimitOverrunError):
+            raise FramingError("malformed chunk size line") from None
+        remaining = size
+        while remaining:
+            chunk = await reader.read(min(READ_CHUNK, remaining))
+            if not chunk:
+                raise ConnectionResetError("client closed the connection mid-chunk")
+            remaining -= len(chunk)
+            yield chunk
+        if await reader.readexactly(2) != b"\r\n":
+            raise FramingError("chunk data not followed by CRLF")
+
+
+async def _drain(body: AsyncIterator[bytes]) -> None:
+    async for _ in body:
+        pass
+
+
+def _header_param(value: str, name: str) -> str | None:
+    for part in value.split(";")[1:]:
+        key, _, raw = part.strip().partition("=")
+        if key.lower() == name:
+            return raw.strip().strip('"')
+    return None
+
+
+@dataclass
+class Upload:
+    filename: str
+    content_type: str
+    size: int
+    sha256: str
+
+
+async def read_multipart(body: AsyncIterator[bytes], boundary: str) -> tuple[dict[str, str], dict[str, Upload]]:
+    """Stream a multipart/form-data body: small fields are decoded, file parts only hashed and counted."""
+    delimiter = b"\r\n--" + boundary.encode("latin-1")
+    fields: dict[str, str] = {}
+    uploads: dict[str, Upload] = {}
+    # prefixing CRLF lets the first boundary match the same delimiter as the others
+    buffer = bytearray(b"\r\n")
+    chunks = body.__aiter__()
+    exhausted = False
+
+    async def fill() -> bool:
+        nonlocal exhausted
+        if exhausted:
+            return False
+        try:
+            buffer.extend(await chunks.__anext__())
+            return True
+        except StopAsyncIteration:
+            exhausted = True
+            return False
+
+    while (start := buffer.find(delimiter)) < 0:
+        if not await fill():
+            raise HttpError(400, "multipart boundary not found")
+    del buffer[:start + len(delimiter)]
+    while True:
+        while len(buffer) < 2 and await fill():
+            pass
+        if buffer.startswith(b"--"):
+            break
+        while (end := buffer.find(b"\r\n\r\n")) < 0:
+            if len(buffer) > MAX_HEADER_BYTES or not await fill():
+                raise HttpError(400, "malformed multipart part headers")
+        headers = {}
+        for line in bytes(buffer[:end]).decode("utf-8", "replace").split("\r\n"):
+            name, _, value = line.partition(":")
+            if value:
+                headers[name.strip().lower()] = value.strip()
+        del buffer[:end + 4]
+        disposition = headers.get("content-disposition", "")
+        name = _header_param(disposition, "name") or ""
+        filename = _header_param(disposition, "filename")
+        sha = hashlib.sha256()
+        size = 0
+        value = bytearray()
+        while True:
+            found = buffer.find(delimiter)
+            # keep a tail that could be the start of a delimiter split across reads
+            ready = found if found >= 0 else max(0, len(buffer) - len(delimiter) + 1)
+            data = bytes(buffer[:ready])
+            if filename is None:
+                if len(value) + len(data) > MAX_JSON_BYTES:
+                    raise HttpError(413, f"form field {name!r} is too large")
+                value.extend(data)
+            else:
+                sha.update(data)
+                size += len(data)
+            del buffer[:ready]
+            if found >= 0:
+                del buffer[:len(delimiter)]
+                break
+            if not await fill():
+                raise HttpError(400, "multipart body ended inside a part")
+        if filename is None:
+            fields[name] = value.decode("utf-8", "replace")
+        else:
+            uploads[name] = Upload(filename, headers.get("content-type", ""), size, sha.hexdigest())
+    await _drain(chunks)
+    return fields, uploads
+
+
+# ---------------------------------------------------------------------------
+# Content
+
+
+class Content:
+    """Scenarios and ja -> Cebuano pairs the canned responses are built from."""
+
+    def __init__(self, scenarios_path: Path = SCENARIOS_PATH, seed_path: Path = SEED_PATH):
+        self.scenarios = {entry["id"]: entry for entry in json.loads(scenarios_path.read_text(encoding="utf-8"))}
+        self.scenario_ids = sorted(self.scenarios)
+        self.phrases: dict[str, str] = {}
+        self.lines: list[tuple[str, str]] = []
+        for record in json.loads(seed_path.read_text(encoding="utf-8")):
+            meaning = ((record.get("translations") or {}).get("ja") or {}).get("meaning", "").strip()
+            if meaning:
+                self.phrases.setdefault(meaning, record["native"])
+                self.lines.append((record["native"], meaning))
+
+    def scenario(self, scene_id: str) -> dict:
+        if scene_id in self.scenarios:
+            return self.scenarios[scene_id]
+        return self.scenarios[self.scenario_ids[_digest(scene_id) % len(self.scenario_ids)]]
+
+
+@dataclass
+class RoleplayState:
+    turns: int = 0
+
+
+class StandInBackend:
+    def __init__(
+        self, faults: Faults | None = None, content: Content | None = None, max_roleplays: int = MAX_ROLEPLAYS
+    ):
+        self.faults = faults or Faults()
+        self.content = content or Content()
+        self.random = random.Random(self.faults.seed)
+        self.roleplays: OrderedDict[tuple[str, str], RoleplayState] = OrderedDict()
+        self.max_roleplays = max_roleplays
+        self.stats: Counter = Counter()
+        self.connections: set[asyncio.Task] = set()
+        self.started = time.monotonic()
+        self.routes: dict[tuple[str, str], Callable[[Request], Awaitable[Response]]] = {
+            ("GET", "/"): self.health,
+            ("GET", "/_stats"): self.report,
+            ("POST", "/api/chat/free"): self.chat_free,
+            ("POST", "/api/roleplay/start"): self.roleplay_start,
+            ("POST", "/api/roleplay/chat"): self.roleplay_chat,
+            ("POST", "/api/translate"): self.translate,
+            ("POST", "/api/pronounce/check"): self.pronounce_check,
+        }
+
+    # -- handlers --------------------------------------------------------
+
+    async def health(self, request: Request) -> Response:
+        return Response.json({"status": "ok", "message": "Bisaya Speak AI stand-in is running", "version": VERSION})
+
+    async def report(self, request: Request) -> Response:
+        return Response.json({"uptime_s": round(time.monotonic() - self.started, 3), **self.stats})
+
+    async def chat_free(self, request: Request) -> Response:
+        payload = await request.json()
+        message = str(payload.get("message", ""))
+        if not message.strip():
+            raise HttpError(400, "message is required")
+        native, meaning = self.content.lines[_digest("free", message) % len(self.content.lines)]
+        return Response.json({"reply": native, "translation": meaning})
+
+    @staticmethod
+    def _session(request: Request, payload: dict) -> str:
+        return str(payload.get("session_id") or request.headers.get("x-session-id") or request.client)
+
+    def _roleplay(self, key: tuple[str, str], restart: bool = False) -> RoleplayState:
+        """The conversation for (session, scene), marked most recently used; evicts beyond max_roleplays."""
+        state = RoleplayState() if restart else self.roleplays.get(key) or RoleplayState()
+        self.roleplays[key] = state
+        self.roleplays.move_to_end(key)
+        while len(self.roleplays) > self.max_roleplays:
+            self.roleplays.popitem(last=False)
+            self.stats["roleplays_evicted"] += 1
+        return state
+
+    async def roleplay_start(self, request: Request) -> Response:
+        payload = await request.json()
+        scene_id = str(payload.get("scene_id", ""))
+        if not scene_id:
+            raise HttpError(400, "scene_id is required")
+        scenario = self.content.scenario(scene_id)
+        session = self._session(request, payload)
+        self._roleplay((session, scene_id), restart=True)
+        opening = scenario.get("openingMessage", {})
+        return Response.json({
+            "reply": opening.get("ja", ""),
+            "translation": opening.get("en", ""),
+            "scene_id": scene_id,
+            "session_id": session,
+            "turn_limit": scenario["context"].get("turnLimit"),
+        })
+
+    async def roleplay_chat(self, request: Request) -> Response:
+        payload = await request.json()
+        scene_id = str(payload.get("scene_id", ""))
+        if not scene_id or not str(payload.get("text", "")).strip():
+            raise HttpError(400, "scene_id and text are required")
+        scenario = self.content.scenario(scene_id)
+        state = self._roleplay((self._session(request, payload), scene_id))
+        state.turns += 1
+        turn_limit = scenario["context"].get("turnLimit") or 0
+        finished = bool(turn_limit) and state.turns >= turn_limit
+        # each scenario starts at its own point of the script, then walks it turn by turn
+        line = (_digest("partner", scenario["id"]) + state.turns - 1) % len(PARTNER_LINES)
+        reply, translation = PARTNER_CLOSING if finished else PARTNER_LINES[line]
+        return Response.json({"reply": reply, "translation": translation, "turn": state.turns, "finished": finished})
+
+    async def translate(self, request: Request) -> Response:
+        payload = await request.json()
+        text = str(payload.get("text", ""))
+        if not text.strip():
+            raise HttpError(400, "text is required")
+        target = str(payload.get("target", "ceb"))
+        translated = self.content.phrases.get(text.strip()) if target == "ceb" else None
+        translated = translated or f"[{target}] {text}"
+        return Response.json({"translated": translated, "visayan": translated, "source": payload.get("source")})
+
+    async def pronounce_check(self, request: Request) -> Response:
+        content_type = request.headers.get("content-type", "")
+        boundary = _header_param(content_type, "boundary")
+        if not content_type.lower().startswith("multipart/form-data") or not boundary:
+            raise HttpError(400, "expected multipart/form-data")
+        fields, uploads = await read_multipart(request.body, boundary)
+        audio = uploads.get("audio")
+        word = fields.get("word", "")
+        if audio is None or not word:
+            raise HttpError(400, "audio and word are required")
+        self.stats["upload_bytes"] += audio.size
+        score = 55 + _digest(word, audio.sha256) % 45
+        aspects = [
+            {"aspect": aspect, "score": max(0, min(100, score + offset)), "comment": comment}
+            for aspect, offset, comment in (
+                ("accuracy", 3, "Most sounds were clear."),
+                ("fluency", -4, "Keep a steady pace."),
+                ("stress", 1, "Stress the second syllable."),
+            )
+        ]
+        overall = "Maayo kaayo! Great pronunciation." if score >= 80 else "Maayo! Try once more, slowly."
+        tips = ["Listen to the reference audio once more.", "Open your mouth wider on the vowels."]
+        return Response.json({
+            # ConversationRepository reads these top-level fields ...
+            "score": score,
+            "feedback": overall,
+            "details": {item["aspect"]: item["score"] for item in aspects},
+            # ... PronunciationRepository reads {"status", "data": {...}}
+            "status": "success",
+            "data": {
+                "word": word,
+                "level": fields.get("level", ""),
+                "pronunciation_score": score,
+                "feedback": {"overall": overall, "details": aspects, "tips": tips},
+                "audio_bytes": audio.size,
+            },
+        })
+
+    async def reference_audio(self, word: str) -> Response:
+        if not word.strip():
+            raise HttpError(404, "word is required")
+        return Response(200, reference_clip(word), "audio/wav")
+
+    # -- dispatch --------------------------------------------------------
+
+    def latency(self, path: str) -> float:
+        route = "/api/reference-audio" if path.startswith("/api/reference-audio/") else path
+        base = self.faults.route_latency_ms.get(route, self.faults.latency_ms)
+        jitter = self.random.expovariate(1 / self.faults.jitter_ms) if self.faults.jitter_ms > 0 else 0.0
+        return (base + jitter) / 1000
+
+    async def dispatch(self, request: Request) -> Response | None:
+        """Handle one request; None means the connection is dropped without a response."""
+        self.stats["requests"] += 1
+        handler = self.routes.get((request.method, request.path))
+        if request.method == "GET" and request.path.startswith("/api/reference-audio/"):
+            word = unquote(request.path[len("/api/reference-audio/"):])
+            handler = lambda _request: self.reference_audio(word)  # noqa: E731
+        try:
+            if handler is None:
+                known = {path for _, path in self.routes}
+                raise HttpError(405 if request.path in known else 404, f"no route for {request.method} {request.path}")
+            delay = self.latency(request.path)
+            roll = self.random.random() if request.path not in ("/", "/_stats") else 1.0
+            if roll < self.faults.drop_rate + self.faults.error_rate:
+                # injected faults still consume the upload, but leave roleplay state untouched
+                await _drain(request.body)
+                response = None
+            else:
+                response = await handler(request)
+        except HttpError as exc:
+            if isinstance(exc, FramingError):
+                request.close = True
+            else:
+                await self._drain_request(request)
+            self.stats[f"status_{exc.status}"] += 1
+            return Response.json({"error": str(exc)}, exc.status)
+        if delay:
+            await asyncio.sleep(delay)
+        if roll < self.faults.drop_rate:
+            self.stats["dropped"] += 1
+            return None
+        if response is None:
+            self.stats["status_503"] += 1
+            return Response.json({"error": "injected failure"}, 503)
+        self.stats[f"status_{response.status}"] += 1
+        return response
+
+    # -- connections -----------------------------------------------------
+
+    @staticmethod
+    async def _drain_request(request: Request) -> None:
+        """Consume what the handler left of the body; a framing error means the connection must close."""
+        try:
+            await _drain(request.body)
+        except FramingError:
+            request.close = True
+
+    async def close_connections(self) -> None:
+        """Cancel every connection handler and close its socket."""
+        tasks = list(self.connections)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.stats["connections"] += 1
+        task = asyncio.current_task()
+        self.connections.add(task)
+        peer = writer.get_extra_info("peername")
+        client = str(peer[0]) if peer else ""
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except asyncio.IncompleteReadError:
+                    return  # client closed an idle keep-alive connection
+                except asyncio.LimitOverrunError:
+                    await self._write(writer, Response.json({"error": "headers too large"}, 400), close=True)
+                    return
+                lines = head.decode("latin-1").split("\r\n")
+                try:
+                    method, target, version = lines[0].split(" ", 2)
+                except ValueError:
+                    await self._write(writer, Response.json({"error": "malformed request line"}, 400), close=True)
+                    return
+                headers = {}
+                for line in lines[1:]:
+                    name, _, value = line.partition(":")
+                    if name:
+                        headers[name.strip().lower()] = value.strip()
+                connection = headers.get("connection", "").lower()
+                keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+                if headers.get("expect", "").lower() == "100-continue":
+                    writer.write(b"HTTP/1.1 100 Continue\r\n\r\n")
+                if "chunked" in headers.get("transfer-encoding", "").lower():
+                    body = _chunked_body(reader)
+                else:
+                    length = headers.get("content-length", "0").strip() or "0"
+                    if not (length.isascii() and length.isdigit()):
+                        # without a valid length the next request's start cannot be found
+                        self.stats["status_400"] += 1
+                        await self._write(writer, Response.json({"error": "invalid Content-Length"}, 400), close=True)
+                        return
+                    body = _content_length_body(reader, int(length))
+                request = Request(method.upper(), urlsplit(target).path, headers, body, client=client)
+                response = await self.dispatch(request)
+                if response is None:
+                    writer.transport.abort()
+                    return
+                await self._drain_request(request)  # unread bodies would corrupt the next request
+                if request.close and response.status < 400:
+                    response = Response.json({"error": "malformed request body framing"}, 400)
+                close = request.close or not keep_alive
+                await self._write(writer, response, close=close)
+                if close:
+                    return
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.CancelledError):
+            pass
+        finally:
+            self.connections.discard(task)
+            if not writer.is_closing():
+                writer.close()
+
+    @staticmethod
+    async def _write(writer: asyncio.StreamWriter, response: Response, close: bool = False) -> None:
+        head = (
+            f"HTTP/1.1 {response.status} {REASONS.get(response.status, 'Unknown')}\r\n"
+            f"Content-Type: {response.content_type}\r\n"
+            f"Content-Length: {len(response.body)}\r\n"
+            f"Connection: {'close' if close else 'keep-alive'}\r\n\r\n"
+        )
+        writer.write(head.encode("latin-1") + response.body)
+        await writer.drain()
+
+
+@lru_cache(maxsize=1024)
+def reference_clip(word: str, seconds: float = 0.6) -> bytes:
+    """A deterministic 16 kHz mono WAV: a tone whose pitch is derived from the word."""
+    # a whole number of samples per cycle lets one cycle be repeated instead of computed per sample
+    period = 24 + _digest("audio", word) % 49  # 222-667 Hz
+    frames = int(SAMPLE_RATE * seconds)
+    cycle = [12_000 * math.sin(2 * math.pi * index / period) for index in range(period)]
+    fade = min(SAMPLE_RATE // 50, frames // 2)
+    head = struct.pack(f"<{fade}h", *(int(cycle[index % period] * index / fade) for index in range(fade)))
+    tail = struct.pack(f"<{fade}h", *(
+        int(cycle[(frames - fade + index) % period] * (fade - index) / fade) for index in range(fade)
+    ))
+    whole = struct.pack(f"<{period}h", *(int(value) for value in cycle))
+    middle_start, middle_end = fade, frames - fade
+    repeats = middle_end // period - middle_start // period + 1
+    middle = (whole * repeats)[(middle_start % period) * 2:(middle_start % period + middle_end - middle_start) * 2]
+    samples = head + middle + tail
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as clip:
+        clip.setnchannels(1)
+        clip.setsampwidth(2)
+        clip.setframerate(SAMPLE_RATE)
+        clip.writeframes(bytes(samples))
+    return buffer.getvalue()
+
+
+async def serve(backend: StandInBackend, host: str = "127.0.0.1", port: int = 8000) -> asyncio.base_events.Server:
+    return await asyncio.start_server(backend.handle_connection, host, port, limit=MAX_HEADER_BYTES)
+
+
+class BackgroundServer:
+    """Run the stand-in on its own event loop thread; used by tools that need a local target."""
+
+    def __init__(self, faults: Faults | None = None, host: str = "127.0.0.1", port: int = 0):
+        self.backend = StandInBackend(faults)
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.thread.start()
+        self.server = asyncio.run_coroutine_threadsafe(serve(self.backend, host, port), self.loop).result()
+        bound_host, bound_port = self.server.sockets[0].getsockname()[:2]
+        self.base_url = f"http://{bound_host}:{bound_port}"
+
+    def close(self) -> None:
+        async def shutdown() -> None:
+            self.server.close()
+            # keep-alive clients would otherwise outlive the loop (and block wait_closed on 3.12+)
+            await self.backend.close_connections()
+            await self.server.wait_closed()
+
+        asyncio.run_coroutine_threadsafe(shutdown(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.loop.close()
+
+    def __enter__(self) -> "BackgroundServer":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def _route_latency(value: str) -> tuple[str, float]:
+    route, separator, millis = value.partition("=")
+    if not separator or not route.startswith("/"):
+        raise argparse.ArgumentTypeError("expected ROUTE=MS, e.g. /api/roleplay/chat=800")
+    return route.rstrip("/"), float(millis)
+
+
+async def _run(backend: StandInBackend, host: str, port: int) -> None:
+    server = await serve(backend, host, port)
+    print(f"Stand-in backend listening on http://{host}:{port} ({len(backend.content.scenarios)} scenarios)")
+    async with server:
+        await server.serve_forever()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run a local stand-in for the Bisaya Speak AI backend")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency", type=float, default=0.0, help="base response latency in ms")
+    parser.add_argument("--jitter", type=float, default=0.0, help="mean of the exponential extra latency in ms")
+    parser.add_argument("--route-latency", type=_route_latency, action="append", default=[],
+                        metavar="ROUTE=MS", help="base latency for one route (repeatable)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered with 503")
+    parser.add_argument("--drop-rate", type=float, default=0.0, help="fraction of connections dropped without a response")
+    parser.add_argument("--seed", type=int, default=0, help="seed for latency and fault injection")
+    args = parser.parse_args()
+
+    faults = Faults(
+        latency_ms=args.latency,
+        jitter_ms=args.jitter,
+        route_latency_ms=dict(args.route_latency),
+        error_rate=args.error_rate,
+        drop_rate=args.drop_rate,
+        seed=args.seed,
+    )
+    try:
+        asyncio.run(_run(StandInBackend(faults), args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,342 @@
+"""Backfill missing translations across the content assets in batches.
+
+Every meaning that lacks a target-language translation is collected from the
+seed, learning and practice assets and de-duplicated, so adding a language
+costs one pass over the unique source strings rather than one request per
+record. Strings already in the translation memory are never sent again;
+new results are stored there as each batch finishes, so an interrupted run
+resumes where it stopped.
+
+Translators implement translate_batch(texts, source, target). HttpTranslator
+talks to the backend's POST /api/translate contract (the same one
+ConversationRepository uses); StubTranslator and the --stub server are for
+running the whole pipeline offline.
+
+Usage:
+    python tools/translation_backfill.py --target ko [--source ja] [--apply]
+    python tools/translation_backfill.py --target ko --server http://localhost:8000
+    python tools/translation_backfill.py --target ko --stub
+"""
+from __future__ import annotations
+
+import argparse
+import http.client
+import json
+import random
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Iterable, Protocol
+
+from json_stream import write_json_array
+from translation_memory import ASSET_PATHS, Entry, TranslationMemory, normalize_key
+
+BATCH_SIZE = 20
+CONCURRENCY = 4
+RETRIES = 3
+RETRY_BACKOFF = 0.5  # seconds, doubled after every failed attempt
+RESPONSE_FIELDS = ("visayan", "translated", "translation", "text")
+
+
+class Translator(Protocol):
+    name: str
+
+    def translate_batch(self, texts: list[str], source: str, target: str) -> list[str]: ...
+
+
+class TranslationError(Exception):
+    def __init__(self, message: str, retryable: bool = True):
+        super().__init__(message)
+        self.retryable = retryable
+
+
+def with_retries(call, retries: int = RETRIES):
+    """Run call(), retrying retryable TranslationErrors with jittered exponential backoff."""
+    delay = RETRY_BACKOFF
+    for attempt in range(retries + 1):
+        try:
+            return call()
+        except TranslationError as exc:
+            if not exc.retryable or attempt == retries:
+                raise
+            time.sleep(delay * (1 + random.random()))
+            delay *= 2
+
+
+class PartialBatchError(TranslationError):
+    """Some texts of a batch failed; results keeps the others, with None where a text failed."""
+
+    def __init__(self, results: list[str | None], errors: list[tuple[str, TranslationError]]):
+        super().__init__(f"{len(errors)} of {len(results)} texts failed", retryable=False)
+        self.results = results
+        self.errors = errors
+
+
+class HttpTranslator:
+    """Client for POST {base_url}/api/translate with {text, source, target} bodies."""
+
+    def __init__(
+        self,
+        base_url: str,
+        timeout: float = 30.0,
+        concurrency: int = CONCURRENCY,
+        retries: int = RETRIES,
+    ):
+        self.name = f"http:{base_url}"
+        self.url = base_url.rstrip("/") + "/api/translate"
+        self.timeout = timeout
+        self.retries = retries
+        # one pool for every batch: its size is the limit on in-flight requests
+        self._pool = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="translate")
+
+    def _request(self, text: str, source: str, target: str) -> str:
+        body = json.dumps({"text": text, "source": source, "target": target}).encode("utf-8")
+        request = urllib.request.Request(
+            self.url, data=body, headers={"Content-Type": "application/json; charset=utf-8"}
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                raw = response.read()
+        except urllib.error.HTTPError as exc:
+            retryable = exc.code == 429 or exc.code >= 500
+            raise TranslationError(f"HTTP {exc.code} for {text!r}", retryable) from exc
+        except (OSError, http.client.HTTPException) as exc:
+            # URLError, timeouts, and resets or truncated responses raised by getresponse()/read()
+            raise TranslationError(f"{exc!r} for {text!r}") from exc
+        try:
+            payload = json.loads(raw)
+        except ValueError as exc:
+            raise TranslationError(f"Malformed response for {text!r}: {exc}", retryable=False) from None
+        if not isinstance(payload, dict):
+            raise TranslationError(f"Malformed response for {text!r}: not a JSON object", retryable=False)
+        translated = next(
+            (payload[field] for field in RESPONSE_FIELDS if isinstance(payload.get(field), str) and payload[field]), "",
+        )
+        if not translated.strip():
+            raise TranslationError(f"No translation text returned for {text!r}", retryable=False)
+        return translated.strip()
+
+    def translate(self, text: str, source: str, target: str) -> str:
+        return with_retries(lambda: self._request(text, source, target), self.retries)
+
+    def translate_batch(self, texts: list[str], source: str, target: str) -> list[str]:
+        """Translate each text (the endpoint takes one per request); PartialBatchError keeps the successes."""
+        futures = [self._pool.submit(self.translate, text, source, target) for text in texts]
+        results: list[str | None] = []
+        errors: list[tuple[str, TranslationError]] = []
+        for text, future in zip(texts, futures):
+            try:
+                results.append(future.result())
+            except TranslationError as exc:
+                results.append(None)
+                errors.append((text, exc))
+        if errors:
+            raise PartialBatchError(results, errors)
+        return results
+
+    def close(self) -> None:
+        self._pool.shutdown()
+
+
+class StubTranslator:
+    """Deterministic offline translator: tags the source text with the target language."""
+
+    name = "stub"
+
+    def translate_batch(self, texts: list[str], source: str, target: str) -> list[str]:
+        return [f"[{target}] {text}" for text in texts]
+
+
+def collect_missing(
+    paths: Iterable[Path], source: str, target: str
+) -> dict[str, str]:
+    """Normalized source key -> source text for every meaning lacking a target translation."""
+    missing: dict[str, str] = {}
+    for path in paths:
+        for record in json.loads(path.read_text(encoding="utf-8")):
+            translations = record.get("translations") or {}
+            text = (translations.get(source) or {}).get("meaning", "").strip()
+            if text and not (translations.get(target) or {}).get("meaning", "").strip():
+                missing.setdefault(normalize_key(text), text)
+    return missing
+
+
+def backfill(
+    memory: TranslationMemory,
+    translator: Translator,
+    source: str,
+    target: str,
+    paths: Iterable[Path] = ASSET_PATHS,
+    batch_size: int = BATCH_SIZE,
+    concurrency: int = CONCURRENCY,
+) -> tuple[int, int, list[str]]:
+    """Translate every uncached missing string; return (unique, translated, failures)."""
+    missing = collect_missing(paths, source, target)
+    pending = [text for text in missing.values() if memory.lookup(text, source, target) is None]
+    batches = [pending[i:i + batch_size] for i in range(0, len(pending), batch_size)]
+    translated = 0
+    failures: list[str] = []
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        futures = {
+            pool.submit(translator.translate_batch, batch, source, target): batch
+            for batch in batches
+        }
+        for future in as_completed(futures):
+            batch = futures[future]
+            try:
+                results = future.result()
+                if len(results) != len(batch):
+                    raise TranslationError(f"expected {len(batch)} results, got {len(results)}")
+            except PartialBatchError as exc:
+                # keep the texts that did translate; only the failed ones are retried next run
+                results = exc.results
+                failures.extend(str(error) for _, error in exc.errors)
+            except TranslationError as exc:
+                failures.append(f"{len(batch)} strings: {exc}")
+                continue
+            translated += memory.add_many(
+                Entry(source, text, target, result, origin=f"backfill:{translator.name}")
+                for text, result in zip(batch, results)
+                if result is not None
+            )
+    return len(missing), translated, failures
+
+
+def apply_to_assets(
+    memory: TranslationMemory, source: str, target: str, paths: Iterable[Path] = ASSET_PATHS
+) -> int:
+    """Write cached translations into records that lack the target language; return records changed."""
+    changed = 0
+    for path in paths:
+        raw = path.read_text(encoding="utf-8")
+        records = json.loads(raw)
+        file_changed = 0
+        for record in records:
+            translations = record.get("translations") or {}
+            text = (translations.get(source) or {}).get("meaning", "").strip()
+            if not text or (translations.get(target) or {}).get("meaning", "").strip():
+                continue
+            result = memory.lookup(text, source, target)
+            if result:
+                translations[target] = {"meaning": result}
+                file_changed += 1
+        if file_changed:
+            write_json_array(records, [path], indent=2, trailing_newline=raw.endswith("\n"))
+            print(f"Updated {path.name} ({file_changed} records)")
+            changed += file_changed
+    return changed
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    failure_rate = 0.0
+
+    def do_POST(self) -> None:
+        if self.path != "/api/translate":
+            self.send_error(404)
+            return
+        payload = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+        with self.server.lock:
+            self.server.requests += 1
+            scripted = self.server.script.popleft() if self.server.script else None
+        if scripted == "drop":
+            self.close_connection = True
+            return
+        if scripted == "garbage":
+            self._reply(b"<html>not json</html>")
+            return
+        if scripted is not None:
+            self.send_error(scripted, "scripted failure")
+            return
+        if payload["text"] in self.server.fail_texts:
+            self.send_error(400, "rejected text")
+            return
+        if random.random() < self.failure_rate:
+            self.send_error(503, "stub failure")
+            return
+        text = StubTranslator().translate_batch([payload["text"]], payload["source"], payload["target"])[0]
+        self._reply(json.dumps({"translated": text}, ensure_ascii=False).encode("utf-8"))
+
+    def _reply(self, body: bytes) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+def start_stub_server(
+    failure_rate: float = 0.0, script: Iterable[int | str] = (), fail_texts: Iterable[str] = ()
+) -> ThreadingHTTPServer:
+    """Serve the /api/translate contract on a free localhost port in a background thread.
+
+    The first requests are answered from script: an HTTP status to fail with,
+    "drop" to close the connection without a response, or "garbage" for a 200
+    with a non-JSON body. Texts in fail_texts are always rejected with a 400.
+    server.requests counts the requests received.
+    """
+    handler = type("StubHandler", (_StubHandler,), {"failure_rate": failure_rate})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    server.lock = threading.Lock()
+    server.requests = 0
+    server.script = deque(script)
+    server.fail_texts = frozenset(fail_texts)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Backfill missing translations through a translator")
+    parser.add_argument("--target", required=True, help="language code to fill in, e.g. ko")
+    parser.add_argument("--source", default="ja", help="language to translate from (default: ja)")
+    backend = parser.add_mutually_exclusive_group(required=True)
+    backend.add_argument("--server", help="backend base URL serving /api/translate")
+    backend.add_argument("--stub", action="store_true", help="run against a local stub server")
+    parser.add_argument("--stub-failure-rate", type=float, default=0.0, help="fraction of stub requests that fail")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    parser.add_argument("--concurrency", type=int, default=CONCURRENCY)
+    parser.add_argument("--retries", type=int, default=RETRIES)
+    parser.add_argument("--db", type=Path, help="translation memory path")
+    parser.add_argument("--apply", action="store_true", help="write cached translations into the assets")
+    args = parser.parse_args()
+
+    server = None
+    if args.stub:
+        server = start_stub_server(args.stub_failure_rate)
+        base_url = f"http://127.0.0.1:{server.server_port}"
+    else:
+        base_url = args.server
+    translator = HttpTranslator(base_url, concurrency=args.concurrency, retries=args.retries)
+
+    memory = TranslationMemory(args.db) if args.db else TranslationMemory()
+    with memory:
+        started = time.perf_counter()
+        unique, translated, failures = backfill(
+            memory, translator, args.source, args.target,
+            batch_size=args.batch_size, concurrency=args.concurrency,
+        )
+        elapsed = time.perf_counter() - started
+        print(
+            f"{unique} unique {args.source} strings missing {args.target}; "
+            f"{translated} translated via {translator.name} in {elapsed:.2f}s"
+        )
+        for failure in failures:
+            print(f"  failed: {failure}")
+        if args.apply:
+            print(f"Applied {apply_to_assets(memory, args.source, args.target)} translations")
+    translator.close()
+    if server is not None:
+        server.shutdown()
+    if failures:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Normalized and fuzzy matching over translation memory keys.
+
+Keys are folded before comparison: NFKC (full-width to half-width), case
+folding, removal of parenthetical notes such as （午後）, and removal of
+punctuation and whitespace. A folded key that matches exactly is treated as
+the same source text; otherwise candidates sharing character bigrams with the
+query are ranked by Dice similarity, which keeps lookups well under a
+millisecond for a few thousand keys.
+"""
+from __future__ import annotations
+
+import re
+import unicodedata
+from collections import Counter, defaultdict
+from typing import NamedTuple
+
+# NFKC already maps full-width brackets to ASCII ones
+_PARENTHETICAL = re.compile(r"\([^()]*\)|\[[^\[\]]*\]|【[^【】]*】")
+_PUNCTUATION = re.compile(r"[\s\W_]+")
+NGRAM = 2
+
+
+class Match(NamedTuple):
+    source: str
+    text: str
+    score: float
+
+
+def fold(text: str) -> str:
+    folded = unicodedata.normalize("NFKC", text).casefold()
+    folded = _PARENTHETICAL.sub("", folded)
+    return _PUNCTUATION.sub("", folded)
+
+
+def ngrams(folded: str) -> Counter:
+    if len(folded) < NGRAM:
+        return Counter([folded]) if folded else Counter()
+    return Counter(folded[i:i + NGRAM] for i in range(len(folded) - NGRAM + 1))
+
+
+class FuzzyIndex:
+    """Inverted bigram index from folded source keys to their translations."""
+
+    def __init__(self, table: dict[str, str]):
+        self._exact: dict[str, list[str]] = defaultdict(list)
+        self._grams: list[Counter] = []
+        self._sizes: list[int] = []
+        self._sources: list[str] = []
+        self._postings: dict[str, list[int]] = defaultdict(list)
+        self._table = table
+        for source in table:
+            folded = fold(source)
+            self._exact[folded].append(source)
+            position = len(self._sources)
+            grams = ngrams(folded)
+            self._sources.append(source)
+            self._grams.append(grams)
+            self._sizes.append(sum(grams.values()))
+            for gram in grams:
+                self._postings[gram].append(position)
+
+    def normalized(self, text: str) -> list[Match]:
+        """Entries whose folded key equals the folded query."""
+        return [Match(source, self._table[source], 1.0) for source in self._exact.get(fold(text), ())]
+
+    def nearest(self, text: str, limit: int = 3, min_score: float = 0.5) -> list[Match]:
+        query = ngrams(fold(text))
+        total = sum(query.values())
+        if not total:
+            return []
+        shared: Counter = Counter()
+        for gram, count in query.items():
+            for position in self._postings.get(gram, ()):
+                shared[position] += min(count, self._grams[position][gram])
+        matches = []
+        for position, overlap in shared.items():
+            score = 2 * overlap / (total + self._sizes[position])
+            if score >= min_score:
+                source = self._sources[position]
+                matches.append(Match(source, self._table[source], round(score, 3)))
+        matches.sort(key=lambda match: (-match.score, match.source))
+        return matches[:limit]
+
@@ -0,0 +1,290 @@
+"""SQLite-backed translation memory for seed and content meanings.
+
+Each entry maps (source language, normalized source text, target language) to a
+translation. Variant 0 is the preferred translation; higher variants keep
+alternatives. seed_translation_map.txt (ja=en lines) is imported once and only
+re-read when its hash changes, and can be exported back in the same format.
+
+Usage:
+    python tools/translation_memory.py import-map [--force]
+    python tools/translation_memory.py import-assets
+    python tools/translation_memory.py export-map OUT.txt
+    python tools/translation_memory.py lookup TEXT [--source ja] [--target en]
+    python tools/translation_memory.py stats
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import sqlite3
+import unicodedata
+from pathlib import Path
+from typing import Iterable, NamedTuple
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_DB_PATH = REPO_ROOT / ".content_build" / "translation_memory.sqlite"
+TRANSLATION_MAP_PATH = REPO_ROOT / "seed_translation_map.txt"
+ASSETS_DIR = REPO_ROOT / "app" / "src" / "main" / "assets"
+ASSET_PATHS = (
+    ASSETS_DIR / "listening_seed.json",
+    ASSETS_DIR / "content" / "listening_seed_v2.json",
+    ASSETS_DIR / "content" / "learning_content_v1.json",
+    ASSETS_DIR / "content" / "practice_items_v1.json",
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS translations (
+    source_lang TEXT NOT NULL,
+    source_key TEXT NOT NULL,
+    target_lang TEXT NOT NULL,
+    variant INTEGER NOT NULL DEFAULT 0,
+    source_text TEXT NOT NULL,
+    text TEXT NOT NULL,
+    origin TEXT NOT NULL,
+    PRIMARY KEY (source_lang, source_key, target_lang, variant)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+) WITHOUT ROWID;
+"""
+
+
+class Entry(NamedTuple):
+    source_lang: str
+    source_text: str
+    target_lang: str
+    text: str
+    origin: str
+    variant: int = 0
+
+
+def normalize_key(text: str) -> str:
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+def parse_map_lines(lines: Iterable[str]) -> Iterable[tuple[str, str]]:
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if "=" not in line:
+            raise ValueError(f"Invalid mapping line: {line}")
+        source, target = line.split("=", 1)
+        yield source.strip(), target.strip()
+
+
+class TranslationMemory:
+    def __init__(self, path: Path = DEFAULT_DB_PATH):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def __enter__(self) -> TranslationMemory:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def lookup(self, text: str, source_lang: str = "ja", target_lang: str = "en") -> str | None:
+        row = self.connection.execute(
+            "SELECT text FROM translations"
+            " WHERE source_lang = ? AND source_key = ? AND target_lang = ? AND variant = 0",
+            (source_lang, normalize_key(text), target_lang),
+        ).fetchone()
+        return row[0] if row else None
+
+    def variants(self, text: str, source_lang: str = "ja", target_lang: str = "en") -> list[str]:
+        rows = self.connection.execute(
+            "SELECT text FROM translations"
+            " WHERE source_lang = ? AND source_key = ? AND target_lang = ? ORDER BY variant",
+            (source_lang, normalize_key(text), target_lang),
+        )
+        return [row[0] for row in rows]
+
+    def table(self, source_lang: str = "ja", target_lang: str = "en") -> dict[str, str]:
+        """Preferred translations for one language pair, keyed by normalized source."""
+        rows = self.connection.execute(
+            "SELECT source_key, text FROM translations"
+            " WHERE source_lang = ? AND target_lang = ? AND variant = 0",
+            (source_lang, target_lang),
+        )
+        return dict(rows)
+
+    def upsert_many(self, entries: Iterable[Entry]) -> int:
+        rows = [
+            (
+                entry.source_lang,
+                normalize_key(entry.source_text),
+                entry.target_lang,
+                entry.variant,
+                entry.source_text,
+                entry.text,
+                entry.origin,
+            )
+            for entry in entries
+        ]
+        with self.connection:
+            self.connection.executemany(
+                "INSERT INTO translations"
+                " (source_lang, source_key, target_lang, variant, source_text, text, origin)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)"
+                " ON CONFLICT (source_lang, source_key, target_lang, variant)"
+                " DO UPDATE SET source_text = excluded.source_text, text = excluded.text,"
+                " origin = excluded.origin",
+                rows,
+            )
+        return len(rows)
+
+    def add_many(self, entries: Iterable[Entry]) -> int:
+        """Insert translations not yet known for their key, as the next variant; returns the count added."""
+        added = 0
+        with self.connection:
+            for entry in entries:
+                key = (entry.source_lang, normalize_key(entry.source_text), entry.target_lang)
+                known = self.connection.execute(
+                    "SELECT variant, text FROM translations"
+                    " WHERE source_lang = ? AND source_key = ? AND target_lang = ?",
+                    key,
+                ).fetchall()
+                if any(text == entry.text for _, text in known):
+                    continue
+                variant = max((row[0] for row in known), default=-1) + 1
+                self.connection.execute(
+                    "INSERT INTO translations"
+                    " (source_lang, source_key, target_lang, variant, source_text, text, origin)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (*key, variant, entry.source_text, entry.text, entry.origin),
+                )
+                added += 1
+        return added
+
+    def _meta(self, key: str) -> str | None:
+        row = self.connection.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: str) -> None:
+        with self.connection:
+            self.connection.execute(
+                "INSERT INTO meta (key, value) VALUES (?, ?)"
+                " ON CONFLICT (key) DO UPDATE SET value = excluded.value",
+                (key, value),
+            )
+
+    def import_map(
+        self,
+        path: Path = TRANSLATION_MAP_PATH,
+        source_lang: str = "ja",
+        target_lang: str = "en",
+        force: bool = False,
+    ) -> int | None:
+        """Import a source=target text map; returns None when it is unchanged since the last import.
+
+        Entries an earlier import of the same map added, but which the map no longer lists, are removed.
+        """
+        raw = path.read_bytes()
+        digest = hashlib.sha256(raw).hexdigest()
+        meta_key = f"map:{path.name}:{source_lang}:{target_lang}"
+        if not force and self._meta(meta_key) == digest:
+            return None
+        entries = [
+            Entry(source_lang, source, target_lang, target, origin=path.name)
+            for source, target in parse_map_lines(raw.decode("utf-8").splitlines())
+        ]
+        listed = {normalize_key(entry.source_text) for entry in entries}
+        with self.connection:
+            stale = [
+                (source_lang, key, target_lang, path.name)
+                for (key,) in self.connection.execute(
+                    "SELECT source_key FROM translations WHERE source_lang = ? AND target_lang = ? AND origin = ?",
+                    (source_lang, target_lang, path.name),
+                )
+                if key not in listed
+            ]
+            self.connection.executemany(
+                "DELETE FROM translations"
+                " WHERE source_lang = ? AND source_key = ? AND target_lang = ? AND origin = ?",
+                stale,
+            )
+            count = self.upsert_many(entries)
+        self._set_meta(meta_key, digest)
+        return count
+
+    def export_map(self, path: Path, source_lang: str = "ja", target_lang: str = "en") -> int:
+        rows = self.connection.execute(
+            "SELECT source_text, text FROM translations"
+            " WHERE source_lang = ? AND target_lang = ? AND variant = 0 ORDER BY source_key",
+            (source_lang, target_lang),
+        ).fetchall()
+        path.write_text("".join(f"{source}={text}\n" for source, text in rows), encoding="utf-8")
+        return len(rows)
+
+    def import_assets(self, paths: Iterable[Path] = ASSET_PATHS) -> int:
+        """Add every Cebuano -> meaning and ja -> other-language pair found in the assets.
+
+        Existing translations are kept; a differing meaning becomes another variant.
+        """
+        entries = []
+        for path in paths:
+            for record in json.loads(path.read_text(encoding="utf-8")):
+                source = record.get("native") or record.get("ceb")
+                meanings = {
+                    lang: value.get("meaning", "").strip()
+                    for lang, value in (record.get("translations") or {}).items()
+                }
+                meanings = {lang: meaning for lang, meaning in meanings.items() if meaning}
+                for lang, meaning in meanings.items():
+                    if source:
+                        entries.append(Entry("ceb", source, lang, meaning, origin=path.name))
+                    if lang != "ja" and "ja" in meanings:
+                        entries.append(Entry("ja", meanings["ja"], lang, meaning, origin=path.name))
+        return self.add_many(entries)
+
+    def stats(self) -> list[tuple[str, str, int]]:
+        return self.connection.execute(
+            "SELECT source_lang, target_lang, COUNT(*) FROM translations"
+            " GROUP BY source_lang, target_lang ORDER BY source_lang, target_lang"
+        ).fetchall()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Translation memory maintenance")
+    parser.add_argument("--db", type=Path, default=DEFAULT_DB_PATH)
+    commands = parser.add_subparsers(dest="command", required=True)
+    import_parser = commands.add_parser("import-map", help="import seed_translation_map.txt")
+    import_parser.add_argument("--map", type=Path, default=TRANSLATION_MAP_PATH)
+    import_parser.add_argument("--force", action="store_true", help="re-import even if unchanged")
+    commands.add_parser("import-assets", help="import meanings from the content assets")
+    export_parser = commands.add_parser("export-map", help="export ja=en lines")
+    export_parser.add_argument("out", type=Path)
+    lookup_parser = commands.add_parser("lookup", help="look up one source text")
+    lookup_parser.add_argument("text")
+    lookup_parser.add_argument("--source", default="ja")
+    lookup_parser.add_argument("--target", default="en")
+    commands.add_parser("stats", help="count entries per language pair")
+    args = parser.parse_args()
+
+    with TranslationMemory(args.db) as memory:
+        if args.command == "import-map":
+            count = memory.import_map(args.map, force=args.force)
+            print("Map unchanged; nothing imported" if count is None else f"Imported {count} entries")
+        elif args.command == "import-assets":
+            print(f"Added {memory.import_assets()} entries")
+        elif args.command == "export-map":
+            print(f"Exported {memory.export_map(args.out)} entries to {args.out}")
+        elif args.command == "lookup":
+            translation = memory.lookup(args.text, args.source, args.target)
+            if translation is None:
+                raise SystemExit(f"No {args.target} translation for {args.text!r}")
+            print(translation)
+        else:
+            for source_lang, target_lang, count in memory.stats():
+                print(f"{source_lang} -> {target_lang}: {count}")
+
+
+if __name__ == "__main__":
+    main()
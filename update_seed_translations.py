@@ -1,53 +1,81 @@
+import argparse
 import json
 from pathlib import Path
 
-MAPPING_PATH = Path(r"d:/Bisaya_Rescue/seed_translation_map.txt")
+from tools.json_stream import write_json_array
+from tools.translation_match import FuzzyIndex
+from tools.translation_memory import TRANSLATION_MAP_PATH, TranslationMemory
+
+REPO_ROOT = Path(__file__).resolve().parent
 SEED_FILES = [
-    Path(r"d:/Bisaya_Rescue/app/src/main/assets/listening_seed.json"),
-    Path(r"d:/Bisaya_Rescue/app/src/main/assets/content/listening_seed_v2.json")
+    REPO_ROOT / "app/src/main/assets/listening_seed.json",
+    REPO_ROOT / "app/src/main/assets/content/listening_seed_v2.json"
 ]
+REVIEW_PATH = REPO_ROOT / ".content_build" / "translation_review.json"
 
 
-def load_mapping():
-    mapping = {}
-    for line in MAPPING_PATH.read_text(encoding="utf-8").splitlines():
-        line = line.strip()
-        if not line or line.startswith("#"):
-            continue
-        if "=" not in line:
-            raise ValueError(f"Invalid mapping line: {line}")
-        ja, en = line.split("=", 1)
-        mapping[ja.strip()] = en.strip()
-    return mapping
+def resolve(ja: str, memory: TranslationMemory, index: FuzzyIndex):
+    """Return (english, how, suggestions); english is None when the entry needs review."""
+    en = memory.lookup(ja, "ja", "en")
+    if en:
+        return en, "exact", []
+    normalized = index.normalized(ja)
+    if len({match.text for match in normalized}) == 1:
+        return normalized[0].text, "normalized", normalized
+    return None, "review", normalized or index.nearest(ja)
 
 
-def process_file(path: Path, mapping):
+def process_file(path: Path, memory: TranslationMemory, index: FuzzyIndex, review: list):
     data = json.loads(path.read_text(encoding="utf-8"))
-    missing = []
+    changed = 0
     for entry in data:
+        if "translation" not in entry and entry.get("translations"):
+            continue
         ja = entry.get("translation", "").strip()
+        item = {"file": path.name, "id": entry.get("id"), "ja": ja}
         if not ja:
-            missing.append(f"ID {entry.get('id')}: missing Japanese translation")
+            review.append({**item, "reason": "missing Japanese translation", "suggestions": []})
             continue
-        en = mapping.get(ja)
-        if not en:
-            missing.append(f"ID {entry.get('id')}: '{ja}' not found in mapping")
+        en, how, suggestions = resolve(ja, memory, index)
+        if en is None:
+            review.append({
+                **item,
+                "reason": "not found in mapping",
+                "suggestions": [match._asdict() for match in suggestions],
+            })
             continue
+        if how == "normalized":
+            review.append({**item, "reason": f"matched '{suggestions[0].source}' after normalization",
+                           "applied": en, "suggestions": []})
         entry["translations"] = {
             "ja": {"meaning": ja},
             "en": {"meaning": en}
         }
         entry.pop("translation", None)
-    if missing:
-        raise ValueError("Missing translations:\n" + "\n".join(missing))
-    path.write_text(json.dumps(data, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
-    print(f"Updated {path}")
+        changed += 1
+    if changed:
+        write_json_array(data, [path], indent=2, trailing_newline=True)
+        print(f"Updated {path} ({changed} entries)")
+    else:
+        print(f"No changes: {path}")
 
 
 def main():
-    mapping = load_mapping()
-    for path in SEED_FILES:
-        process_file(path, mapping)
+    parser = argparse.ArgumentParser(description="Merge English meanings into the listening seeds")
+    parser.add_argument("--review", type=Path, default=REVIEW_PATH, help="where to write the review report")
+    args = parser.parse_args()
+
+    review = []
+    with TranslationMemory() as memory:
+        memory.import_map(TRANSLATION_MAP_PATH)
+        index = FuzzyIndex(memory.table("ja", "en"))
+        for path in SEED_FILES:
+            process_file(path, memory, index, review)
+
+    args.review.parent.mkdir(parents=True, exist_ok=True)
+    args.review.write_text(json.dumps(review, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    unresolved = sum(1 for item in review if "applied" not in item)
+    print(f"Review: {len(review) - unresolved} normalized matches, {unresolved} unresolved -> {args.review}")
 
 
 if __name__ == "__main__":